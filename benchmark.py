@@ -0,0 +1,250 @@
+#!/usr/bin/env python
+
+import argparse
+import random
+import re
+import sys
+import tempfile
+import time
+import tracemalloc
+import uuid
+
+sys.path.insert(0, 'src/main/python')
+
+words = ['the', 'quick', 'brown', 'fox', 'jumped', 'over', 'lazy', 'dog', 'extraordinary', 'circumstances',
+         'Mr.', 'Anderson', "didn't", 'know', 'what', 'to', 'say', '—', 'however,', '(quietly)', '"Hello,"']
+
+
+def generate_blocks(n: int, seed: int = 42):
+    rnd = random.Random(seed)
+    blocks = []
+    for _ in range(n):
+        sentences = []
+        for _ in range(rnd.randint(1, 5)):
+            sentence = ' '.join(rnd.choice(words) for _ in range(rnd.randint(4, 20)))
+            sentences.append(sentence[0].upper() + sentence[1:] + rnd.choice(['.', '!', '?', '...']))
+        blocks.append(' '.join(sentences))
+    return blocks
+
+
+def legacy_statistics(block: str):
+    import nltk
+    from textstat import textstat
+
+    text = re.sub(r'[,:;()\-–—]', ' ', block)
+    text = re.sub(r'["\'“”«»‹›„‟’❝❞❮❯⹂〝〞〟＂‚‘‛❛❜❟]', '', text)
+    text = re.sub(r'[\.!?]', '.', text)
+    text = re.sub(r'^\s+', '', text)
+    text = re.sub(r'[ ]*(\n|\r\n|\r)[ ]*', ' ', text)
+    text = re.sub(r'([\.])[\. ]+', '.', text)
+    text = re.sub(r'[ ]*([\.])', '. ', text)
+    text = re.sub(r'\s+', ' ', text)
+    text = re.sub(r'\s+$', '', text)
+    text = re.sub(r'\.(?! )', '. ', text)
+    text = re.sub(r'\,(?! )', ', ', text)
+    text = re.sub(r' +', ' ', text)
+    wc = textstat.lexicon_count(re.sub(r'—', ' ', block))
+    sentences = len(nltk.text.sent_tokenize(text))
+    syllables = textstat.syllable_count(text)
+    return wc, sentences, syllables
+
+
+def bench_text(args):
+    from plotlyst.core.text import text_statistics
+
+    blocks = generate_blocks(args.blocks)
+
+    start = time.perf_counter()
+    for _ in range(args.repeat):
+        for block in blocks:
+            legacy_statistics(block)
+    legacy = time.perf_counter() - start
+
+    text_statistics.cache_clear()
+    start = time.perf_counter()
+    for block in blocks:
+        text_statistics(block)
+    cold = time.perf_counter() - start
+
+    start = time.perf_counter()
+    for _ in range(args.repeat):
+        for block in blocks:
+            text_statistics(block)
+    warm = time.perf_counter() - start
+
+    print(f'{args.blocks} blocks, {args.repeat} repetitions')
+    print(f'legacy:        {legacy:.3f}s')
+    print(f'engine (cold): {cold * args.repeat:.3f}s ({legacy / (cold * args.repeat):.1f}x)')
+    print(f'engine (warm): {warm:.3f}s ({legacy / warm:.1f}x)')
+
+
+def generate_novel(scenes: int, characters: int, seed: int = 42):
+    from plotlyst.core.domain import Novel, Character, Scene, Plot, ScenePlotReference, ScenePlotReferenceData, \
+        SceneStructureAgenda, ConflictReference, Conflict, ConflictType, TagReference, SceneStoryBeat, Document, \
+        DocumentStatistics, DocumentProgress
+
+    rnd = random.Random(seed)
+    novel = Novel.new_novel('Benchmark')
+    novel.characters = [Character(f'Character {i}') for i in range(characters)]
+    novel.plots = [Plot(f'Plot {i}') for i in range(10)]
+    novel.conflicts = [Conflict(f'Conflict {i}', ConflictType.CHARACTER, character_id=rnd.choice(novel.characters).id)
+                       for i in range(20)]
+    structure = novel.active_story_structure
+    tags = [uuid.uuid4() for _ in range(30)]
+    for i in range(scenes):
+        scene = Scene(f'Scene {i}', synopsis=' '.join(generate_blocks(1, seed + i)))
+        scene.pov = rnd.choice(novel.characters)
+        scene.characters = rnd.sample(novel.characters, min(5, characters))
+        agenda = SceneStructureAgenda(character_id=scene.pov.id)
+        agenda.conflict_references = [ConflictReference(x.id) for x in rnd.sample(novel.conflicts, 2)]
+        scene.agendas = [agenda]
+        scene.plot_values = [ScenePlotReference(x, ScenePlotReferenceData()) for x in rnd.sample(novel.plots, 3)]
+        scene.tag_references = [TagReference(rnd.choice(tags))]
+        scene.beats = [SceneStoryBeat.of(structure, rnd.choice(structure.beats))]
+        scene.manuscript = Document('', scene_id=scene.id,
+                                    statistics=DocumentStatistics(rnd.randint(500, 3000), {
+                                        f'2024-01-{d:02}': DocumentProgress(rnd.randint(0, 500)) for d in
+                                        range(1, 8)}))
+        novel.scenes.append(scene)
+    return novel
+
+
+def bench_memory(args):
+    tracemalloc.start()
+    start = time.perf_counter()
+    novel = generate_novel(args.scenes, args.characters)
+    elapsed = time.perf_counter() - start
+    current, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    print(f'{args.scenes} scenes, {args.characters} characters')
+    print(f'generate: {elapsed:.3f}s, current {current / 1024 / 1024:.1f} MiB, peak {peak / 1024 / 1024:.1f} MiB')
+
+    from plotlyst.core.client import json_client
+
+    with tempfile.TemporaryDirectory() as workspace:
+        json_client.init(workspace)
+        json_client.insert_novel(novel)
+        for character in novel.characters:
+            json_client.insert_character(novel, character)
+        for scene in novel.scenes:
+            json_client.insert_scene(novel, scene)
+        del novel
+
+        tracemalloc.start()
+        start = time.perf_counter()
+        novel = json_client.fetch_novel(json_client.novels()[0].id)
+        elapsed = time.perf_counter() - start
+        current, peak = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+        print(f'fetch:    {elapsed:.3f}s, current {current / 1024 / 1024:.1f} MiB, peak {peak / 1024 / 1024:.1f} MiB')
+
+        start = time.perf_counter()
+        for _ in range(args.repeat):
+            scenes = set(novel.scenes)
+            for scene in novel.scenes:
+                assert scene in scenes
+        print(f'hashing:  {time.perf_counter() - start:.3f}s ({args.repeat} x {len(novel.scenes)} lookups)')
+
+
+def bench_styles(args):
+    from PyQt6.QtWidgets import QApplication, QFrame, QLabel, QToolButton, QVBoxLayout, QHBoxLayout, QWidget, \
+        QGridLayout
+
+    from plotlyst.view.style.base import apply_property
+    from plotlyst.view.stylesheet import APP_STYLESHEET
+
+    app = QApplication.instance() or QApplication(sys.argv)
+    app.setStyleSheet(APP_STYLESHEET)
+
+    class Card(QFrame):  # matched by the Card rules of the application stylesheet
+        def __init__(self, legacy: bool):
+            super().__init__()
+            self.legacy = legacy
+            layout = QVBoxLayout(self)
+            layout.addWidget(QLabel('Scene title'))
+            layout.addWidget(QLabel(' '.join(generate_blocks(1))))
+            buttons = QWidget()
+            QHBoxLayout(buttons)
+            for _ in range(3):
+                buttons.layout().addWidget(QToolButton())
+            layout.addWidget(buttons)
+            self.restyle()
+
+        def restyle(self, selected: bool = False):
+            if self.legacy:
+                self.setStyleSheet(f'''
+                   Card {{
+                       border: {4 if selected else 2}px solid {'#4B0763' if selected else 'lightgrey'};
+                       border-radius: 15px;
+                       background-color: {'#dec3c3' if selected else '#f3e8e8'};
+                   }}''')
+            else:
+                apply_property(self, 'card', True)
+                apply_property(self, 'selected', selected)
+
+    def run(legacy: bool):
+        grid = QWidget()
+        layout = QGridLayout(grid)
+        start = time.perf_counter()
+        cards = []
+        for i in range(args.cards):
+            card = Card(legacy)
+            layout.addWidget(card, i // 20, i % 20)
+            cards.append(card)
+        grid.show()
+        app.processEvents()
+        construction = time.perf_counter() - start
+
+        start = time.perf_counter()
+        for _ in range(args.repeat):
+            for card in cards:
+                card.restyle(selected=True)
+            for card in cards:
+                card.restyle()
+            app.processEvents()
+        restyling = time.perf_counter() - start
+
+        grid.close()
+        grid.deleteLater()
+        app.processEvents()
+        return construction, restyling
+
+    run(legacy=False)  # warm up the application stylesheet and the font caches
+    legacy = run(legacy=True)
+    properties = run(legacy=False)
+    print(f'{args.cards} cards, {args.repeat} selection toggles')
+    print(f'widget stylesheets:  construction {legacy[0]:.3f}s, restyling {legacy[1]:.3f}s')
+    print(f'dynamic properties:  construction {properties[0]:.3f}s ({legacy[0] / properties[0]:.1f}x), '
+          f'restyling {properties[1]:.3f}s ({legacy[1] / properties[1]:.1f}x)')
+
+
+def parse_args():
+    parser = argparse.ArgumentParser(description='Micro-benchmarks for Plotlyst internals')
+    subparsers = parser.add_subparsers(dest='benchmark', required=True)
+
+    text = subparsers.add_parser('text', help='Text statistics engine versus textstat and nltk')
+    text.add_argument('--blocks', type=int, default=2000)
+    text.add_argument('--repeat', type=int, default=3)
+    text.set_defaults(func=bench_text)
+
+    memory = subparsers.add_parser('memory', help='Memory footprint of a generated large novel')
+    memory.add_argument('--scenes', type=int, default=5000)
+    memory.add_argument('--characters', type=int, default=200)
+    memory.add_argument('--repeat', type=int, default=100)
+    memory.set_defaults(func=bench_memory)
+
+    styles = subparsers.add_parser('styles', help='Card grid styled by widget stylesheets versus dynamic properties')
+    styles.add_argument('--cards', type=int, default=1000)
+    styles.add_argument('--repeat', type=int, default=3)
+    styles.set_defaults(func=bench_styles)
+
+    return parser.parse_args()
+
+
+def main():
+    args = parse_args()
+    args.func(args)
+
+
+if __name__ == '__main__':
+    main()
@@ -33,9 +33,10 @@ try:
     from plotlyst.env import AppMode, app_env
     from plotlyst.resources import resource_registry, resource_manager
     from plotlyst.settings import settings
-    from plotlyst.service.persistence import flush_or_fail
+    from plotlyst.service.persistence import flush_or_fail, recover_unsaved_changes
     from plotlyst.service.dir import select_new_project_directory, default_directory
     from plotlyst.service.log import setup_logging
+    from plotlyst.service.diagnostics import latency_monitor
 
     from PyQt6.QtGui import QFont, QIcon, QPixmap
     from PyQt6.QtWidgets import QApplication, QMessageBox, QSplashScreen
@@ -45,6 +46,7 @@ try:
 
     from plotlyst.core.client import json_client
     from plotlyst.event.handler import handle_exception
+    from plotlyst.view.icons import avatars
     from plotlyst.view.main_window import MainWindow
     from plotlyst.view.stylesheet import APP_STYLESHEET
 except Exception as ex:
@@ -93,6 +95,11 @@ if __name__ == '__main__':
     settings.init_org()
     if args.clear:
         settings.clear()
+    if settings.diagnostics_enabled() or os.getenv('PLOTLYST_DIAGNOSTICS'):
+        latency_monitor.set_enabled(True)
+        logging.info('Diagnostics mode is enabled')
+    avatars.set_budget(settings.avatar_cache_limit() * 1024 * 1024)
+    latency_monitor.add_report_section('avatars', lambda: avatars.stats().to_dict())
     resource_registry.set_up(appctxt)
     resource_manager.init()
 
@@ -115,6 +122,7 @@ if __name__ == '__main__':
     except Exception as ex:
         QMessageBox.critical(None, 'Could not initialize database', traceback.format_exc())
         raise ex
+    recover_unsaved_changes()
     splash_pixmap = QPixmap(resource_registry.banner)
     splash = QSplashScreen(splash_pixmap)
     splash.show()
@@ -0,0 +1,427 @@
+"""
+Plotlyst
+Copyright (C) 2021-2024  Zsolt Kovari
+
+This file is part of Plotlyst.
+
+Plotlyst is free software: you can redistribute it and/or modify
+it under the terms of the GNU General Public License as published by
+the Free Software Foundation, either version 3 of the License, or
+(at your option) any later version.
+
+Plotlyst is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+GNU General Public License for more details.
+
+You should have received a copy of the GNU General Public License
+along with this program.  If not, see <https://www.gnu.org/licenses/>.
+"""
+import argparse
+import json
+import logging
+import os
+import sys
+import uuid
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from dataclasses import dataclass
+from html.parser import HTMLParser
+from pathlib import Path
+from typing import List, Optional, Dict, Tuple
+
+from PyQt6.QtGui import QGuiApplication
+from slugify import slugify
+
+from plotlyst.core.client import json_client, FileChange
+from plotlyst.core.domain import Novel, NovelDescriptor, Scene, DocumentStatistics
+from plotlyst.core.text import wc
+from plotlyst.env import app_env
+from plotlyst.event.core import Severity
+from plotlyst.service.history import take_snapshot, list_snapshots, snapshot_store, restore_scene, \
+    restore_document
+from plotlyst.service.image_cleanup import remove_orphan_images
+from plotlyst.service.manuscript_text import prepare_content_for_convert
+from plotlyst.service.migration import migrate_novel
+
+manuscript_docx_template = Path(__file__).parent.joinpath('resources', 'images', 'manuscript-template.docx')
+
+
+@dataclass
+class WorkspaceIssue:
+    novel: str
+    severity: Severity
+    message: str
+    repaired: bool = False
+
+    def __str__(self):
+        repaired = ' (repaired)' if self.repaired else ''
+        return f'[{self.severity.value}] {self.novel}: {self.message}{repaired}'
+
+
+class _HtmlTextExtractor(HTMLParser):
+    block_tags = {'p', 'div', 'br', 'li', 'h1', 'h2', 'h3', 'h4', 'h5', 'h6', 'tr', 'blockquote'}
+    ignored_tags = {'head', 'style', 'script'}
+
+    def __init__(self):
+        super().__init__()
+        self._parts: List[str] = []
+        self._ignored: int = 0
+
+    def handle_starttag(self, tag, attrs):
+        if tag in self.ignored_tags:
+            self._ignored += 1
+        elif tag in self.block_tags:
+            self._parts.append('\n')
+
+    def handle_endtag(self, tag):
+        if tag in self.ignored_tags:
+            self._ignored = max(0, self._ignored - 1)
+
+    def handle_data(self, data):
+        if not self._ignored:
+            self._parts.append(data)
+
+    def text(self) -> str:
+        return ''.join(self._parts).strip()
+
+
+def html_to_text(html: str) -> str:
+    parser = _HtmlTextExtractor()
+    parser.feed(html)
+    parser.close()
+    return parser.text()
+
+
+def init_workspace(workspace: str):
+    if not os.path.exists(os.path.join(workspace, 'project.plotlyst')):
+        raise IOError(f'Not a Plotlyst workspace: {workspace}')
+    json_client.init(workspace)
+
+
+def select_novels(ids: Optional[List[str]] = None) -> List[NovelDescriptor]:
+    novels = json_client.novels()
+    if ids:
+        novels = [x for x in novels if str(x.id) in ids or x.title in ids]
+    return novels
+
+
+def fetch_novel(descriptor: NovelDescriptor) -> Novel:
+    novel = json_client.fetch_novel(descriptor.id)
+    app_env.novel = novel
+    return novel
+
+
+def validate_workspace(novels: List[NovelDescriptor], repair: bool = False) -> List[WorkspaceIssue]:
+    issues: List[WorkspaceIssue] = []
+    for descriptor in novels:
+        issues.extend(validate_novel(descriptor, repair))
+
+    return issues
+
+
+def validate_novel(descriptor: NovelDescriptor, repair: bool = False) -> List[WorkspaceIssue]:
+    issues: List[WorkspaceIssue] = []
+    title = descriptor.title or str(descriptor.id)
+    novel_path = json_client.novels_dir.joinpath(f'{descriptor.id}.json')
+    if not novel_path.exists():
+        issue = WorkspaceIssue(title, Severity.ERROR, f'Missing novel file {novel_path.name}')
+        if repair:
+            json_client.delete_novel(descriptor)
+            issue.repaired = True
+        issues.append(issue)
+        return issues
+
+    try:
+        with open(novel_path, encoding='utf8') as json_file:
+            novel_data: Dict = json.load(json_file)
+        novel = fetch_novel(descriptor)
+    except Exception as ex:
+        issues.append(WorkspaceIssue(title, Severity.ERROR, f'Could not be loaded: {ex}'))
+        return issues
+
+    dangling = False
+    for kind, dir_, loaded in [('scene', json_client.scenes_dir(novel), novel.scenes),
+                               ('character', json_client.characters_dir(novel), novel.characters)]:
+        referenced = set(novel_data.get(f'{kind}s', []))
+        loaded_ids = {str(x.id) for x in loaded}
+        for ref in sorted(referenced - loaded_ids):
+            issues.append(WorkspaceIssue(title, Severity.WARNING, f'Missing {kind} file {ref}.json',
+                                         repaired=repair))
+            dangling = True
+        for path in sorted(dir_.glob('*.json')):
+            if path.stem not in referenced:
+                issues.append(WorkspaceIssue(title, Severity.WARNING, f'Orphaned {kind} file {path.name}'))
+
+    if dangling and repair:
+        json_client.update_novel(novel)
+
+    return issues
+
+
+def novel_statistics(descriptor: NovelDescriptor) -> Dict:
+    novel = fetch_novel(descriptor)
+    scene_wc = [scene.manuscript.statistics.wc for scene in novel.scenes if
+                scene.manuscript and scene.manuscript.statistics]
+    daily: Dict[str, Dict[str, int]] = {}
+    for date, progress in sorted(novel.manuscript_progress.items()):
+        daily[date] = {'added': progress.added, 'removed': progress.removed}
+
+    return {
+        'id': str(novel.id),
+        'title': novel.title,
+        'chapters': len(novel.chapters),
+        'scenes': len(novel.scenes),
+        'characters': len(novel.characters),
+        'wc': sum(scene_wc),
+        'progress': daily,
+    }
+
+
+def rebuild_statistics(descriptor: NovelDescriptor) -> int:
+    novel = fetch_novel(descriptor)
+    json_client.load_manuscript(novel)
+    updated = 0
+    for scene in novel.scenes:
+        if not scene.manuscript:
+            continue
+        count = wc(html_to_text(scene.manuscript.content))
+        if scene.manuscript.statistics is None or scene.manuscript.statistics.wc != count:
+            if scene.manuscript.statistics is None:
+                scene.manuscript.statistics = DocumentStatistics()
+            scene.manuscript.statistics.wc = count
+            json_client.update_scene(scene)
+            updated += 1
+
+    return updated
+
+
+def export_manuscript(descriptor: NovelDescriptor, target: str, fmt: str):
+    import pypandoc
+
+    novel = fetch_novel(descriptor)
+    json_client.load_manuscript(novel)
+
+    html = ''
+    for i, chapter in enumerate(novel.chapters):
+        html += f'<div custom-style="Title">Chapter {i + 1}</div>' if fmt == 'docx' else f'<h1>Chapter {i + 1}</h1>'
+        scene: Scene
+        for scene in novel.scenes_in_chapter(chapter):
+            if scene.manuscript:
+                html += prepare_content_for_convert(scene.manuscript.content)
+
+    if fmt == 'docx':
+        extra_args = ['--reference-doc', str(manuscript_docx_template)]
+        pypandoc.convert_text(html, to='docx', format='html', extra_args=extra_args, outputfile=target)
+    else:
+        pypandoc.convert_text(html, to='markdown', format='html', outputfile=target)
+
+
+def _migrate_worker(workspace: str, novel_id: str) -> Tuple[str, bool, List[FileChange]]:
+    json_client.load_workspace(workspace)
+    with json_client.capture() as changes:
+        novel = json_client.fetch_novel(uuid.UUID(novel_id))
+        app_env.novel = novel
+        migrated = migrate_novel(novel)
+        if migrated:
+            json_client.update_novel(novel)
+    return novel.title, migrated, changes
+
+
+def migrate_workspace(workspace: str, novels: List[NovelDescriptor],
+                      jobs: Optional[int] = None) -> List[Tuple[str, bool]]:
+    results = []
+    with ProcessPoolExecutor(max_workers=jobs) as executor:
+        futures = [executor.submit(_migrate_worker, workspace, str(x.id)) for x in novels]
+        for future in as_completed(futures):
+            title, migrated, changes = future.result()
+            json_client.apply_changes(changes)
+            results.append((title, migrated))
+
+    return results
+
+
+def find_document(novel: Novel, id: str):
+    for scene in novel.scenes:
+        for doc in [scene.manuscript, scene.document]:
+            if doc and str(doc.id) == id:
+                return doc
+    for character in novel.characters:
+        if character.document and str(character.document.id) == id:
+            return character.document
+
+    docs = list(novel.documents)
+    while docs:
+        doc = docs.pop()
+        if str(doc.id) == id:
+            return doc
+        docs.extend(doc.children)
+
+
+def _output(data, as_json: bool):
+    if as_json:
+        print(json.dumps(data, indent=2))
+    elif isinstance(data, list):
+        for item in data:
+            print(item)
+    else:
+        print(data)
+
+
+def _cmd_validate(args) -> int:
+    issues = validate_workspace(select_novels(args.novel), repair=args.repair)
+    _output([str(x) for x in issues], args.json)
+    return 1 if any(x.severity == Severity.ERROR and not x.repaired for x in issues) else 0
+
+
+def _cmd_stats(args) -> int:
+    stats = [novel_statistics(x) for x in select_novels(args.novel)]
+    if args.json:
+        _output(stats, True)
+    else:
+        for novel_stats in stats:
+            print(f"{novel_stats['title']}: {novel_stats['wc']} words, {novel_stats['scenes']} scenes, "
+                  f"{novel_stats['chapters']} chapters, {novel_stats['characters']} characters")
+            for date, progress in novel_stats['progress'].items():
+                print(f"  {date}: +{progress['added']} -{progress['removed']}")
+    return 0
+
+
+def _cmd_export(args) -> int:
+    novels = select_novels(args.novel)
+    os.makedirs(args.output, exist_ok=True)
+    for novel in novels:
+        name = f'{slugify(novel.title if novel.title else str(novel.id))}.{"docx" if args.format == "docx" else "md"}'
+        target = os.path.join(args.output, name)
+        export_manuscript(novel, target, args.format)
+        print(f'{novel.title}: {target}')
+    return 0
+
+
+def _cmd_rebuild(args) -> int:
+    for novel in select_novels(args.novel):
+        updated = rebuild_statistics(novel)
+        print(f'{novel.title}: {updated} scenes updated')
+    return 0
+
+
+def _cmd_snapshot(args) -> int:
+    for novel in select_novels(args.novel):
+        snapshot = take_snapshot(fetch_novel(novel), args.label)
+        print(f'{novel.title}: {snapshot.id[:8]} {snapshot.summary}')
+    return 0
+
+
+def _cmd_history(args) -> int:
+    history = {descriptor.title: list_snapshots(fetch_novel(descriptor)) for descriptor in select_novels(args.novel)}
+    if args.json:
+        _output({title: [x.to_dict() for x in snapshots] for title, snapshots in history.items()}, True)
+    else:
+        for title, snapshots in history.items():
+            print(title)
+            for snapshot in snapshots:
+                label = f' "{snapshot.label}"' if snapshot.label else ''
+                print(f'  {snapshot.id[:8]} {snapshot.created}{label}: {snapshot.summary}')
+    return 0
+
+
+def _cmd_restore(args) -> int:
+    for descriptor in select_novels(args.novel):
+        novel = fetch_novel(descriptor)
+        snapshot = snapshot_store(novel).snapshot(args.snapshot)
+        if snapshot is None:
+            raise ValueError(f'Could not find snapshot {args.snapshot}')
+        if args.scene:
+            scene = next((x for x in novel.scenes if str(x.id) == args.scene), None)
+            if scene is None or not restore_scene(novel, snapshot, scene):
+                raise ValueError(f'Could not restore scene {args.scene}')
+        else:
+            doc = find_document(novel, args.document)
+            if doc is None or not restore_document(novel, snapshot, doc):
+                raise ValueError(f'Could not restore document {args.document}')
+        print(f'{novel.title}: restored from {snapshot.id[:8]}')
+    return 0
+
+
+def _cmd_prune_images(args) -> int:
+    results = {descriptor.title: remove_orphan_images(fetch_novel(descriptor), dry_run=args.dry_run) for descriptor in
+               select_novels(args.novel)}
+    if args.json:
+        _output({title: {'removed': x.removed, 'reclaimed': x.reclaimed} for title, x in results.items()}, True)
+    else:
+        for title, result in results.items():
+            print(f'{title}: {result}')
+    return 0
+
+
+def _cmd_migrate(args) -> int:
+    for title, migrated in migrate_workspace(args.workspace, select_novels(args.novel), args.jobs):
+        print(f'{title}: {"migrated" if migrated else "up to date"}')
+    return 0
+
+
+def build_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(prog='plotlyst.cli', description='Headless Plotlyst workspace tools')
+    parser.add_argument('workspace', help='Path to the Plotlyst workspace')
+    parser.add_argument('--novel', action='append', help='Novel id or title to process. Defaults to every novel')
+    parser.add_argument('--json', action='store_true', help='Print the results as JSON')
+    subparsers = parser.add_subparsers(dest='command', required=True)
+
+    validate = subparsers.add_parser('validate', help='Validate the workspace files')
+    validate.add_argument('--repair', action='store_true', help='Remove dangling references')
+    validate.set_defaults(func=_cmd_validate)
+
+    stats = subparsers.add_parser('stats', help='Word counts and daily progress')
+    stats.set_defaults(func=_cmd_stats)
+
+    export = subparsers.add_parser('export', help='Export manuscripts')
+    export.add_argument('--format', choices=['docx', 'markdown'], default='docx')
+    export.add_argument('--output', default='.', help='Output directory')
+    export.set_defaults(func=_cmd_export)
+
+    rebuild = subparsers.add_parser('rebuild', help='Rebuild the cached manuscript statistics')
+    rebuild.set_defaults(func=_cmd_rebuild)
+
+    snapshot = subparsers.add_parser('snapshot', help='Take a snapshot of the novels')
+    snapshot.add_argument('--label', default='', help='Label of the snapshot')
+    snapshot.set_defaults(func=_cmd_snapshot)
+
+    history = subparsers.add_parser('history', help='List the snapshots with a summary of their changes')
+    history.set_defaults(func=_cmd_history)
+
+    restore = subparsers.add_parser('restore', help='Restore a scene or a document from a snapshot')
+    restore.add_argument('snapshot', help='Snapshot id or id prefix')
+    target = restore.add_mutually_exclusive_group(required=True)
+    target.add_argument('--scene', help='Scene id')
+    target.add_argument('--document', help='Document id')
+    restore.set_defaults(func=_cmd_restore)
+
+    prune_images = subparsers.add_parser('prune-images', help='Remove the images that are not referenced anymore')
+    prune_images.add_argument('--dry-run', action='store_true', help='Only report the orphaned images')
+    prune_images.set_defaults(func=_cmd_prune_images)
+
+    migrate = subparsers.add_parser('migrate', help='Migrate every novel to the latest format')
+    migrate.add_argument('--jobs', type=int, default=None, help='Number of parallel processes')
+    migrate.set_defaults(func=_cmd_migrate)
+
+    return parser
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    os.environ.setdefault('QT_QPA_PLATFORM', 'offscreen')
+    logging.basicConfig(level=logging.WARNING, format='%(levelname)s - %(message)s')
+
+    args = build_parser().parse_args(argv)
+    app = QGuiApplication.instance()
+    if app is None:
+        app = QGuiApplication(sys.argv[:1])
+        app.setApplicationName('Plotlyst')
+    try:
+        init_workspace(args.workspace)
+        return args.func(args)
+    except Exception as ex:
+        logging.error(ex)
+        return 2
+
+
+if __name__ == '__main__':
+    sys.exit(main())
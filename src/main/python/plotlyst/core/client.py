@@ -21,12 +21,14 @@ import codecs
 import copy
 import os
 import pathlib
+import threading
 import uuid
+from contextlib import contextmanager
 from dataclasses import dataclass, field
 from datetime import datetime
 from enum import IntEnum
 from pathlib import Path
-from typing import List, Optional, Any, Dict, Set, Union
+from typing import List, Optional, Any, Dict, Set, Union, Iterator, Tuple
 
 from PyQt6.QtCore import QByteArray, QBuffer, QIODevice
 from PyQt6.QtGui import QImage, QImageReader, QImageWriter
@@ -105,6 +107,19 @@ class SqlClient:
 client = SqlClient()
 
 
+def encode_image(image: QImage, extension: str) -> Optional[bytes]:
+    format_ = extension.lstrip('.').lower()
+    if format_ == 'jpg':
+        format_ = 'jpeg'
+    array = QByteArray()
+    buffer = QBuffer(array)
+    buffer.open(QIODevice.OpenModeFlag.WriteOnly)
+    writer = QImageWriter(buffer, format_.encode())
+    if not writer.write(image):
+        return None
+    return array.data()
+
+
 def load_image(path: pathlib.Path):
     if not os.path.exists(path):
         return None
@@ -164,7 +179,7 @@ class CharacterArcInfo:
 @dataclass
 class ScenePlotReferenceInfo:
     plot_id: uuid.UUID
-    data: ScenePlotReferenceData = ScenePlotReferenceData()
+    data: ScenePlotReferenceData = field(default_factory=ScenePlotReferenceData)
 
 
 @dataclass_json(undefined=Undefined.EXCLUDE)
@@ -264,10 +279,20 @@ class Project:
     novels: List[ProjectNovelInfo] = field(default_factory=list)
 
 
+@dataclass
+class FileChange:
+    path: str
+    content: Optional[str] = None
+    data: Optional[bytes] = None
+    removed: bool = False
+    encoding: Optional[str] = 'utf-8'
+
+
 class JsonClient:
 
     def __init__(self):
-        self.project: Optional[Project] = None
+        self._project: Optional[Project] = None
+        self._local = threading.local()
         self._workspace = ''
         self.project_file_path = ''
         self.root_path: Optional[pathlib.Path] = None
@@ -282,23 +307,81 @@ class JsonClient:
 
         if not os.path.exists(self.project_file_path) or os.path.getsize(self.project_file_path) == 0:
             self.project = Project()
-            self._persist_project()
         else:
-            with open(self.project_file_path) as json_file:
-                data = json_file.read()
-                self.project = Project.from_json(data)
-            self._persist_project()
+            self.__read_project()
+        self._persist_project()
 
-        self._workspace = workspace
-        self.root_path = pathlib.Path(self._workspace)
-        self.novels_dir = self.root_path.joinpath('novels')
-        self.project_images_dir = self.root_path.joinpath('images')
+        self.__set_workspace(workspace)
 
         if not os.path.exists(str(self.novels_dir)):
             os.mkdir(self.novels_dir)
         if not os.path.exists(str(self.project_images_dir)):
             os.mkdir(self.project_images_dir)
 
+    def load_workspace(self, workspace: str):
+        """Reads an existing workspace without writing the project file, e.g. from a worker process."""
+        self.project_file_path = os.path.join(workspace, 'project.plotlyst')
+        self.__read_project()
+        self.__set_workspace(workspace)
+
+    def __read_project(self):
+        with open(self.project_file_path) as json_file:
+            self.project = Project.from_json(json_file.read())
+
+    def __set_workspace(self, workspace: str):
+        self._workspace = workspace
+        self.root_path = pathlib.Path(self._workspace)
+        self.novels_dir = self.root_path.joinpath('novels')
+        self.project_images_dir = self.root_path.joinpath('images')
+
+    @property
+    def project(self) -> Optional[Project]:
+        changes = getattr(self._local, 'changes', None)
+        if changes is None:
+            return self._project
+        if self._local.project is None:
+            self._local.project = copy.deepcopy(self._project)
+        return self._local.project
+
+    @project.setter
+    def project(self, project: Optional[Project]):
+        self._project = project
+
+    @contextmanager
+    def capture(self) -> Iterator[List[FileChange]]:
+        """Records the file changes made by the calling thread instead of writing them to the workspace."""
+        changes: List[FileChange] = []
+        self._local.changes = changes
+        self._local.project = None
+        try:
+            yield changes
+        finally:
+            self._local.changes = None
+            self._local.project = None
+
+    def apply_changes(self, changes: List[FileChange]):
+        project_changed = False
+        for change in changes:
+            path = self.root_path.joinpath(change.path)
+            if change.removed:
+                if path.exists():
+                    os.remove(path)
+                continue
+
+            path.parent.mkdir(parents=True, exist_ok=True)
+            if change.data is not None:
+                with atomic_write(path, mode='wb', overwrite=True) as f:
+                    f.write(change.data)
+            else:
+                with atomic_write(path, encoding=change.encoding, overwrite=True) as f:
+                    f.write(change.content)
+            if str(path) == str(pathlib.Path(self.project_file_path)):
+                project_changed = True
+
+        if project_changed:
+            with open(self.project_file_path) as json_file:
+                self.project = Project.from_json(json_file.read())
+
     def novels(self) -> List[NovelDescriptor]:
         return [NovelDescriptor(title=x.title, id=x.id, import_origin=x.import_origin, lang_settings=x.lang_settings,
                                 subtitle=x.subtitle, icon=x.icon, icon_color=x.icon_color,
@@ -340,6 +423,36 @@ class JsonClient:
             images_dir_.mkdir()
         return images_dir_
 
+    def novel_files(self, novel: Novel) -> List[Path]:
+        files = [self.novels_dir.joinpath(self.__json_file(novel.id))]
+        novel_dir = self.novels_dir.joinpath(str(novel.id))
+        if novel_dir.exists():
+            files.extend(sorted(x for x in novel_dir.rglob('*') if x.is_file()))
+        return [x for x in files if x.exists()]
+
+    def novel_stamp(self, id: uuid.UUID) -> Tuple[int, ...]:
+        # files are replaced atomically, so every change also touches the modification time of its directory
+        stamp = []
+        novel_file = self.novels_dir.joinpath(self.__json_file(id))
+        if novel_file.exists():
+            stamp.append(novel_file.stat().st_mtime_ns)
+        novel_dir = self.novels_dir.joinpath(str(id))
+        if novel_dir.exists():
+            dirs = [novel_dir]
+            dirs.extend(sorted(x for x in novel_dir.rglob('*') if x.is_dir()))
+            stamp.extend(x.stat().st_mtime_ns for x in dirs)
+        return tuple(stamp)
+
+    def scene_file(self, novel: Novel, scene: Scene) -> Path:
+        return self.scenes_dir(novel).joinpath(self.__json_file(scene.id))
+
+    def document_file(self, novel: Novel, document: Document) -> Optional[Path]:
+        novel_doc_dir = self.docs_dir(novel).joinpath(str(novel.id))
+        if document.type in [DocumentType.DOCUMENT, DocumentType.STORY_STRUCTURE]:
+            return novel_doc_dir.joinpath(self.__doc_file(document.id))
+        if document.data_id:
+            return novel_doc_dir.joinpath(self.__json_file(document.data_id))
+
     def docs_dir(self, novel: Novel) -> Path:
         docs_dir_ = self.novels_dir.joinpath(str(novel.id)).joinpath('docs')
         if not docs_dir_.exists():
@@ -419,7 +532,7 @@ class JsonClient:
             if character.avatar:
                 avatar_id = uuid.uuid4()
                 image = QImage.fromData(character.avatar)
-                image.save(str(self.project_images_dir.joinpath(self.__image_file(avatar_id))))
+                self.__write_image(self.project_images_dir.joinpath(self.__image_file(avatar_id)), image)
 
         self._persist_character(character, avatar_id, novel)
 
@@ -440,8 +553,7 @@ class JsonClient:
             return
 
         if document.type in [DocumentType.DOCUMENT, DocumentType.STORY_STRUCTURE]:
-            content = self.__load_doc(novel, document.id)
-            document.content = content
+            document.content = self.read_document(novel, document)
         else:
             data_str: str = self.__load_doc_data(novel, document.data_id)
             if document.type in [DocumentType.CAUSE_AND_EFFECT, DocumentType.REVERSED_CAUSE_AND_EFFECT]:
@@ -452,6 +564,13 @@ class JsonClient:
                 document.data = PremiseBuilder.from_json(data_str)
         document.loaded = True
 
+    def read_document(self, novel: Novel, document: Document) -> str:
+        """Returns the stored content of a text document without loading it.
+
+        It does not touch the document, so it can be called outside the main thread.
+        """
+        return self.__load_doc(novel, document.id)
+
     @busy
     def load_manuscript(self, novel: Novel):
         for scene in novel.scenes:
@@ -479,10 +598,37 @@ class JsonClient:
 
         return image
 
-    def save_image(self, novel: Novel, ref: ImageRef, image: QImage):
+    def save_image(self, novel: Novel, ref: ImageRef, image: QImage) -> ImageRef:
         file_path = self.images_dir(novel).joinpath(f'{ref.id}.{ref.extension}')
-        writer = QImageWriter(str(file_path))
-        writer.write(image)
+        data = encode_image(image, ref.extension)
+        if data is None:
+            writer = QImageWriter(str(file_path))
+            writer.write(image)
+            return ref
+
+        existing = self.find_image(novel, data)
+        if existing is not None:
+            return existing
+        self.__write_bytes(file_path, data)
+        return ref
+
+    def find_image(self, novel: Novel, data: bytes) -> Optional[ImageRef]:
+        for path in self.image_files(novel):
+            if path.stat().st_size == len(data) and path.read_bytes() == data:
+                id_, _, extension = path.name.partition('.')
+                try:
+                    return ImageRef(extension, uuid.UUID(id_))
+                except ValueError:
+                    continue
+
+    def image_files(self, novel: Novel) -> List[Path]:
+        images_dir_ = self.novels_dir.joinpath(str(novel.id)).joinpath('images')
+        if not images_dir_.exists():
+            return []
+        return sorted(x for x in images_dir_.iterdir() if x.is_file())
+
+    def remove_image_file(self, path: Path):
+        self.__remove_file(path)
 
     def update_document(self, novel: Novel, document: Document):
         self.__persist_doc(novel, document)
@@ -498,15 +644,14 @@ class JsonClient:
         novel_info = self._read_novel_info(project_novel_info.id)
         self.__persist_info(self.novels_dir, novel_info)
 
-        plot_ids = {}
-        for plot in novel_info.plots:
-            plot_ids[str(plot.id)] = plot
+        plot_ids: Dict[uuid.UUID, Plot] = {plot.id: plot for plot in novel_info.plots}
+        stage_ids = {stage.id: stage for stage in novel_info.stages}
         chapters = []
-        chapters_ids = {}
+        chapters_ids: Dict[uuid.UUID, Chapter] = {}
         for chapter_info in novel_info.chapters:
             chapter = Chapter(title=chapter_info.title, id=chapter_info.id, type=chapter_info.type)
             chapters.append(chapter)
-            chapters_ids[str(chapter.id)] = chapter
+            chapters_ids[chapter.id] = chapter
 
         characters = []
         for char_id in novel_info.characters:
@@ -544,20 +689,15 @@ class JsonClient:
                     if bytes:
                         character.avatar = bytes
                 characters.append(character)
-        characters_ids: Dict[str, Character] = {}
-        for char in characters:
-            characters_ids[str(char.id)] = char
+        characters_ids: Dict[uuid.UUID, Character] = {char.id: char for char in characters}
 
         conflicts = []
-        conflict_ids = {}
         for conflict in novel_info.conflicts:
-            if str(conflict.character_id) not in characters_ids.keys():
+            if conflict.character_id not in characters_ids:
                 continue
-            if conflict.conflicting_character_id and str(
-                    conflict.conflicting_character_id) not in characters_ids.keys():
+            if conflict.conflicting_character_id and conflict.conflicting_character_id not in characters_ids:
                 continue
             conflicts.append(conflict)
-            conflict_ids[str(conflict.id)] = conflict
 
         if not novel_info.story_structures:
             novel_info.story_structures = [copy.deepcopy(three_act_structure)]
@@ -572,44 +712,8 @@ class JsonClient:
             if not os.path.exists(path):
                 continue
             with open(path, encoding='utf8') as json_file:
-                data = json_file.read()
-                info: SceneInfo = SceneInfo.from_json(data)
-                scene_plots = []
-                for plot_value in info.plots:
-                    if str(plot_value.plot_id) in plot_ids.keys():
-                        scene_plots.append(ScenePlotReference(plot_ids[str(plot_value.plot_id)], plot_value.data))
-                if info.pov and str(info.pov) in characters_ids.keys():
-                    pov = characters_ids[str(info.pov)]
-                else:
-                    pov = None
-
-                scene_characters = []
-                for char_id in info.characters:
-                    if str(char_id) in characters_ids.keys():
-                        scene_characters.append(characters_ids[str(char_id)])
-
-                if info.chapter and str(info.chapter) in chapters_ids.keys():
-                    chapter = chapters_ids[str(info.chapter)]
-                else:
-                    chapter = None
-
-                stage = None
-                if info.stage:
-                    match = [x for x in novel_info.stages if x.id == info.stage]
-                    if match:
-                        stage = match[0]
-
-                scene = Scene(title=info.title, id=info.id, synopsis=info.synopsis,
-                              wip=info.wip, day=info.day,
-                              plot_values=scene_plots, pov=pov, characters=scene_characters, agendas=info.agendas,
-                              chapter=chapter, stage=stage, beats=info.beats,
-                              comments=info.comments, tag_references=info.tag_references,
-                              document=info.document, manuscript=info.manuscript, drive=info.drive,
-                              purpose=info.purpose, outcome=info.outcome, story_elements=info.story_elements,
-                              structure=info.structure, questions=info.questions, info=info.info,
-                              progress=info.progress, plot_pos_progress=info.plot_pos_progress,
-                              plot_neg_progress=info.plot_neg_progress, functions=info.functions)
-                scenes.append(scene)
+                info: SceneInfo = SceneInfo.from_json(json_file.read())
+                scenes.append(self.__scene(info, plot_ids, characters_ids, chapters_ids, stage_ids))
 
         tag_types = novel_info.tag_types
         tags = novel_info.tags
@@ -639,7 +743,7 @@ class JsonClient:
                       scenes=scenes, chapters=chapters, custom_chapters=novel_info.custom_chapters,
                       stages=novel_info.stages,
                       story_structures=novel_info.story_structures,
-                      conflicts=conflicts, goals=[x for x in novel_info.goals if str(x.id) in goal_ids], tags=tags_dict,
+                      conflicts=conflicts, goals=[x for x in novel_info.goals if x.id in goal_ids], tags=tags_dict,
                       documents=novel_info.documents, premise=novel_info.premise, synopsis=novel_info.synopsis,
                       prefs=novel_info.prefs, locations=novel_info.locations,
                       manuscript_goals=novel_info.manuscript_goals,
@@ -658,6 +762,11 @@ class JsonClient:
 
         return novel
 
+    def scene_from_json(self, novel: Novel, data: str) -> Scene:
+        info: SceneInfo = SceneInfo.from_json(data)
+        return self.__scene(info, {x.id: x for x in novel.plots}, {x.id: x for x in novel.characters},
+                            {x.id: x for x in novel.chapters}, {x.id: x for x in novel.stages})
+
     def _read_novel_info(self, id: uuid.UUID) -> NovelInfo:
         path = self.novels_dir.joinpath(self.__json_file(id))
         if not os.path.exists(path):
@@ -667,8 +776,7 @@ class JsonClient:
             return NovelInfo.from_json(data)
 
     def _persist_project(self):
-        with atomic_write(self.project_file_path, overwrite=True) as f:
-            f.write(self.project.to_json())
+        self.__write_text(self.project_file_path, self.project.to_json(), encoding=None)
 
     def _persist_novel(self, novel: Novel):
         novel_info = NovelInfo(id=novel.id, scenes=[x.id for x in novel.scenes],
@@ -755,16 +863,44 @@ class JsonClient:
             os.mkdir(diagrams_dir)
         self.__persist_json_by_id(diagrams_dir, diagram.data.to_json(), diagram.id)
 
+    @staticmethod
+    def __scene(info: SceneInfo, plot_ids: Dict[uuid.UUID, Plot], characters_ids: Dict[uuid.UUID, Character],
+                chapters_ids: Dict[uuid.UUID, Chapter], stage_ids: Dict[uuid.UUID, SceneStage]) -> Scene:
+        scene_plots = []
+        for plot_value in info.plots:
+            if plot_value.plot_id in plot_ids:
+                scene_plots.append(ScenePlotReference(plot_ids[plot_value.plot_id], plot_value.data))
+        pov = characters_ids.get(info.pov) if info.pov else None
+
+        scene_characters = []
+        for char_id in info.characters:
+            if char_id in characters_ids:
+                scene_characters.append(characters_ids[char_id])
+
+        chapter = chapters_ids.get(info.chapter) if info.chapter else None
+        stage = stage_ids.get(info.stage) if info.stage else None
+
+        return Scene(title=info.title, id=info.id, synopsis=info.synopsis,
+                     wip=info.wip, day=info.day,
+                     plot_values=scene_plots, pov=pov, characters=scene_characters, agendas=info.agendas,
+                     chapter=chapter, stage=stage, beats=info.beats,
+                     comments=info.comments, tag_references=info.tag_references,
+                     document=info.document, manuscript=info.manuscript, drive=info.drive,
+                     purpose=info.purpose, outcome=info.outcome, story_elements=info.story_elements,
+                     structure=info.structure, questions=info.questions, info=info.info,
+                     progress=info.progress, plot_pos_progress=info.plot_pos_progress,
+                     plot_neg_progress=info.plot_neg_progress, functions=info.functions)
+
     @staticmethod
     def __id_or_none(item):
         return item.id if item else None
 
-    def __collect_goal_ids(self, goal_ids: Set[str], plans: List[CharacterPlan]):
+    def __collect_goal_ids(self, goal_ids: Set[uuid.UUID], plans: List[CharacterPlan]):
         for plan in plans:
             for goal in plan.goals:
-                goal_ids.add(str(goal.goal_id))
+                goal_ids.add(goal.goal_id)
                 for child in goal.children:
-                    goal_ids.add(str(child.goal_id))
+                    goal_ids.add(child.goal_id)
 
     def __json_file(self, uuid: uuid.UUID) -> str:
         return f'{uuid}.json'
@@ -812,8 +948,7 @@ class JsonClient:
 
         if doc.type in [DocumentType.DOCUMENT, DocumentType.STORY_STRUCTURE]:
             doc_file_path = novel_doc_dir.joinpath(self.__doc_file(doc.id))
-            with atomic_write(doc_file_path, encoding='utf-8', overwrite=True) as f:
-                f.write(doc.content)
+            self.__write_text(doc_file_path, doc.content)
         elif doc.type in [DocumentType.REVERSED_CAUSE_AND_EFFECT, DocumentType.CAUSE_AND_EFFECT, DocumentType.MICE,
                           DocumentType.PREMISE]:
             self.__persist_json_by_id(novel_doc_dir, doc.data.to_json(), doc.data_id)
@@ -825,35 +960,68 @@ class JsonClient:
         self.__persist_json_by_name(dir, info.to_json(), name)
 
     def __persist_json_by_name(self, dir, json_data: str, name: str):
-        with atomic_write(dir.joinpath(f'{name}.json'), encoding='utf-8', overwrite=True) as f:
-            f.write(json_data)
+        self.__write_text(dir.joinpath(f'{name}.json'), json_data)
 
     def __persist_json_by_id(self, dir, json_data: str, id: uuid.UUID):
-        with atomic_write(dir.joinpath(self.__json_file(id)), encoding='utf-8', overwrite=True) as f:
-            f.write(json_data)
+        self.__write_text(dir.joinpath(self.__json_file(id)), json_data)
 
     def __delete_info(self, dir, id: uuid.UUID):
-        path = dir.joinpath(self.__json_file(id))
-        if os.path.exists(path):
-            os.remove(path)
+        self.__remove_file(dir.joinpath(self.__json_file(id)))
 
     def __delete_image(self, id: uuid.UUID):
-        path = self.project_images_dir.joinpath(self.__image_file(id))
-        if os.path.exists(path):
-            os.remove(path)
+        self.__remove_file(self.project_images_dir.joinpath(self.__image_file(id)))
 
     def __delete_doc(self, novel: Novel, doc: Document):
         novel_doc_dir = self.docs_dir(novel).joinpath(str(novel.id))
         if not os.path.exists(str(novel_doc_dir)):
             return
-        doc_file_path = novel_doc_dir.joinpath(self.__doc_file(doc.id))
-        if os.path.exists(doc_file_path):
-            os.remove(doc_file_path)
+        self.__remove_file(novel_doc_dir.joinpath(self.__doc_file(doc.id)))
 
         if doc.diagram is not None:
             self.__delete_info(self.diagrams_dir(novel), doc.diagram.id)
 
         recursive(doc, lambda parent: parent.children, lambda p, child: self.__delete_doc(novel, child))
 
+    def __captured_changes(self) -> Optional[List[FileChange]]:
+        return getattr(self._local, 'changes', None)
+
+    def __relative_path(self, path) -> str:
+        return pathlib.Path(path).relative_to(self.root_path).as_posix()
+
+    def __write_text(self, path, text: str, encoding: Optional[str] = 'utf-8'):
+        changes = self.__captured_changes()
+        if changes is not None:
+            changes.append(FileChange(self.__relative_path(path), content=text, encoding=encoding))
+            return
+        with atomic_write(path, encoding=encoding, overwrite=True) as f:
+            f.write(text)
+
+    def __write_image(self, path, image: QImage):
+        changes = self.__captured_changes()
+        if changes is not None:
+            array = QByteArray()
+            buffer = QBuffer(array)
+            buffer.open(QIODevice.OpenModeFlag.WriteOnly)
+            image.save(buffer, 'JPEG')
+            changes.append(FileChange(self.__relative_path(path), data=array.data()))
+            return
+        image.save(str(path))
+
+    def __write_bytes(self, path, data: bytes):
+        changes = self.__captured_changes()
+        if changes is not None:
+            changes.append(FileChange(self.__relative_path(path), data=data))
+            return
+        with atomic_write(path, mode='wb', overwrite=True) as f:
+            f.write(data)
+
+    def __remove_file(self, path):
+        changes = self.__captured_changes()
+        if changes is not None:
+            changes.append(FileChange(self.__relative_path(path), removed=True))
+            return
+        if os.path.exists(path):
+            os.remove(path)
+
 
 json_client = JsonClient()
@@ -52,7 +52,7 @@ class TemplateValue:
 
     @overrides
     def __hash__(self):
-        return hash(str(self.id))
+        return hash(self.id)
 
 
 class LayoutType(Enum):
@@ -77,6 +77,7 @@ class Comment:
     major: bool = False
     resolved: bool = False
     character: Optional['Character'] = None
+    id: uuid.UUID = field(default_factory=uuid.uuid4)
 
 
 @dataclass
@@ -96,7 +97,7 @@ class ImageRef:
 
     @overrides
     def __hash__(self):
-        return hash(str(self.id))
+        return hash(self.id)
 
 
 class TopicType(Enum):
@@ -186,7 +187,7 @@ class Topic:
 
     @overrides
     def __hash__(self):
-        return hash(str(self.id))
+        return hash(self.id)
 
 
 class AgePeriod(Enum):
@@ -252,7 +253,7 @@ class CharacterGoal:
 
     @overrides
     def __hash__(self):
-        return hash(str(self.id))
+        return hash(self.id)
 
 
 @dataclass
@@ -270,7 +271,7 @@ class CharacterPlan:
 
     @overrides
     def __hash__(self):
-        return hash(str(self.id))
+        return hash(self.id)
 
 
 MALE = 'male'
@@ -674,7 +675,7 @@ class Character:
 
     @overrides
     def __hash__(self):
-        return hash(str(self.id))
+        return hash(self.id)
 
 
 class PlaceholderCharacter(Character):
@@ -712,7 +713,7 @@ class Chapter:
 
     @overrides
     def __hash__(self):
-        return hash(str(self.id))
+        return hash(self.id)
 
 
 @dataclass
@@ -802,7 +803,7 @@ class StoryBeat(OutlineItem):
 
     @overrides
     def __hash__(self):
-        return hash(str(self.id))
+        return hash(self.id)
 
 
 @dataclass
@@ -817,7 +818,7 @@ class SceneStage(SelectionItem):
 
     @overrides
     def __hash__(self):
-        return hash(str(self.id))
+        return hash(self.id)
 
 
 @dataclass
@@ -832,7 +833,7 @@ class DramaticQuestion(SelectionItem):
 
     @overrides
     def __hash__(self):
-        return hash(str(self.id))
+        return hash(self.id)
 
 
 class PlotType(Enum):
@@ -856,7 +857,7 @@ class PlotValue(SelectionItem):
 
     @overrides
     def __hash__(self):
-        return hash(str(self.id))
+        return hash(self.id)
 
 
 class PlotPrincipleType(Enum):
@@ -1233,6 +1234,8 @@ class PlotEvent:
 #    def __post_init__(self):
 #        self._character: Optional[Character] = None
 class CharacterBased(ABC):
+    __slots__ = ()
+
     def set_character(self, character: Optional[Character]):
         if character is None:
             self.reset_character()
@@ -1257,6 +1260,7 @@ class CharacterBased(ABC):
 
 
 class SceneBased(ABC):
+    __slots__ = ()
 
     def set_scene(self, scene: Optional['Scene']):
         if scene is None:
@@ -1417,7 +1421,7 @@ class Plot(SelectionItem, CharacterBased):
 
     @overrides
     def __hash__(self):
-        return hash(str(self.id))
+        return hash(self.id)
 
 
 class ConflictType(Enum):
@@ -1459,7 +1463,7 @@ class Conflict(SelectionItem, CharacterBased):
 
     @overrides
     def __hash__(self):
-        return hash(str(self.id))
+        return hash(self.id)
 
 
 @dataclass
@@ -1475,10 +1479,10 @@ class Goal(SelectionItem):
 
     @overrides
     def __hash__(self):
-        return hash(str(self.id))
+        return hash(self.id)
 
 
-@dataclass
+@dataclass(slots=True)
 class ScenePlotValueCharge:
     plot_value_id: uuid.UUID
     charge: int
@@ -1489,14 +1493,14 @@ class ScenePlotValueCharge:
                 return v
 
 
-@dataclass
+@dataclass(slots=True)
 class ScenePlotReferenceData:
     comment: str = field(default='', metadata=config(exclude=exclude_if_empty))
     charge: int = 0
     values: List[ScenePlotValueCharge] = field(default_factory=list)
 
 
-@dataclass
+@dataclass(slots=True)
 class ScenePlotReference:
     plot: Plot
     data: ScenePlotReferenceData = field(default_factory=ScenePlotReferenceData)
@@ -1561,7 +1565,7 @@ class SceneStructureItem(OutlineItem):
         self.meta['outcome'] = value.value
 
 
-@dataclass
+@dataclass(slots=True)
 class ConflictReference:
     conflict_id: uuid.UUID
     message: str = ''
@@ -1622,7 +1626,7 @@ class Motivation(Enum):
             return '#c38e70'
 
 
-@dataclass
+@dataclass(slots=True)
 class GoalReference:
     character_goal_id: uuid.UUID
     message: str = ''
@@ -1634,7 +1638,7 @@ class GoalReference:
                 return goal_
 
 
-@dataclass
+@dataclass(slots=True)
 class TagReference:
     tag_id: uuid.UUID
     message: str = ''
@@ -1647,8 +1651,13 @@ class CharacterAgencyChanges:
     final: Optional['StoryElement'] = None
 
 
-@dataclass
-class SceneStructureAgenda(CharacterBased):
+class _CharacterCache(CharacterBased):
+    # runtime-only state of the slotted CharacterBased dataclasses; not a field so it's never serialized
+    __slots__ = ('_character',)
+
+
+@dataclass(slots=True)
+class SceneStructureAgenda(_CharacterCache):
     character_id: Optional[uuid.UUID] = None
     conflict_references: List[ConflictReference] = field(default_factory=list)
     goal_references: List[GoalReference] = field(default_factory=list)
@@ -1682,7 +1691,7 @@ class SceneStructureAgenda(CharacterBased):
         return [x for x in goals_ if x.id in agenda_goal_ids]
 
 
-@dataclass
+@dataclass(slots=True)
 class SceneStoryBeat:
     structure_id: uuid.UUID
     beat_id: uuid.UUID
@@ -1949,7 +1958,7 @@ class SceneReaderInformation:
 
     @overrides
     def __hash__(self):
-        return hash(str(self.id))
+        return hash(self.id)
 
 
 @dataclass
@@ -2078,7 +2087,7 @@ class Scene:
 
     @overrides
     def __hash__(self):
-        return hash(str(self.id))
+        return hash(self.id)
 
 
 def default_stages() -> List[SceneStage]:
@@ -2135,7 +2144,7 @@ class Variable:
 
     @overrides
     def __hash__(self):
-        return hash(str(self.id))
+        return hash(self.id)
 
 
 class WorldBuildingEntityType(Enum):
@@ -2183,7 +2192,7 @@ class WorldBuildingEntityElement:
 
     @overrides
     def __hash__(self):
-        return hash(str(self.id))
+        return hash(self.id)
 
 
 @dataclass
@@ -2211,7 +2220,7 @@ class WorldBuildingEntity:
 
     @overrides
     def __hash__(self):
-        return hash(str(self.id))
+        return hash(self.id)
 
 
 class WorldConceitType(Enum):
@@ -2255,7 +2264,7 @@ class WorldConceit:
 
     @overrides
     def __hash__(self):
-        return hash(str(self.id))
+        return hash(self.id)
 
 
 def worldbuilding_root() -> WorldBuildingEntity:
@@ -2397,7 +2406,7 @@ class Location:
 
     @overrides
     def __hash__(self):
-        return hash(str(self.id))
+        return hash(self.id)
 
 
 def default_maps() -> List[WorldBuildingMap]:
@@ -2427,7 +2436,7 @@ class TaskStatus(SelectionItem):
 
     @overrides
     def __hash__(self):
-        return hash(str(self.id))
+        return hash(self.id)
 
 
 tag_characterization = SelectionItem('Characterization', icon='fa5s.user', icon_color='darkBlue')
@@ -2494,7 +2503,7 @@ class Task(CharacterBased):
 
     @overrides
     def __hash__(self):
-        return hash(str(self.id))
+        return hash(self.id)
 
 
 def default_task_statues() -> List[TaskStatus]:
@@ -3331,7 +3340,7 @@ class NovelDescriptor:
 
     @overrides
     def __hash__(self):
-        return hash(str(self.id))
+        return hash(self.id)
 
     def is_scrivener_sync(self) -> bool:
         if self.import_origin is None:
@@ -3474,20 +3483,25 @@ class TextStatistics:
     word_count: int = -1
 
 
-@dataclass
+@dataclass(slots=True)
 class DocumentProgress:
     added: int = field(default=0, metadata=config(exclude=exclude_if_empty))
     removed: int = field(default=0, metadata=config(exclude=exclude_if_empty))
 
 
-@dataclass
+@dataclass(slots=True)
 class DocumentStatistics:
     wc: int = 0
     progress: Dict[str, DocumentProgress] = field(default_factory=dict, metadata=config(exclude=exclude_if_empty))
 
 
-@dataclass
-class Document(CharacterBased, SceneBased):
+class _DocumentCache(CharacterBased, SceneBased):
+    # runtime-only state of the slotted Document; not a field so it's never serialized
+    __slots__ = ('loaded', 'content', 'data', '_character', '_scene')
+
+
+@dataclass(slots=True)
+class Document(_DocumentCache):
     title: str
     id: uuid.UUID = field(default_factory=uuid.uuid4)
     type: DocumentType = DocumentType.DOCUMENT
@@ -3514,7 +3528,7 @@ class Document(CharacterBased, SceneBased):
 
     @overrides
     def __hash__(self):
-        return hash(str(self.id))
+        return hash(self.id)
 
     def __post_init__(self):
         self.loaded: bool = False
@@ -3544,7 +3558,7 @@ class ProductivityType(SelectionItem):
 
     @overrides
     def __hash__(self):
-        return hash(str(self.id))
+        return hash(self.id)
 
 
 class SnapshotType(Enum):
@@ -3642,7 +3656,7 @@ class ReaderQuestion:
 
     @overrides
     def __hash__(self):
-        return hash(str(self.id))
+        return hash(self.id)
 
 
 @dataclass
@@ -3674,7 +3688,7 @@ class Tag(SelectionItem):
 
     @overrides
     def __hash__(self):
-        return hash(str(self.id))
+        return hash(self.id)
 
 
 def default_general_tags() -> List[Tag]:
@@ -3756,7 +3770,7 @@ class Node(CharacterBased):
 
     @overrides
     def __hash__(self):
-        return hash(str(self.id))
+        return hash(self.id)
 
 
 def to_node(x: float, y: float, type: GraphicsItemType, subtype: str = '', default_size: int = 12) -> Node:
@@ -3833,7 +3847,7 @@ class Diagram:
 
     @overrides
     def __hash__(self):
-        return hash(str(self.id))
+        return hash(self.id)
 
 
 def default_character_networks() -> List[Diagram]:
@@ -4100,4 +4114,4 @@ class Novel(NovelDescriptor):
 
     @overrides
     def __hash__(self):
-        return hash(str(self.id))
+        return hash(self.id)
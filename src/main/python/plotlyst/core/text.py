@@ -17,11 +17,13 @@ GNU General Public License for more details.
 You should have received a copy of the GNU General Public License
 along with this program.  If not, see <https://www.gnu.org/licenses/>.
 """
+import math
 import re
+from dataclasses import dataclass
+from functools import lru_cache
 
-import nltk
+import pyphen
 from qttextedit import OBJECT_REPLACEMENT_CHARACTER
-from textstat import textstat
 
 from plotlyst.core.domain import StoryStructure
 
@@ -60,32 +62,101 @@ def parse_structure_to_richtext(structure: StoryStructure):
     return text
 
 
+_word_pattern = re.compile(r'[^\w\s\u2014]*\w[^\s\u2014]*')
+_punctuation_pattern = re.compile(r'[^\w\s]')
+_clean_translation = str.maketrans({**{c: ' ' for c in ',:;()-–—'},
+                                    **{c: None for c in '"\'“”«»‹›„‟’❝❞❮❯⹂〝〞〟＂‚‘‛❛❜❟'},
+                                    '!': '.', '?': '.'})
+_clean_patterns = [
+    (re.compile(r'^\s+'), ''),  # Remove whites pace
+    (re.compile(r'[ ]*(\n|\r\n|\r)[ ]*'), ' '),  # Remove new lines
+    (re.compile(r'([\.])[\. ]+'), '.'),  # Change all ".." to "."
+    (re.compile(r'[ ]*([\.])'), '. '),  # Normalize all "."`
+    (re.compile(r'\s+'), ' '),  # Remove multiple spaces
+    (re.compile(r'\s+$'), ''),  # Remove trailing spaces
+    (re.compile(r'\.(?! )'), '. '),  # Add space after period where missing
+    (re.compile(r'\,(?! )'), ', '),  # Add space after comma where missing
+    (re.compile(r' +'), ' '),  # Compress many spaces to one
+]
+_abbreviations = {'mr', 'mrs', 'ms', 'dr', 'prof', 'sr', 'jr', 'st', 'vs', 'mt', 'gen', 'col', 'lt', 'sgt', 'capt',
+                  'rev', 'hon', 'messrs'}
+
+_pyphen = None
+
+
 def wc(text: str) -> int:
-    text = re.sub(r'—', ' ', text)  # Override em dash to spaces
-    text = re.sub(OBJECT_REPLACEMENT_CHARACTER, '', text)
-    return textstat.lexicon_count(text)
+    text = text.replace(OBJECT_REPLACEMENT_CHARACTER, '')
+    return len(_word_pattern.findall(text))
 
 
 def clean_text(text: str):
-    text = re.sub(r'[,:;()\-–—]', ' ', text)  # Override commas, colons, etc to spaces/
-    text = re.sub(r'["\'“”«»‹›„‟’❝❞❮❯⹂〝〞〟＂‚‘‛❛❜❟]', '', text)  # Replace quotation marks
-    text = re.sub(r'[\.!?]', '.', text)  # Change all terminators like ! and ? to "."
-    text = re.sub(r'^\s+', '', text)  # Remove whites pace
-    text = re.sub(r'[ ]*(\n|\r\n|\r)[ ]*', ' ', text)  # Remove new lines
-    text = re.sub(r'([\.])[\. ]+', '.', text)  # Change all ".." to "."
-    text = re.sub(r'[ ]*([\.])', '. ', text)  # Normalize all "."`
-    text = re.sub(r'\s+', ' ', text)  # Remove multiple spaces
-    text = re.sub(r'\s+$', '', text)  # Remove trailing spaces
-    text = re.sub(r'\.(?! )', '. ', text)  # Add space after period where missing
-    text = re.sub(r'\,(?! )', ', ', text)  # Add space after comma where missing
-    text = re.sub(r' +', ' ', text)  # Compress many spaces to one
+    text = text.translate(_clean_translation)  # Override commas, colons, etc to spaces, replace quotation marks
+    for pattern, repl in _clean_patterns:
+        text = pattern.sub(repl, text)
 
     return text
 
 
 def sentence_count(text: str) -> int:
-    text = clean_text(text)
-    return len(nltk.text.sent_tokenize(text))
+    return _sentences(clean_text(text))
+
+
+def _sentences(cleaned_text: str) -> int:
+    count = 0
+    continued = False
+    for segment in cleaned_text.split('. '):
+        segment = segment.strip()
+        if not segment:
+            continue
+        if not continued:
+            count += 1
+        last_word = segment.rsplit(' ', 1)[-1].rstrip('.').lower()
+        continued = len(last_word) == 1 and last_word.isalpha() or last_word in _abbreviations
+
+    return count
+
+
+@lru_cache(maxsize=8192)
+def syllables(word: str) -> int:
+    global _pyphen
+    if _pyphen is None:
+        _pyphen = pyphen.Pyphen(lang='en_US')
+    return len(_pyphen.positions(word)) + 1
+
+
+@dataclass(frozen=True)
+class TextStatistics:
+    wc: int = 0
+    sentences: int = 0
+    lexicon: int = 0
+    syllables: int = 0
+
+    def __add__(self, other: 'TextStatistics') -> 'TextStatistics':
+        return TextStatistics(self.wc + other.wc, self.sentences + other.sentences, self.lexicon + other.lexicon,
+                              self.syllables + other.syllables)
+
+    def avg_sentence_length(self) -> float:
+        if not self.sentences:
+            return 0.0
+        return self.wc / self.sentences
+
+    def flesch_reading_ease(self) -> float:
+        sentence_length = _legacy_round(self.lexicon / self.sentences, 1) if self.sentences else 0.0
+        syllables_per_word = _legacy_round(self.syllables / self.lexicon, 1) if self.lexicon else 0.0
+        return _legacy_round(206.835 - 1.015 * sentence_length - 84.6 * syllables_per_word, 2)
+
+
+def _legacy_round(number: float, points: int) -> float:
+    p = 10 ** points
+    return float(math.floor((number * p) + math.copysign(0.5, number))) / p
+
+
+@lru_cache(maxsize=4096)
+def text_statistics(text: str) -> TextStatistics:
+    cleaned_text = clean_text(text)
+    lexicon = _punctuation_pattern.sub('', cleaned_text.lower())
+    syllable_count = sum(syllables(word) for word in lexicon.split(' ')) if lexicon else 0
+    return TextStatistics(wc(text), _sentences(cleaned_text), len(lexicon.split()), syllable_count)
 
 
 class HtmlString(str):
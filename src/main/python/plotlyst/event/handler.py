@@ -19,8 +19,13 @@ along with this program.  If not, see <https://www.gnu.org/licenses/>.
 """
 import asyncio
 import logging
+import time
 import traceback
-from typing import Optional, List, Dict, TypeVar
+import weakref
+from contextlib import contextmanager
+from dataclasses import dataclass, fields
+from enum import Enum
+from typing import Optional, List, Dict, TypeVar, Type, Callable, Tuple
 
 from PyQt6.QtCore import QTimer, Qt, QObject
 from PyQt6.QtGui import QCursor
@@ -30,6 +35,7 @@ from plotlyst.core.domain import Novel
 from plotlyst.env import app_env
 from plotlyst.event.core import EventLog, Severity, \
     emit_critical, EventListener, Event
+from plotlyst.service.diagnostics import latency_monitor
 from plotlyst.view.dialog.error import ErrorMessageBox
 from plotlyst.view.style.base import apply_color
 
@@ -90,35 +96,164 @@ def handle_exception(exception_type, exception_value: Exception, exception_trace
 TEvent = TypeVar('TEvent', bound=Event)
 
 
+@dataclass
+class ListenerTiming:
+    listener: str
+    calls: int = 0
+    total: float = 0.0
+    max: float = 0.0
+
+    def record(self, elapsed: float):
+        self.calls += 1
+        self.total += elapsed
+        if elapsed > self.max:
+            self.max = elapsed
+
+
 class EventDispatcher:
 
     def __init__(self):
-        self._listeners: Dict[TEvent, List[EventListener]] = {}
-
-    def register(self, listener: EventListener, *event_types):
+        self._listeners: Dict[Type[Event], Dict[int, Callable[[], Optional[EventListener]]]] = {}
+        self._resolved: Dict[Type[Event], List[Callable[[], Optional[EventListener]]]] = {}
+        self._batch_depth: int = 0
+        self._pending: Dict[Tuple, Event] = {}
+        self._profiling: bool = False
+        self._timings: Dict[str, ListenerTiming] = {}
+
+    def register(self, listener: EventListener, *event_types, weak: bool = False):
+        ref = self.__ref(listener, weak)
         for event_type in event_types:
             if event_type not in self._listeners.keys():
-                self._listeners[event_type] = []
-            self._listeners[event_type].append(listener)
+                self._listeners[event_type] = {}
+            self._listeners[event_type][id(listener)] = ref
+        self._resolved.clear()
         if isinstance(listener, QObject):
-            listener.destroyed.connect(lambda: self.deregister(listener, *event_types))
+            # capture only the id so that the slot does not keep a weakly registered listener alive
+            listener_id = id(listener)
+            listener.destroyed.connect(lambda: self.__deregister_id(listener_id, *event_types))
 
     def clear(self):
         self._listeners.clear()
+        self._resolved.clear()
+        self._pending.clear()
 
     def deregister(self, listener: EventListener, *event_types):
-        for event_type in event_types:
-            if event_type not in self._listeners.keys():
-                return
-            if listener in self._listeners[event_type]:
-                self._listeners[event_type].remove(listener)
+        self.__deregister_id(id(listener), *event_types)
 
     def dispatch(self, event: Event):
-        if type(event) in self._listeners.keys():
-            for listener in self._listeners[type(event)]:
-                if event.source != listener:
+        if self._batch_depth:
+            key = self.__coalesce_key(event)
+            self._pending.pop(key, None)
+            self._pending[key] = event
+            return
+
+        for ref in self.__resolve(type(event)):
+            listener = ref()
+            if listener is None:
+                self._resolved.clear()
+                continue
+            if event.source != listener:
+                if self._profiling:
+                    self.__timed_delivery(listener, event)
+                elif latency_monitor.enabled:
+                    with latency_monitor.section(self.__delivery_name(listener, event)):
+                        listener.event_received(event)
+                else:
                     listener.event_received(event)
 
+    @contextmanager
+    def batch(self):
+        """Collects the dispatched events and delivers them once the outermost batch is finished.
+
+        Events of the same type referring to the same entities are coalesced and only the latest one is delivered.
+        """
+        self._batch_depth += 1
+        try:
+            yield self
+        finally:
+            self._batch_depth -= 1
+            if self._batch_depth == 0:
+                self.flush()
+
+    def flush(self):
+        pending = list(self._pending.values())
+        self._pending.clear()
+        for event in pending:
+            self.dispatch(event)
+
+    def set_profiling_enabled(self, enabled: bool):
+        self._profiling = enabled
+
+    def profiling_enabled(self) -> bool:
+        return self._profiling
+
+    def timings(self) -> List[ListenerTiming]:
+        return sorted(self._timings.values(), key=lambda x: x.total, reverse=True)
+
+    def reset_timings(self):
+        self._timings.clear()
+
+    def __resolve(self, event_type: Type[Event]) -> List[Callable[[], Optional[EventListener]]]:
+        refs = self._resolved.get(event_type)
+        if refs is None:
+            merged: Dict[int, Callable[[], Optional[EventListener]]] = {}
+            for cls in reversed(event_type.__mro__):
+                if cls in self._listeners.keys():
+                    for listener_id, ref in list(self._listeners[cls].items()):
+                        if ref() is None:
+                            self._listeners[cls].pop(listener_id)
+                        else:
+                            merged[listener_id] = ref
+            refs = list(merged.values())
+            self._resolved[event_type] = refs
+
+        return refs
+
+    def __deregister_id(self, listener_id: int, *event_types):
+        for event_type in event_types:
+            if event_type not in self._listeners.keys():
+                continue
+            self._listeners[event_type].pop(listener_id, None)
+        self._resolved.clear()
+
+    def __timed_delivery(self, listener: EventListener, event: Event):
+        name = self.__delivery_name(listener, event)
+        start = time.perf_counter()
+        try:
+            with latency_monitor.section(name):
+                listener.event_received(event)
+        finally:
+            elapsed = time.perf_counter() - start
+            if name not in self._timings.keys():
+                self._timings[name] = ListenerTiming(name)
+            self._timings[name].record(elapsed)
+
+    @staticmethod
+    def __delivery_name(listener: EventListener, event: Event) -> str:
+        return f'{type(listener).__name__}.{type(event).__name__}'
+
+    @staticmethod
+    def __ref(listener: EventListener, weak: bool) -> Callable[[], Optional[EventListener]]:
+        if weak:
+            try:
+                return weakref.ref(listener)
+            except TypeError:
+                pass
+        return lambda: listener
+
+    @staticmethod
+    def __coalesce_key(event: Event) -> Tuple:
+        values = []
+        for field in fields(event):
+            if field.name == 'source':
+                continue
+            value = getattr(event, field.name)
+            if value is None or isinstance(value, (str, int, float, Enum)):
+                values.append(value)
+            else:
+                values.append(id(value))
+        return (type(event), *values)
+
 
 class EventDispatchersRepository:
     def __init__(self):
@@ -389,13 +389,27 @@ class DistributionFilterProxyModel(QSortFilterProxyModel):
     def __init__(self):
         super().__init__()
         self.acts_filter: Dict[int, bool] = {}
+        self._acts_version: int = -1
 
     def setActsFilter(self, act: int, filter: bool):
+        if self.acts_filter.get(act, True) == filter:
+            self.refreshActsFilter()
+            return
         self.acts_filter[act] = filter
-        self.invalidateFilter()
+        self._invalidateActsFilter()
 
     def resetActsFilter(self):
+        active = not all(self.acts_filter.values())
         self.acts_filter.clear()
+        if active:
+            self._invalidateActsFilter()
+
+    def refreshActsFilter(self):
+        if self._acts_version != acts_registry.version() and not all(self.acts_filter.values()):
+            self._invalidateActsFilter()
+
+    def _invalidateActsFilter(self):
+        self._acts_version = acts_registry.version()
         self.invalidateFilter()
 
     @overrides
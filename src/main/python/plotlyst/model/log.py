@@ -20,11 +20,12 @@ along with this program.  If not, see <https://www.gnu.org/licenses/>.
 from logging import LogRecord
 from typing import List
 
-from PyQt6.QtCore import QAbstractTableModel, Qt
+from PyQt6.QtCore import QAbstractTableModel, Qt, QModelIndex
 from PyQt6.QtWidgets import QApplication
 from overrides import overrides
 
 from plotlyst.common import RED_COLOR
+from plotlyst.service.diagnostics import StallOffender, latency_monitor
 from plotlyst.view.icons import IconRegistry
 
 
@@ -92,3 +93,53 @@ class LogTableModel(QAbstractTableModel):
                 elif section == 2:
                     return "Timestamp"
         return None
+
+
+class StallTableModel(QAbstractTableModel):
+    OffenderRole = Qt.ItemDataRole.UserRole + 1
+    ColSource = 0
+    ColCount = 1
+    ColMax = 2
+    ColTotal = 3
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self._offenders: List[StallOffender] = latency_monitor.offenders()
+        latency_monitor.stallDetected.connect(self.refresh)
+
+    @overrides
+    def rowCount(self, parent: QModelIndex = QModelIndex()) -> int:
+        return len(self._offenders)
+
+    @overrides
+    def columnCount(self, parent: QModelIndex = QModelIndex()) -> int:
+        return 4
+
+    @overrides
+    def data(self, index: QModelIndex, role: int = Qt.ItemDataRole.DisplayRole):
+        offender = self._offenders[index.row()]
+        if role == self.OffenderRole:
+            return offender
+        if role == Qt.ItemDataRole.DisplayRole:
+            if index.column() == self.ColSource:
+                return offender.source
+            if index.column() == self.ColCount:
+                return offender.count
+            if index.column() == self.ColMax:
+                return f'{offender.max * 1000:.0f} ms'
+            if index.column() == self.ColTotal:
+                return f'{offender.total * 1000:.0f} ms'
+        if role == Qt.ItemDataRole.ToolTipRole and offender.stack:
+            return '\n'.join(offender.stack)
+        if role == Qt.ItemDataRole.TextAlignmentRole and index.column() != self.ColSource:
+            return Qt.AlignmentFlag.AlignRight | Qt.AlignmentFlag.AlignVCenter
+
+    @overrides
+    def headerData(self, section, orientation, role=Qt.ItemDataRole.DisplayRole):
+        if role == Qt.ItemDataRole.DisplayRole and orientation == Qt.Orientation.Horizontal:
+            return ['Source', 'Stalls', 'Worst', 'Total'][section]
+
+    def refresh(self):
+        self.beginResetModel()
+        self._offenders = latency_monitor.offenders()
+        self.endResetModel()
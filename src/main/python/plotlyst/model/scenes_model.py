@@ -18,16 +18,16 @@ You should have received a copy of the GNU General Public License
 along with this program.  If not, see <https://www.gnu.org/licenses/>.
 """
 import pickle
-from typing import List, Any, Dict, Optional
+from typing import List, Any, Dict, Optional, Union
 
 import emoji
 from PyQt6.QtCore import QModelIndex, Qt, QVariant, QSortFilterProxyModel, QMimeData, QByteArray, pyqtSignal, \
-    QAbstractTableModel
+    QAbstractTableModel, QAbstractItemModel
 from PyQt6.QtGui import QBrush, QColor
 from PyQt6.QtWidgets import QApplication
 from overrides import overrides
 
-from plotlyst.core.domain import Novel, Scene, CharacterArc, Character, \
+from plotlyst.core.domain import Novel, Scene, CharacterArc, Character, Chapter, \
     SelectionItem, SceneStage, SceneStructureAgenda, ScenePurposeType
 from plotlyst.event.core import emit_event
 from plotlyst.events import SceneStatusChangedEvent
@@ -242,6 +242,7 @@ class ScenesFilterProxyModel(QSortFilterProxyModel):
         super().__init__()
         self.character_filter: Dict[str, bool] = {}
         self.acts_filter: Dict[int, bool] = {}
+        self._acts_version: int = -1
         self.empty_pov_filter: bool = False
 
     def setCharacterFilter(self, character: Character, filter: bool):
@@ -249,17 +250,30 @@ class ScenesFilterProxyModel(QSortFilterProxyModel):
         self.invalidateFilter()
 
     def setActsFilter(self, act: int, filter: bool):
+        if self.acts_filter.get(act, True) == filter:
+            self.refreshActsFilter()
+            return
         self.acts_filter[act] = filter
-        self.invalidateFilter()
+        self._invalidateActsFilter()
 
     def resetActsFilter(self):
+        active = not all(self.acts_filter.values())
         self.acts_filter.clear()
-        self.invalidateFilter()
+        if active:
+            self._invalidateActsFilter()
+
+    def refreshActsFilter(self):
+        if self._acts_version != acts_registry.version() and not all(self.acts_filter.values()):
+            self._invalidateActsFilter()
 
     def setEmptyPovFilter(self, filter: bool):
         self.empty_pov_filter = filter
         self.invalidateFilter()
 
+    def _invalidateActsFilter(self):
+        self._acts_version = acts_registry.version()
+        self.invalidateFilter()
+
     @overrides
     def filterAcceptsRow(self, source_row: int, source_parent: QModelIndex) -> bool:
         filtered = super(ScenesFilterProxyModel, self).filterAcceptsRow(source_row, source_parent)
@@ -408,3 +422,220 @@ class SceneConflictsModel(SelectionItemsModel):
                 else:
                     return IconRegistry.conflict_type_icon(conflict.type)
         return super(SceneConflictsModel, self).data(index, role)
+
+
+class ScenesTreeMimeData(QMimeData):
+    def __init__(self, item: Union[Chapter, Scene]):
+        super().__init__()
+        self.item = item
+
+
+class ScenesTreeModel(QAbstractItemModel):
+    """Two-level chapter/scene tree over the novel.
+
+    Chapters come first at the top level, followed by the scenes that don't belong to any chapter.
+    The rows are plain lookups into the novel so a view only pays for the rows it paints."""
+    itemMoved = pyqtSignal(object)
+    SceneRole = Qt.ItemDataRole.UserRole + 1
+    ChapterRole = Qt.ItemDataRole.UserRole + 2
+
+    MimeType: str = 'application/tree-scene-item'
+
+    def __init__(self, novel: Novel, parent=None):
+        super().__init__(parent)
+        self._novel = novel
+        self._chapters: List[Chapter] = []
+        self._children: Dict[Chapter, List[Scene]] = {}
+        self._orphans: List[Scene] = []
+        self._rows: Dict[Union[Chapter, Scene], int] = {}
+        self._scene_numbers: Dict[Scene, int] = {}
+        self._build()
+
+    def novel(self) -> Novel:
+        return self._novel
+
+    def refresh(self):
+        self.beginResetModel()
+        self._build()
+        self.endResetModel()
+
+    def applyOrder(self):
+        """Rewrites the scene order of the novel to follow the tree: chapter by chapter, then the scenes without chapter."""
+        self._build()
+        self._reorderScenes()
+        self.refresh()
+
+    def refreshScene(self, scene: Scene):
+        index = self.indexOf(scene)
+        if index.isValid():
+            self.dataChanged.emit(index, index)
+
+    def indexOf(self, item: Union[Chapter, Scene]) -> QModelIndex:
+        row = self._rows.get(item)
+        if row is None:
+            return QModelIndex()
+        return self.createIndex(row, 0, item)
+
+    def chapterScenes(self, chapter: Chapter) -> List[Scene]:
+        return list(self._children.get(chapter, []))
+
+    @overrides
+    def index(self, row: int, column: int, parent: QModelIndex = QModelIndex()) -> QModelIndex:
+        if column != 0 or row < 0:
+            return QModelIndex()
+        if parent.isValid():
+            scenes = self._children.get(parent.internalPointer())
+            if scenes is None or row >= len(scenes):
+                return QModelIndex()
+            return self.createIndex(row, 0, scenes[row])
+
+        if row < len(self._chapters):
+            return self.createIndex(row, 0, self._chapters[row])
+        row_ = row - len(self._chapters)
+        if row_ >= len(self._orphans):
+            return QModelIndex()
+        return self.createIndex(row, 0, self._orphans[row_])
+
+    @overrides
+    def parent(self, index: QModelIndex) -> QModelIndex:
+        if not index.isValid():
+            return QModelIndex()
+        item = index.internalPointer()
+        if isinstance(item, Scene) and item.chapter is not None and item.chapter in self._children:
+            return self.indexOf(item.chapter)
+        return QModelIndex()
+
+    @overrides
+    def rowCount(self, parent: QModelIndex = QModelIndex()) -> int:
+        if not parent.isValid():
+            return len(self._chapters) + len(self._orphans)
+        item = parent.internalPointer()
+        if isinstance(item, Chapter):
+            return len(self._children.get(item, []))
+        return 0
+
+    @overrides
+    def columnCount(self, parent: QModelIndex = QModelIndex()) -> int:
+        return 1
+
+    @overrides
+    def hasChildren(self, parent: QModelIndex = QModelIndex()) -> bool:
+        return self.rowCount(parent) > 0
+
+    @overrides
+    def data(self, index: QModelIndex, role: int = Qt.ItemDataRole.DisplayRole) -> Any:
+        if not index.isValid():
+            return QVariant()
+        item = index.internalPointer()
+        if role == Qt.ItemDataRole.DisplayRole:
+            if isinstance(item, Chapter):
+                return item.display_name()
+            return item.title if item.title else f'Scene {self._scene_numbers.get(item, 0) + 1}'
+        if role == self.SceneRole:
+            return item if isinstance(item, Scene) else None
+        if role == self.ChapterRole:
+            return item if isinstance(item, Chapter) else None
+        return QVariant()
+
+    @overrides
+    def flags(self, index: QModelIndex) -> Qt.ItemFlag:
+        if not index.isValid():
+            return Qt.ItemFlag.ItemIsDropEnabled
+        flags = Qt.ItemFlag.ItemIsEnabled | Qt.ItemFlag.ItemIsSelectable | Qt.ItemFlag.ItemIsDragEnabled
+        if isinstance(index.internalPointer(), Chapter):
+            flags |= Qt.ItemFlag.ItemIsDropEnabled
+        return flags
+
+    @overrides
+    def supportedDropActions(self) -> Qt.DropAction:
+        return Qt.DropAction.MoveAction
+
+    @overrides
+    def mimeTypes(self) -> List[str]:
+        return [self.MimeType]
+
+    @overrides
+    def mimeData(self, indexes: List[QModelIndex]) -> QMimeData:
+        mime_data = ScenesTreeMimeData(indexes[0].internalPointer())
+        mime_data.setData(self.MimeType, QByteArray())
+        return mime_data
+
+    @overrides
+    def canDropMimeData(self, data: QMimeData, action: Qt.DropAction, row: int, column: int,
+                        parent: QModelIndex) -> bool:
+        if not isinstance(data, ScenesTreeMimeData):
+            return False
+        if isinstance(data.item, Chapter):
+            return not parent.isValid() or isinstance(parent.internalPointer(), Chapter)
+        return True
+
+    @overrides
+    def dropMimeData(self, data: QMimeData, action: Qt.DropAction, row: int, column: int, parent: QModelIndex) -> bool:
+        if not self.canDropMimeData(data, action, row, column, parent):
+            return False
+
+        target = parent.internalPointer() if parent.isValid() else None
+        if isinstance(data.item, Chapter):
+            if target is not None:
+                row = self._rows[target]
+            self._moveChapter(data.item, row)
+        else:
+            if target is None:
+                row = max(0, row - len(self._chapters)) if row >= 0 else -1
+            elif row < 0:
+                row = 0
+            self._moveScene(data.item, target, row)
+
+        self.refresh()
+        self.itemMoved.emit(data.item)
+        return True
+
+    def _moveChapter(self, chapter: Chapter, row: int):
+        chapters = self._novel.chapters
+        old_row = chapters.index(chapter)
+        if row < 0 or row > len(chapters):
+            row = len(chapters)
+        if old_row < row:
+            row -= 1
+        chapters.insert(row, chapters.pop(old_row))
+        self._novel.update_chapter_titles()
+        self._reorderScenes()
+
+    def _moveScene(self, scene: Scene, chapter: Optional[Chapter], row: int):
+        source = self._children[scene.chapter] if scene.chapter in self._children else self._orphans
+        target = self._children[chapter] if chapter is not None else self._orphans
+        old_row = source.index(scene)
+        if row < 0 or row > len(target):
+            row = len(target)
+        if source is target and old_row < row:
+            row -= 1
+        source.pop(old_row)
+        target.insert(row, scene)
+        scene.chapter = chapter
+        self._reorderScenes()
+
+    def _reorderScenes(self):
+        scenes = []
+        for chapter in self._novel.chapters:
+            scenes.extend(self._children.get(chapter, []))
+        scenes.extend(self._orphans)
+        self._novel.scenes[:] = scenes
+
+    def _build(self):
+        self._chapters = list(self._novel.chapters)
+        self._children = {chapter: [] for chapter in self._chapters}
+        self._orphans = []
+        self._rows.clear()
+        self._scene_numbers.clear()
+
+        for i, chapter in enumerate(self._chapters):
+            self._rows[chapter] = i
+        for i, scene in enumerate(self._novel.scenes):
+            self._scene_numbers[scene] = i
+            scenes = self._children.get(scene.chapter) if scene.chapter is not None else None
+            if scenes is None:
+                scenes = self._orphans
+                self._rows[scene] = len(self._chapters) + len(scenes)
+            else:
+                self._rows[scene] = len(scenes)
+            scenes.append(scene)
@@ -17,73 +17,145 @@ GNU General Public License for more details.
 You should have received a copy of the GNU General Public License
 along with this program.  If not, see <https://www.gnu.org/licenses/>.
 """
-from typing import Optional, Dict, Set, Any, List
+from datetime import date, timedelta
+from typing import Optional, Dict, Set, Any, List, Tuple
 from uuid import UUID
 
 from overrides import overrides
 
 from plotlyst.common import recursive
-from plotlyst.core.domain import Novel, Scene, StoryBeat, Character, Location, NovelDescriptor
+from plotlyst.core.domain import Novel, Scene, StoryBeat, Character, Location, NovelDescriptor, DocumentProgress, \
+    ProductivityType, Comment, Chapter
 from plotlyst.event.core import EventListener, Event
 from plotlyst.event.handler import event_dispatchers
-from plotlyst.events import SceneChangedEvent, SceneDeletedEvent, SceneStoryBeatChangedEvent, \
-    CharacterChangedEvent, CharacterDeletedEvent, LocationAddedEvent, LocationDeletedEvent, WorldEntityAddedEvent, \
-    WorldEntityDeletedEvent, ItemLinkedEvent, ItemUnlinkedEvent
+from plotlyst.events import SceneChangedEvent, SceneDeletedEvent, SceneStoryBeatChangedEvent, SceneAddedEvent, \
+    SceneOrderChangedEvent, CharacterChangedEvent, CharacterDeletedEvent, LocationAddedEvent, LocationDeletedEvent, \
+    WorldEntityAddedEvent, WorldEntityDeletedEvent, ItemLinkedEvent, ItemUnlinkedEvent
 
 
 class NovelActsRegistry(EventListener):
-
+    # acts are kept as a prefix scan: every scene stores the act carried over to the next one,
+    # so a beat change is recomputed only until the carried act converges again
     def __init__(self):
         self.novel: Optional[Novel] = None
-        self._acts_per_scenes: Dict[Scene, int] = {}
+        self._beats_per_scene: Dict[Scene, Optional[StoryBeat]] = {}
+        self._indexes: Dict[Scene, int] = {}
+        self._acts: List[int] = []
+        self._carry: List[int] = []
         self._beats: Set[StoryBeat] = set()
         self._scenes_per_beats: Dict[StoryBeat, Scene] = {}
+        self._dirty_scenes: Set[Scene] = set()
+        self._reindex: bool = False
+        self._version: int = 0
 
     def set_novel(self, novel: Novel):
         self.novel = novel
         dispatcher = event_dispatchers.instance(self.novel)
-        dispatcher.register(self, SceneChangedEvent, SceneDeletedEvent, SceneStoryBeatChangedEvent)
+        dispatcher.register(self, SceneChangedEvent, SceneDeletedEvent, SceneStoryBeatChangedEvent, SceneAddedEvent,
+                            SceneOrderChangedEvent)
         self.refresh()
 
     @overrides
     def event_received(self, event: Event):
-        if self.novel:
-            self.refresh()
-
-    def refresh(self):
-        self._acts_per_scenes.clear()
-        self._scenes_per_beats.clear()
-        self._beats.clear()
-
-        act = 1
-        for index, scene in enumerate(self.novel.scenes):
-            beat: StoryBeat = scene.beat(self.novel)
-            if beat is None:
-                self._acts_per_scenes[scene] = act
-                continue
+        if self.novel is None:
+            return
 
-            self._beats.add(beat)
-            self._scenes_per_beats[beat] = scene
-            if beat.act > act and not beat.ends_act:
-                act = beat.act
+        if isinstance(event, (SceneChangedEvent, SceneStoryBeatChangedEvent)):
+            self._dirty_scenes.add(event.scene)
+        elif isinstance(event, SceneDeletedEvent):
+            self._dirty_scenes.discard(event.scene)
+            self._beats_per_scene.pop(event.scene, None)
+            self._reindex = True
+        elif isinstance(event, (SceneAddedEvent, SceneOrderChangedEvent)):
+            self._reindex = True
 
-            self._acts_per_scenes[scene] = act
+    def refresh(self):
+        self._dirty_scenes.clear()
+        self._reindex = False
+        self._beats_per_scene.clear()
+        for scene in self.novel.scenes:
+            self._beats_per_scene[scene] = scene.beat(self.novel)
+        self._rebuild()
 
-            if beat.ends_act:
-                act = beat.act + 1
+    def version(self) -> int:
+        self._sync()
+        return self._version
 
     def act(self, scene: Scene) -> int:
-        return self._acts_per_scenes.get(scene, 1)
+        self._sync()
+        index = self._indexes.get(scene)
+        if index is None:
+            return 1
+        return self._acts[index]
 
     def occupied_beats(self) -> Set[StoryBeat]:
+        self._sync()
         return self._beats
 
     def scene(self, beat: StoryBeat) -> Optional[Scene]:
+        self._sync()
         return self._scenes_per_beats.get(beat)
 
     def occupied(self, beat: StoryBeat) -> bool:
+        self._sync()
         return beat in self._scenes_per_beats.keys()
 
+    def _sync(self):
+        if self.novel is None or not (self._dirty_scenes or self._reindex):
+            return
+
+        changed_indexes: List[int] = []
+        for scene in self._dirty_scenes:
+            beat = scene.beat(self.novel)
+            if scene in self._beats_per_scene.keys() and self._beats_per_scene[scene] is beat:
+                continue
+            self._beats_per_scene[scene] = beat
+            index = self._indexes.get(scene)
+            if index is not None:
+                changed_indexes.append(index)
+        self._dirty_scenes.clear()
+
+        if self._reindex:
+            self._reindex = False
+            for scene in self.novel.scenes:
+                if scene not in self._beats_per_scene.keys():
+                    self._beats_per_scene[scene] = scene.beat(self.novel)
+            self._rebuild()
+        elif changed_indexes:
+            self._recompute(min(changed_indexes), max(changed_indexes))
+            self._refreshBeats()
+            self._version += 1
+
+    def _rebuild(self):
+        self._indexes = {scene: i for i, scene in enumerate(self.novel.scenes)}
+        self._acts = [1] * len(self.novel.scenes)
+        self._carry = [1] * len(self.novel.scenes)
+        self._recompute(0, len(self.novel.scenes) - 1, converge=False)
+        self._refreshBeats()
+        self._version += 1
+
+    def _recompute(self, start: int, end: int, converge: bool = True):
+        act = self._carry[start - 1] if start > 0 else 1
+        for index in range(start, len(self.novel.scenes)):
+            beat = self._beats_per_scene.get(self.novel.scenes[index])
+            if beat is not None and beat.act > act and not beat.ends_act:
+                act = beat.act
+            self._acts[index] = act
+            if beat is not None and beat.ends_act:
+                act = beat.act + 1
+
+            if converge and index >= end and self._carry[index] == act:
+                break
+            self._carry[index] = act
+
+    def _refreshBeats(self):
+        self._scenes_per_beats.clear()
+        for scene in self.novel.scenes:
+            beat = self._beats_per_scene.get(scene)
+            if beat is not None:
+                self._scenes_per_beats[beat] = scene
+        self._beats = set(self._scenes_per_beats.keys())
+
 
 acts_registry = NovelActsRegistry()
 
@@ -125,12 +197,17 @@ class EntitiesRegistry(EventListener):
         if self.novel is None:
             return
 
-        if isinstance(event, (CharacterChangedEvent, CharacterDeletedEvent)):
-            self._refreshCharacters()
+        if isinstance(event, CharacterChangedEvent):
+            self._characters[str(event.character.id)] = event.character
+            if len(self._characters) != len(self.novel.characters):
+                # characters were added without an event of their own
+                self._refreshCharacters()
+        elif isinstance(event, CharacterDeletedEvent):
+            self._characters.pop(str(event.character.id), None)
         elif isinstance(event, LocationAddedEvent):
-            self._refreshLocations()
+            self.__addLocation(event.location)
         elif isinstance(event, LocationDeletedEvent):
-            self._refreshLocations()
+            self.__removeLocation(event.location)
             self._references.pop(str(event.location.id), None)
         elif isinstance(event, WorldEntityAddedEvent):
             if event.entity.ref:
@@ -157,13 +234,9 @@ class EntitiesRegistry(EventListener):
             self._characters[str(character.id)] = character
 
     def _refreshLocations(self):
-        def addChild(_: Location, child: Location):
-            self._locations[str(child.id)] = child
-
         self._locations.clear()
         for location in self.novel.locations:
-            self._locations[str(location.id)] = location
-            recursive(location, lambda parent: parent.children, addChild)
+            self.__addLocation(location)
 
     def _refreshReferences(self):
         def addChild(_: Any, child: Any):
@@ -175,6 +248,20 @@ class EntitiesRegistry(EventListener):
                 self.__addReference(entity.ref, entity)
             recursive(entity, lambda parent: parent.children, addChild)
 
+    def __addLocation(self, location: Location):
+        def addChild(_: Location, child: Location):
+            self._locations[str(child.id)] = child
+
+        self._locations[str(location.id)] = location
+        recursive(location, lambda parent: parent.children, addChild)
+
+    def __removeLocation(self, location: Location):
+        def removeChild(_: Location, child: Location):
+            self._locations.pop(str(child.id), None)
+
+        self._locations.pop(str(location.id), None)
+        recursive(location, lambda parent: parent.children, removeChild)
+
     def __addReference(self, id: UUID, ref: Any):
         if str(id) not in self._references.keys():
             self._references[str(id)] = []
@@ -187,6 +274,173 @@ class EntitiesRegistry(EventListener):
 entities_registry = EntitiesRegistry()
 
 
+class NovelProgressRegistry:
+    # progress is indexed by date and the productivity streaks are extended when a day is recorded,
+    # so calendars look up a single key and the streak is never counted by walking the days again
+    def __init__(self):
+        self.novel: Optional[Novel] = None
+        self._days: Dict[date, DocumentProgress] = {}
+        self._productivity: Dict[date, ProductivityType] = {}
+        self._productivity_streaks: Dict[date, int] = {}
+
+    def set_novel(self, novel: Novel):
+        self.novel = novel
+        self.refresh()
+
+    def track(self, novel: Novel):
+        if self.novel is not novel:
+            self.set_novel(novel)
+
+    def refresh(self):
+        self._days.clear()
+        self._productivity.clear()
+        self._productivity_streaks.clear()
+
+        for date_str, progress in sorted(self.novel.manuscript_progress.items()):
+            day = self.__parse(date_str)
+            if day:
+                self.add_progress(day, progress.added, progress.removed)
+
+        categories = {str(x.id): x for x in self.novel.productivity.categories}
+        for date_str, ref in sorted(self.novel.productivity.progress.items()):
+            day = self.__parse(date_str)
+            if day and ref in categories:
+                self.set_productivity(day, categories[ref])
+
+    def add_progress(self, day: date, added: int, removed: int):
+        progress = self._days.get(day)
+        if progress is None:
+            progress = DocumentProgress()
+            self._days[day] = progress
+        progress.added += added
+        progress.removed += removed
+
+    def set_productivity(self, day: date, category: ProductivityType):
+        self._productivity[day] = category
+        if day not in self._productivity_streaks:
+            self.__extendStreak(self._productivity_streaks, day)
+
+    def day_progress(self, day: date) -> Optional[DocumentProgress]:
+        return self._days.get(day)
+
+    def productivity(self, day: date) -> Optional[ProductivityType]:
+        return self._productivity.get(day)
+
+    def productivity_streak(self, day: Optional[date] = None) -> int:
+        return self.__streak(self._productivity_streaks, day)
+
+    @staticmethod
+    def __extendStreak(streaks: Dict[date, int], day: date):
+        streaks[day] = streaks.get(day - timedelta(days=1), 0) + 1
+        next_day = day + timedelta(days=1)
+        while next_day in streaks:
+            streaks[next_day] = streaks[next_day - timedelta(days=1)] + 1
+            next_day += timedelta(days=1)
+
+    @staticmethod
+    def __streak(streaks: Dict[date, int], day: Optional[date]) -> int:
+        if day is None:
+            day = date.today()
+        if day in streaks:
+            return streaks[day]
+        return streaks.get(day - timedelta(days=1), 0)
+
+    @staticmethod
+    def __parse(date_str: str) -> Optional[date]:
+        try:
+            return date.fromisoformat(date_str)
+        except ValueError:
+            return None
+
+
+progress_registry = NovelProgressRegistry()
+
+
+class CommentsRegistry(EventListener):
+    # comments are indexed as they are added, edited or removed, so filtering them
+    # never walks the scenes without comments or lowercases every text again
+    def __init__(self):
+        self.novel: Optional[Novel] = None
+        self._scenes: Set[Scene] = set()
+        self._ordered: Optional[List[Scene]] = None
+        self._texts: Dict[UUID, str] = {}
+
+    def set_novel(self, novel: Novel):
+        self.novel = novel
+        dispatcher = event_dispatchers.instance(self.novel)
+        dispatcher.register(self, SceneAddedEvent, SceneDeletedEvent, SceneOrderChangedEvent)
+        self.refresh()
+
+    @overrides
+    def event_received(self, event: Event):
+        if self.novel is None:
+            return
+
+        if isinstance(event, SceneAddedEvent):
+            for comment in event.scene.comments:
+                self.comment_added(event.scene, comment)
+        elif isinstance(event, SceneDeletedEvent):
+            for comment in event.scene.comments:
+                self._texts.pop(comment.id, None)
+            self._scenes.discard(event.scene)
+        self._ordered = None
+
+    def refresh(self):
+        self._scenes.clear()
+        self._texts.clear()
+        self._ordered = None
+        for scene in self.novel.scenes:
+            for comment in scene.comments:
+                self.comment_added(scene, comment)
+
+    def count(self) -> int:
+        return len(self._texts)
+
+    def comment_added(self, scene: Scene, comment: Comment):
+        if scene not in self._scenes:
+            self._scenes.add(scene)
+            self._ordered = None
+        self._texts[comment.id] = comment.text.lower()
+
+    def comment_changed(self, comment: Comment):
+        if comment.id in self._texts:
+            self._texts[comment.id] = comment.text.lower()
+
+    def comment_removed(self, scene: Scene, comment: Comment):
+        self._texts.pop(comment.id, None)
+        if not scene.comments:
+            self._scenes.discard(scene)
+            self._ordered = None
+
+    def comments(self, scene: Optional[Scene] = None, chapter: Optional[Chapter] = None,
+                 resolved: Optional[bool] = None, text: str = '') -> List[Tuple[Scene, Comment]]:
+        if scene is not None:
+            scenes = [scene] if scene in self._scenes else []
+        else:
+            scenes = self._orderedScenes()
+            if chapter is not None:
+                scenes = [x for x in scenes if x.chapter is chapter]
+
+        text = text.lower()
+        result = []
+        for scene_ in scenes:
+            for comment in scene_.comments:
+                if resolved is not None and comment.resolved != resolved:
+                    continue
+                if text and text not in self._texts.get(comment.id, comment.text.lower()):
+                    continue
+                result.append((scene_, comment))
+        return result
+
+    def _orderedScenes(self) -> List[Scene]:
+        if self._ordered is None:
+            self._ordered = [x for x in self.novel.scenes if x in self._scenes]
+        return self._ordered
+
+
+comments_registry = CommentsRegistry()
+
+
 def try_location(item) -> Optional[Location]:
     if item.ref:
         location = entities_registry.location(str(item.ref))
@@ -194,3 +448,115 @@ def try_location(item) -> Optional[Location]:
             return location
         else:
             item.ref = None
+
+
+class LibraryIndex:
+    """Indexes the novels of the workspace by series and by their searchable text.
+
+    Changes are applied per novel, so that the library can be updated in place instead of being rebuilt. A novel whose
+    series is not indexed is treated as a top-level novel.
+    """
+
+    def __init__(self):
+        self._novels: Dict[UUID, NovelDescriptor] = {}
+        self._parents: Dict[UUID, Optional[UUID]] = {}
+        self._children: Dict[UUID, List[NovelDescriptor]] = {}
+        self._texts: Dict[UUID, str] = {}
+
+    def set_novels(self, novels: List[NovelDescriptor]):
+        self._novels.clear()
+        self._parents.clear()
+        self._children.clear()
+        self._texts.clear()
+        for novel in novels:
+            self.add(novel)
+
+    def novels(self) -> List[NovelDescriptor]:
+        return list(self._novels.values())
+
+    def novel(self, id: UUID) -> Optional[NovelDescriptor]:
+        return self._novels.get(id)
+
+    def add(self, novel: NovelDescriptor):
+        self._novels[novel.id] = novel
+        self._parents[novel.id] = novel.parent
+        self._texts[novel.id] = self._text(novel)
+        if novel.parent:
+            self._addChild(novel)
+
+    def remove(self, novel: NovelDescriptor):
+        self._novels.pop(novel.id, None)
+        self._texts.pop(novel.id, None)
+        parent = self._parents.pop(novel.id, None)
+        if parent:
+            self._removeChild(parent, novel)
+
+    def update(self, novel: NovelDescriptor) -> bool:
+        """Re-indexes the novel and returns whether its position in the library changed."""
+        self._texts[novel.id] = self._text(novel)
+        parent = self._parents.get(novel.id)
+        if parent != novel.parent:
+            if parent:
+                self._removeChild(parent, novel)
+            self._parents[novel.id] = novel.parent
+            if novel.parent:
+                self._addChild(novel)
+            return True
+        if parent:
+            siblings = self._children[parent]
+            i = siblings.index(novel)
+            if (i > 0 and siblings[i - 1].sequence > novel.sequence) or (
+                    i < len(siblings) - 1 and siblings[i + 1].sequence < novel.sequence):
+                siblings.sort(key=lambda x: x.sequence)
+                return True
+        return False
+
+    def series(self, novel: NovelDescriptor) -> Optional[NovelDescriptor]:
+        if novel.parent:
+            return self._novels.get(novel.parent)
+
+    def children(self, series: NovelDescriptor) -> List[NovelDescriptor]:
+        return list(self._children.get(series.id, []))
+
+    def top_level(self) -> List[NovelDescriptor]:
+        return [x for x in self._novels.values() if self.series(x) is None]
+
+    def siblings(self, novel: NovelDescriptor) -> List[NovelDescriptor]:
+        series = self.series(novel)
+        if series is None:
+            return self.top_level()
+        return self._children[series.id]
+
+    def filter(self, text: str) -> Set[UUID]:
+        """Returns the novels matching every word of the text in their title, subtitle or series title,
+        together with the series that contain them."""
+        terms = text.lower().split()
+        if not terms:
+            return set(self._novels.keys())
+
+        matches = set()
+        for id_, novel in self._novels.items():
+            series = self.series(novel)
+            text = self._texts[id_] if series is None else f'{self._texts[id_]}\n{self._texts[series.id]}'
+            if all(term in text for term in terms):
+                matches.add(id_)
+                if series is not None:
+                    matches.add(series.id)
+        return matches
+
+    def _addChild(self, novel: NovelDescriptor):
+        children = self._children.setdefault(novel.parent, [])
+        i = len(children)
+        while i > 0 and children[i - 1].sequence > novel.sequence:
+            i -= 1
+        children.insert(i, novel)
+
+    def _removeChild(self, parent: UUID, novel: NovelDescriptor):
+        children = self._children.get(parent, [])
+        if novel in children:
+            children.remove(novel)
+        if not children:
+            self._children.pop(parent, None)
+
+    def _text(self, novel: NovelDescriptor) -> str:
+        return f'{novel.title}\n{novel.subtitle}'.lower()
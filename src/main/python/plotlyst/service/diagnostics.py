@@ -0,0 +1,265 @@
+"""
+Plotlyst
+Copyright (C) 2021-2024  Zsolt Kovari
+
+This file is part of Plotlyst.
+
+Plotlyst is free software: you can redistribute it and/or modify
+it under the terms of the GNU General Public License as published by
+the Free Software Foundation, either version 3 of the License, or
+(at your option) any later version.
+
+Plotlyst is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+GNU General Public License for more details.
+
+You should have received a copy of the GNU General Public License
+along with this program.  If not, see <https://www.gnu.org/licenses/>.
+"""
+import functools
+import json
+import os
+import platform
+import sys
+import threading
+import time
+from collections import deque
+from contextlib import contextmanager, nullcontext
+from dataclasses import dataclass, field
+from datetime import datetime
+from typing import List, Dict, Optional, Deque, Any, Callable
+
+from PyQt6.QtCore import QObject, QTimer, pyqtSignal, QT_VERSION_STR
+
+UNATTRIBUTED = 'Qt event loop'
+
+
+@dataclass
+class Stall:
+    source: str
+    duration: float
+    timestamp: float = field(default_factory=time.time)
+    stack: List[str] = field(default_factory=list)
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {'source': self.source, 'duration_ms': round(self.duration * 1000, 1),
+                'time': datetime.fromtimestamp(self.timestamp).isoformat(timespec='seconds'), 'stack': self.stack}
+
+
+@dataclass
+class StallOffender:
+    source: str
+    count: int = 0
+    total: float = 0.0
+    max: float = 0.0
+    stack: List[str] = field(default_factory=list)
+
+    def record(self, stall: Stall):
+        self.count += 1
+        self.total += stall.duration
+        if stall.duration >= self.max:
+            self.max = stall.duration
+            if stall.stack:
+                self.stack = stall.stack
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {'source': self.source, 'count': self.count, 'total_ms': round(self.total * 1000, 1),
+                'max_ms': round(self.max * 1000, 1), 'stack': self.stack}
+
+
+class LatencyMonitor(QObject):
+    """Detects main-thread stalls and attributes them to the slowest monitored section.
+
+    Sections are the event listener deliveries and the functions decorated with @monitored. A stall that happens
+    outside of any section is caught by a heartbeat timer and attributed from a stack sample that a watchdog thread
+    takes while the main thread is blocked. When disabled, a section costs a single attribute check.
+    """
+    stallDetected = pyqtSignal(Stall)
+
+    def __init__(self, threshold: float = 0.1, heartbeat: float = 0.05, capacity: int = 100, offenders: int = 50):
+        super().__init__()
+        self.enabled: bool = False
+        self._threshold = threshold
+        self._heartbeat = heartbeat
+        self._max_offenders = offenders
+        self._recent: Deque[Stall] = deque(maxlen=capacity)
+        self._offenders: Dict[str, StallOffender] = {}
+        self._reported: int = 0
+        self._last_stall: Optional[Stall] = None
+        self._sections: Dict[str, Callable[[], Dict[str, Any]]] = {}
+
+        self._timer: Optional[QTimer] = None
+        self._last_beat: float = 0.0
+        self._beat_reported: int = 0
+        self._lock = threading.Lock()
+        self._stop = threading.Event()
+        self._watchdog: Optional[threading.Thread] = None
+        self._sampled_stack: List[str] = []
+
+    def threshold(self) -> float:
+        return self._threshold
+
+    def set_threshold(self, threshold: float):
+        self._threshold = threshold
+
+    def set_enabled(self, enabled: bool):
+        if enabled == self.enabled:
+            return
+        self.enabled = enabled
+        if enabled:
+            self._start()
+        else:
+            self._stop_watching()
+
+    def section(self, name: str):
+        if not self.enabled:
+            return nullcontext()
+        return self._section(name)
+
+    def record(self, name: str, elapsed: float, stack: Optional[List[str]] = None) -> Optional[Stall]:
+        if elapsed < self._threshold:
+            return None
+        stall = Stall(name, elapsed, stack=stack if stack else [])
+        self._reported += 1
+        self._last_stall = stall
+        self._recent.append(stall)
+
+        offender = self._offenders.get(name)
+        if offender is None:
+            if len(self._offenders) >= self._max_offenders:
+                least = min(self._offenders.values(), key=lambda x: x.total)
+                del self._offenders[least.source]
+            offender = StallOffender(name)
+            self._offenders[name] = offender
+        offender.record(stall)
+
+        self.stallDetected.emit(stall)
+        return stall
+
+    def offenders(self) -> List[StallOffender]:
+        return sorted(self._offenders.values(), key=lambda x: x.total, reverse=True)
+
+    def recent(self) -> List[Stall]:
+        return list(self._recent)
+
+    def add_report_section(self, name: str, provider: Callable[[], Dict[str, Any]]):
+        self._sections[name] = provider
+
+    def clear(self):
+        self._recent.clear()
+        self._offenders.clear()
+        self._last_stall = None
+
+    def report(self) -> Dict[str, Any]:
+        report = {
+            'created': datetime.now().isoformat(timespec='seconds'),
+            'platform': platform.platform(),
+            'python': platform.python_version(),
+            'qt': QT_VERSION_STR,
+            'threshold_ms': round(self._threshold * 1000, 1),
+            'offenders': [x.to_dict() for x in self.offenders()],
+            'recent': [x.to_dict() for x in reversed(self._recent)],
+        }
+        for name, provider in self._sections.items():
+            report[name] = provider()
+        return report
+
+    def export(self, path: str):
+        with open(path, 'w', encoding='utf-8') as f:
+            json.dump(self.report(), f, indent=2)
+
+    @contextmanager
+    def _section(self, name: str):
+        reported = self._reported
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            # a nested section that was already reported is the more precise culprit
+            if self._reported == reported:
+                self.record(name, time.perf_counter() - start)
+
+    def _start(self):
+        if self._timer is None:
+            self._timer = QTimer(self)
+            self._timer.setInterval(int(self._heartbeat * 1000))
+            self._timer.timeout.connect(self._beat)
+        self._last_beat = time.perf_counter()
+        self._beat_reported = self._reported
+        self._timer.start()
+
+        self._stop = threading.Event()
+        self._watchdog = threading.Thread(target=self._watch, args=(self._stop,), name='plotlyst-latency-watchdog',
+                                          daemon=True)
+        self._watchdog.start()
+
+    def _stop_watching(self):
+        if self._timer is not None:
+            self._timer.stop()
+        self._stop.set()
+        self._watchdog = None
+
+    def _beat(self):
+        now = time.perf_counter()
+        with self._lock:
+            lag = now - self._last_beat - self._heartbeat
+            stack = self._sampled_stack
+            self._sampled_stack = []
+            self._last_beat = now
+
+        if lag >= self._threshold:
+            if self._reported == self._beat_reported:
+                self.record(_source(stack), lag, stack)
+            elif self._last_stall is not None and not self._last_stall.stack:
+                self._last_stall.stack = stack
+        self._beat_reported = self._reported
+
+    def _watch(self, stop: threading.Event):
+        main_id = threading.main_thread().ident
+        interval = self._threshold / 2
+        while not stop.wait(interval):
+            with self._lock:
+                if self._sampled_stack or time.perf_counter() - self._last_beat < self._heartbeat + self._threshold:
+                    continue
+                frame = sys._current_frames().get(main_id)
+                if frame is not None:
+                    self._sampled_stack = _format_stack(frame)
+
+
+def _format_stack(frame, limit: int = 20) -> List[str]:
+    stack = []
+    while frame is not None and len(stack) < limit:
+        code = frame.f_code
+        stack.append(f'{_relative(code.co_filename)}:{frame.f_lineno} in {code.co_name}')
+        frame = frame.f_back
+    return stack
+
+
+def _relative(path: str) -> str:
+    parts = path.replace(os.sep, '/').split('/plotlyst/')
+    return f'plotlyst/{parts[-1]}' if len(parts) > 1 else os.path.basename(path)
+
+
+def _source(stack: List[str]) -> str:
+    for line in stack:
+        path = line.split(':')[0]
+        if path.startswith('plotlyst/') and path not in ('plotlyst/__main__.py', 'plotlyst/service/diagnostics.py'):
+            return f"{path}:{line.split(' in ')[-1]}"
+    return UNATTRIBUTED
+
+
+latency_monitor = LatencyMonitor()
+
+
+def monitored(func):
+    name = func.__qualname__
+
+    @functools.wraps(func)
+    def wrapper(*args, **kwargs):
+        if not latency_monitor.enabled:
+            return func(*args, **kwargs)
+        with latency_monitor._section(name):
+            return func(*args, **kwargs)
+
+    return wrapper
@@ -18,10 +18,13 @@ You should have received a copy of the GNU General Public License
 along with this program.  If not, see <https://www.gnu.org/licenses/>.
 """
 import logging
-from typing import Optional, Set
+import time
+from dataclasses import dataclass, field
+from enum import Enum
+from typing import Optional, Set, Dict, Callable
 
 import language_tool_python
-from PyQt6.QtCore import QRunnable
+from PyQt6.QtCore import QRunnable, QObject, QTimer, QThreadPool, pyqtSignal, Qt
 from language_tool_python import LanguageTool
 from language_tool_python.download_lt import LATEST_VERSION
 from overrides import overrides
@@ -32,20 +35,226 @@ from plotlyst.event.handler import event_dispatchers
 from plotlyst.events import LanguageToolSet, CharacterChangedEvent, RequestMilieuDictionaryResetEvent
 
 
+class LanguageToolState(Enum):
+    STARTING = 'starting'
+    READY = 'ready'
+    FAILED = 'failed'
+    STOPPED = 'stopped'
+
+
+@dataclass
+class LanguageToolInstance:
+    lang: str
+    state: LanguageToolState = LanguageToolState.STARTING
+    tool: Optional[LanguageTool] = None
+    error: Optional[str] = None
+    last_used: float = field(default_factory=time.monotonic)
+
+    def is_alive(self) -> bool:
+        if self.tool is None:
+            return False
+        server = getattr(self.tool, '_server', None)
+        return server is None or server.poll() is None
+
+
+def create_language_tool(lang: str) -> LanguageTool:
+    tool = language_tool_python.LanguageTool(lang, config={'cacheSize': 1000, 'pipelineCaching': True})
+    tool.check('Test sentence.')
+    return tool
+
+
 class LanguageToolServerSetupWorker(QRunnable):
 
-    def __init__(self, lang: str = 'en-US'):
+    def __init__(self, lang: str, pool: 'LanguageToolPool'):
         super(LanguageToolServerSetupWorker, self).__init__()
         self.lang = lang
+        self._pool = pool
 
     @overrides
     def run(self) -> None:
         try:
-            tool = language_tool_python.LanguageTool(self.lang, config={'cacheSize': 1000, 'pipelineCaching': True})
-            tool.check('Test sentence.')
+            tool = self._pool.factory(self.lang)
+        except Exception as e:
+            self._pool.started.emit(self.lang, None, str(e))
+        else:
+            self._pool.started.emit(self.lang, tool, '')
+
+
+class LanguageToolPool(QObject):
+    """Local LanguageTool servers keyed by language.
+
+    A server is started lazily the first time a language is activated. Once max_instances servers run, activating
+    another language switches the least recently used server to it instead of starting a new JVM, which is instant.
+    By default a single server is kept; more instances only trade memory for keeping other languages' caches warm.
+    Inactive servers are closed after idle_timeout seconds.
+    """
+    started = pyqtSignal(str, object, str)
+    stateChanged = pyqtSignal(str, LanguageToolState)
+
+    def __init__(self, factory: Callable[[str], LanguageTool] = create_language_tool, max_instances: int = 1,
+                 idle_timeout: float = 15 * 60):
+        super().__init__()
+        self.factory = factory
+        self._max_instances = max_instances
+        self._idle_timeout = idle_timeout
+        self._instances: Dict[str, LanguageToolInstance] = {}
+        self._active: Optional[str] = None
+        self._closed = False
+        self._timer: Optional[QTimer] = None
+        self.started.connect(self._started, Qt.ConnectionType.QueuedConnection)
+
+    def is_started(self) -> bool:
+        return self._active is not None
+
+    def active_language(self) -> Optional[str]:
+        return self._active
+
+    def instance(self, lang: str) -> Optional[LanguageToolInstance]:
+        return self._instances.get(lang)
+
+    def status(self) -> Dict[str, LanguageToolState]:
+        return {lang: instance.state for lang, instance in self._instances.items()}
+
+    def activate(self, lang: str):
+        self._closed = False
+        self._active = lang
+        instance = self._instances.get(lang)
+        if instance is not None and instance.state == LanguageToolState.READY and not instance.is_alive():
+            self._set_state(instance, LanguageToolState.STOPPED)
+            instance = None
+
+        if instance is None or instance.state in (LanguageToolState.STOPPED, LanguageToolState.FAILED):
+            reusable = self._reusable()
+            if reusable is not None:
+                self._switch(reusable, lang)
+            else:
+                self._start(lang)
+        elif instance.state == LanguageToolState.READY:
+            instance.last_used = time.monotonic()
+            language_tool_proxy.set(instance.tool)
+        else:
+            language_tool_proxy.reset()
+
+        if self._timer is None:
+            self._timer = QTimer(self)
+            self._timer.setInterval(60 * 1000)
+            self._timer.timeout.connect(self.maintain)
+        if not self._timer.isActive():
+            self._timer.start()
+
+    def maintain(self):
+        now = time.monotonic()
+        for instance in list(self._instances.values()):
+            if instance.state != LanguageToolState.READY:
+                continue
+            if instance.lang == self._active:
+                instance.last_used = now
+                if not instance.is_alive():
+                    logging.warning(f'LanguageTool server for {instance.lang} stopped unexpectedly. Restarting...')
+                    self.activate(instance.lang)
+            elif now - instance.last_used > self._idle_timeout or not instance.is_alive():
+                self._shutdown(instance)
+
+    def close(self):
+        self._closed = True
+        self._active = None
+        if self._timer is not None:
+            self._timer.stop()
+        language_tool_proxy.reset()
+        for instance in list(self._instances.values()):
+            self._shutdown(instance)
+
+    def _started(self, lang: str, tool: Optional[LanguageTool], error: str):
+        instance = self._instances.get(lang)
+        if instance is None or instance.state != LanguageToolState.STARTING or self._closed:
+            if tool is not None:
+                tool.close()
+            return
+
+        if tool is None:
+            instance.error = error
+            self._set_state(instance, LanguageToolState.FAILED)
+            if lang == self._active:
+                language_tool_proxy.set_error(error)
+            return
+
+        instance.tool = tool
+        instance.error = None
+        instance.last_used = time.monotonic()
+        logging.info(f'Grammar checker was set up for {lang} with version {LATEST_VERSION}.')
+        self._set_state(instance, LanguageToolState.READY)
+        if lang == self._active:
+            emit_info('Grammar checker was set up.')
             language_tool_proxy.set(tool)
+
+    def _start(self, lang: str):
+        language_tool_proxy.reset()
+        instance = LanguageToolInstance(lang)
+        self._instances[lang] = instance
+        self._evict()
+        emit_info('Start initializing grammar checker...')
+        self._set_state(instance, LanguageToolState.STARTING)
+        QThreadPool.globalInstance().start(LanguageToolServerSetupWorker(lang, self))
+
+    def _reusable(self) -> Optional[LanguageToolInstance]:
+        alive = [x for x in self._instances.values() if
+                 x.state in (LanguageToolState.STARTING, LanguageToolState.READY)]
+        if len(alive) < self._max_instances:
+            return None
+        candidates = [x for x in alive if
+                      x.lang != self._active and x.state == LanguageToolState.READY and x.is_alive()]
+        if not candidates:
+            return None
+        return min(candidates, key=lambda x: x.last_used)
+
+    def _switch(self, instance: LanguageToolInstance, lang: str):
+        self._instances.pop(lang, None)
+        try:
+            instance.tool.language = lang
         except Exception as e:
+            failed = LanguageToolInstance(lang, error=str(e))
+            self._instances[lang] = failed
+            self._set_state(failed, LanguageToolState.FAILED)
             language_tool_proxy.set_error(str(e))
+            return
+
+        self._instances.pop(instance.lang, None)
+        self.stateChanged.emit(instance.lang, LanguageToolState.STOPPED)
+        instance.lang = lang
+        instance.last_used = time.monotonic()
+        self._instances[lang] = instance
+        self._set_state(instance, LanguageToolState.READY)
+        logging.info(f'Grammar checker was switched to {lang}.')
+        # the same tool is set again so that the listeners check their text in the new language
+        language_tool_proxy.reset()
+        language_tool_proxy.set(instance.tool)
+
+    def _evict(self):
+        alive = [x for x in self._instances.values() if
+                 x.state in (LanguageToolState.STARTING, LanguageToolState.READY)]
+        while len(alive) > self._max_instances:
+            candidates = [x for x in alive if x.lang != self._active and x.state == LanguageToolState.READY]
+            if not candidates:
+                break
+            lru = min(candidates, key=lambda x: x.last_used)
+            self._shutdown(lru)
+            alive.remove(lru)
+
+    def _shutdown(self, instance: LanguageToolInstance):
+        if instance.tool is not None:
+            try:
+                instance.tool.close()
+            except Exception as e:
+                logging.warning(f'Could not close LanguageTool server for {instance.lang}: {e}')
+            instance.tool = None
+            logging.info(f'LanguageTool server for {instance.lang} was shut down.')
+        if instance.state != LanguageToolState.STOPPED:
+            self._set_state(instance, LanguageToolState.STOPPED)
+        self._instances.pop(instance.lang, None)
+
+    def _set_state(self, instance: LanguageToolInstance, state: LanguageToolState):
+        instance.state = state
+        self.stateChanged.emit(instance.lang, state)
 
 
 class LanguageToolProxy:
@@ -55,17 +264,22 @@ class LanguageToolProxy:
         self._error: Optional[str] = None
 
     def set(self, language_tool: LanguageTool):
+        if language_tool is self._language_tool:
+            return
         self._language_tool = language_tool
         self._error = None
-        logging.info(f'Grammar checker was set up with version {LATEST_VERSION}.')
-        emit_info('Grammar checker was set up.')
         emit_global_event(LanguageToolSet(self, self._language_tool))
 
     def set_error(self, error_msg: str):
+        self._language_tool = None
         self._error = error_msg
         logging.error(self._error)
         emit_info('Could not initialize LanguageTool grammar checker')
 
+    def reset(self):
+        self._language_tool = None
+        self._error = None
+
     def is_set(self) -> bool:
         return self._language_tool is not None
 
@@ -85,6 +299,7 @@ class LanguageToolProxy:
 
 
 language_tool_proxy = LanguageToolProxy()
+language_tool_pool = LanguageToolPool()
 
 
 class Dictionary(EventListener):
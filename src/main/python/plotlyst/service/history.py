@@ -0,0 +1,305 @@
+"""
+Plotlyst
+Copyright (C) 2021-2024  Zsolt Kovari
+
+This file is part of Plotlyst.
+
+Plotlyst is free software: you can redistribute it and/or modify
+it under the terms of the GNU General Public License as published by
+the Free Software Foundation, either version 3 of the License, or
+(at your option) any later version.
+
+Plotlyst is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+GNU General Public License for more details.
+
+You should have received a copy of the GNU General Public License
+along with this program.  If not, see <https://www.gnu.org/licenses/>.
+"""
+import hashlib
+import json
+import os
+import uuid
+import zlib
+from dataclasses import dataclass, field, fields
+from datetime import datetime
+from pathlib import Path
+from typing import List, Dict, Optional, Tuple, Union
+
+from atomicwrites import atomic_write
+from dataclasses_json import dataclass_json, Undefined
+
+from plotlyst.core.client import json_client, FileChange
+from plotlyst.core.domain import Novel, Scene, Document
+
+Tree = Dict[str, Union[str, 'Tree']]
+
+
+@dataclass_json(undefined=Undefined.EXCLUDE)
+@dataclass
+class SnapshotSummary:
+    added: Dict[str, int] = field(default_factory=dict)
+    removed: Dict[str, int] = field(default_factory=dict)
+    modified: Dict[str, int] = field(default_factory=dict)
+
+    def is_empty(self) -> bool:
+        return not self.added and not self.removed and not self.modified
+
+    def __str__(self):
+        if self.is_empty():
+            return 'No changes'
+        parts = []
+        for label, counts in [('added', self.added), ('removed', self.removed), ('changed', self.modified)]:
+            for kind, count in sorted(counts.items()):
+                parts.append(f'{count} {kind} {label}')
+        return ', '.join(parts)
+
+
+@dataclass_json(undefined=Undefined.EXCLUDE)
+@dataclass
+class NovelSnapshot:
+    tree: str
+    created: str
+    label: str = ''
+    id: str = field(default_factory=lambda: uuid.uuid4().hex)
+    summary: SnapshotSummary = field(default_factory=SnapshotSummary)
+
+    def created_at(self) -> datetime:
+        return datetime.fromisoformat(self.created)
+
+
+@dataclass
+class SnapshotDiff:
+    added: List[str] = field(default_factory=list)
+    removed: List[str] = field(default_factory=list)
+    modified: List[str] = field(default_factory=list)
+
+    def summary(self) -> SnapshotSummary:
+        summary = SnapshotSummary()
+        for paths, counts in [(self.added, summary.added), (self.removed, summary.removed),
+                              (self.modified, summary.modified)]:
+            for path in paths:
+                kind = _kind(path)
+                counts[kind] = counts.get(kind, 0) + 1
+        return summary
+
+
+def _kind(path: str) -> str:
+    parts = path.split('/')
+    if len(parts) > 3 and parts[2] in ('scenes', 'characters', 'docs', 'diagrams', 'images'):
+        return parts[2]
+    return 'novel'
+
+
+class SnapshotStore:
+    """Content-addressed storage of novel snapshots.
+
+    Files and directories are stored as zlib-compressed blobs named after the SHA-256 hash of their content, like
+    git objects. A directory is a JSON tree that maps the entry names to their hashes, so a snapshot only adds new
+    blobs for the files and directories that changed since any previous snapshot.
+    """
+
+    def __init__(self, root: Path):
+        self._root = root
+        self._objects_dir = root.joinpath('objects')
+        self._snapshots_path = root.joinpath('snapshots.json')
+        self._index_path = root.joinpath('index.json')
+
+    def snapshots(self) -> List[NovelSnapshot]:
+        if not self._snapshots_path.exists():
+            return []
+        with open(self._snapshots_path, encoding='utf-8') as json_file:
+            return [NovelSnapshot.from_dict(x) for x in json.load(json_file)]
+
+    def snapshot(self, id: str) -> Optional[NovelSnapshot]:
+        for snapshot in self.snapshots():
+            if snapshot.id == id or snapshot.id.startswith(id):
+                return snapshot
+
+    def take(self, workspace: Path, files: List[Path], label: str = '') -> NovelSnapshot:
+        index: Dict[str, List] = self._read_index()
+        updated_index: Dict[str, List] = {}
+        tree: Tree = {}
+        for file in files:
+            path = file.relative_to(workspace).as_posix()
+            stat = file.stat()
+            cached = index.get(path)
+            if cached and cached[0] == stat.st_mtime_ns and cached[1] == stat.st_size and self._has(cached[2]):
+                hash_ = cached[2]
+            else:
+                hash_ = self.write_blob(file.read_bytes())
+            updated_index[path] = [stat.st_mtime_ns, stat.st_size, hash_]
+
+            node = tree
+            parts = path.split('/')
+            for part in parts[:-1]:
+                node = node.setdefault(part, {})
+            node[parts[-1]] = hash_
+
+        snapshots = self.snapshots()
+        snapshot = NovelSnapshot(self._write_tree(tree), datetime.now().isoformat(timespec='seconds'), label)
+        if snapshots:
+            snapshot.summary = self.diff(snapshots[-1].tree, snapshot.tree).summary()
+        else:
+            snapshot.summary = SnapshotDiff(added=sorted(self.files(snapshot.tree).keys())).summary()
+        snapshots.append(snapshot)
+
+        self._write_json(self._snapshots_path, [x.to_dict() for x in snapshots])
+        self._write_json(self._index_path, updated_index)
+        return snapshot
+
+    def files(self, tree_hash: str, prefix: str = '') -> Dict[str, str]:
+        files = {}
+        for name, (type_, hash_) in self._read_tree(tree_hash).items():
+            path = f'{prefix}{name}'
+            if type_ == 't':
+                files.update(self.files(hash_, f'{path}/'))
+            else:
+                files[path] = hash_
+        return files
+
+    def file(self, tree_hash: str, path: str) -> Optional[bytes]:
+        hash_ = tree_hash
+        for part in path.split('/'):
+            entry = self._read_tree(hash_).get(part)
+            if entry is None:
+                return None
+            hash_ = entry[1]
+        return self.read_blob(hash_)
+
+    def diff(self, old_tree: str, new_tree: str, prefix: str = '') -> SnapshotDiff:
+        diff = SnapshotDiff()
+        if old_tree == new_tree:
+            return diff
+
+        old = self._read_tree(old_tree)
+        new = self._read_tree(new_tree)
+        for name in sorted(set(old.keys()) | set(new.keys())):
+            path = f'{prefix}{name}'
+            old_entry = old.get(name)
+            new_entry = new.get(name)
+            if old_entry == new_entry:
+                continue
+            if old_entry and new_entry and old_entry[0] == new_entry[0] == 't':
+                sub_diff = self.diff(old_entry[1], new_entry[1], f'{path}/')
+                diff.added.extend(sub_diff.added)
+                diff.removed.extend(sub_diff.removed)
+                diff.modified.extend(sub_diff.modified)
+            elif old_entry and new_entry and old_entry[0] == new_entry[0] == 'b':
+                diff.modified.append(path)
+            else:
+                if old_entry:
+                    diff.removed.extend(self._paths(old_entry, path))
+                if new_entry:
+                    diff.added.extend(self._paths(new_entry, path))
+        return diff
+
+    def size(self) -> int:
+        return sum(x.stat().st_size for x in self._root.rglob('*') if x.is_file())
+
+    def write_blob(self, data: bytes) -> str:
+        hash_ = hashlib.sha256(data).hexdigest()
+        if not self._has(hash_):
+            path = self._blob_path(hash_)
+            path.parent.mkdir(parents=True, exist_ok=True)
+            with atomic_write(path, mode='wb', overwrite=True) as f:
+                f.write(zlib.compress(data))
+        return hash_
+
+    def read_blob(self, hash_: str) -> bytes:
+        with open(self._blob_path(hash_), 'rb') as blob:
+            return zlib.decompress(blob.read())
+
+    def _has(self, hash_: str) -> bool:
+        return self._blob_path(hash_).exists()
+
+    def _blob_path(self, hash_: str) -> Path:
+        return self._objects_dir.joinpath(hash_[:2], hash_[2:])
+
+    def _write_tree(self, tree: Tree) -> str:
+        entries = {}
+        for name, value in tree.items():
+            if isinstance(value, dict):
+                entries[name] = ['t', self._write_tree(value)]
+            else:
+                entries[name] = ['b', value]
+        return self.write_blob(json.dumps(entries, sort_keys=True).encode('utf-8'))
+
+    def _read_tree(self, hash_: str) -> Dict[str, List[str]]:
+        return json.loads(self.read_blob(hash_))
+
+    def _paths(self, entry: List[str], path: str) -> List[str]:
+        if entry[0] == 't':
+            return sorted(self.files(entry[1], f'{path}/').keys())
+        return [path]
+
+    def _read_index(self) -> Dict[str, List]:
+        if not self._index_path.exists():
+            return {}
+        with open(self._index_path, encoding='utf-8') as json_file:
+            return json.load(json_file)
+
+    def _write_json(self, path: Path, data):
+        self._root.mkdir(parents=True, exist_ok=True)
+        with atomic_write(path, encoding='utf-8', overwrite=True) as f:
+            f.write(json.dumps(data))
+
+
+def snapshot_store(novel: Novel) -> SnapshotStore:
+    return SnapshotStore(json_client.root_path.joinpath('history', str(novel.id)))
+
+
+def take_snapshot(novel: Novel, label: str = '') -> NovelSnapshot:
+    return snapshot_store(novel).take(json_client.root_path, json_client.novel_files(novel), label)
+
+
+def list_snapshots(novel: Novel) -> List[NovelSnapshot]:
+    return snapshot_store(novel).snapshots()
+
+
+def snapshot_diff(novel: Novel, old: NovelSnapshot, new: NovelSnapshot) -> SnapshotDiff:
+    return snapshot_store(novel).diff(old.tree, new.tree)
+
+
+def _relative(path: Path) -> str:
+    return path.relative_to(json_client.root_path).as_posix()
+
+
+def restore_scene(novel: Novel, snapshot: NovelSnapshot, scene: Scene, manuscript: bool = True) -> bool:
+    store = snapshot_store(novel)
+    data = store.file(snapshot.tree, _relative(json_client.scene_file(novel, scene)))
+    if data is None:
+        return False
+
+    restored = json_client.scene_from_json(novel, data.decode('utf-8'))
+    excluded = {'id', 'arcs'} if manuscript else {'id', 'arcs', 'manuscript'}
+    for f in fields(Scene):
+        if f.name not in excluded:
+            setattr(scene, f.name, getattr(restored, f.name))
+    json_client.update_scene(scene)
+
+    if manuscript and scene.manuscript:
+        restore_document(novel, snapshot, scene.manuscript)
+
+    return True
+
+
+def restore_document(novel: Novel, snapshot: NovelSnapshot, document: Document) -> bool:
+    path = json_client.document_file(novel, document)
+    if path is None:
+        return False
+    data = snapshot_store(novel).file(snapshot.tree, _relative(path))
+    if data is None:
+        return False
+
+    json_client.apply_changes([FileChange(_relative(path), data=data)])
+    document.loaded = False
+    document.content = ''
+    json_client.load_document(novel, document)
+    return True
+
+
+def history_size(novel: Novel) -> Tuple[int, int]:
+    novel_size = sum(os.path.getsize(x) for x in json_client.novel_files(novel))
+    return novel_size, snapshot_store(novel).size()
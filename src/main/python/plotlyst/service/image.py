@@ -44,8 +44,7 @@ def save_clipboard_image(novel: Novel) -> Optional[LoadedImage]:
     if mime_data.hasImage():
         image: QImage = mime_data.imageData()
         if not image.isNull():
-            ref = ImageRef('png')
-            save_image(novel, image, ref)
+            ref = save_image(novel, image, ImageRef('png'))
             return LoadedImage(ref, image)
 
 
@@ -59,13 +58,12 @@ def upload_image(novel: Novel) -> Optional[LoadedImage]:
             return
 
         file_extension = Path(file_path).suffix.lower()
-        ref = ImageRef(file_extension)
-        save_image(novel, image, ref)
+        ref = save_image(novel, image, ImageRef(file_extension))
         return LoadedImage(ref, image)
 
 
-def save_image(novel: Novel, image: QImage, ref: ImageRef):
-    json_client.save_image(novel, ref, image)
+def save_image(novel: Novel, image: QImage, ref: ImageRef) -> ImageRef:
+    return json_client.save_image(novel, ref, image)
 
 
 def load_image(novel: Novel, ref: ImageRef) -> Optional[QImage]:
@@ -0,0 +1,81 @@
+"""
+Plotlyst
+Copyright (C) 2021-2024  Zsolt Kovari
+
+This file is part of Plotlyst.
+
+Plotlyst is free software: you can redistribute it and/or modify
+it under the terms of the GNU General Public License as published by
+the Free Software Foundation, either version 3 of the License, or
+(at your option) any later version.
+
+Plotlyst is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+GNU General Public License for more details.
+
+You should have received a copy of the GNU General Public License
+along with this program.  If not, see <https://www.gnu.org/licenses/>.
+"""
+import json
+import logging
+from dataclasses import dataclass, field
+from typing import Set, List
+
+from plotlyst.core.client import json_client
+from plotlyst.core.domain import Novel
+
+
+@dataclass
+class ImageCleanupResult:
+    removed: List[str] = field(default_factory=list)
+    reclaimed: int = 0
+
+    def __str__(self):
+        return f'{len(self.removed)} orphaned images removed, {self.reclaimed / 1024:.1f} KB reclaimed'
+
+
+def referenced_images(novel: Novel) -> Set[str]:
+    """Returns the file names of the images that are referenced by any persisted file of the novel."""
+    images = set(json_client.image_files(novel))
+    references = set()
+    for path in json_client.novel_files(novel):
+        if path.suffix != '.json' or path in images:
+            continue
+        try:
+            with open(path, encoding='utf-8') as json_file:
+                data = json.load(json_file)
+        except ValueError:
+            logging.warning(f'Could not parse {path} while looking for image references')
+            continue
+        _collect_image_refs(data, references)
+    return references
+
+
+def remove_orphan_images(novel: Novel, dry_run: bool = False) -> ImageCleanupResult:
+    """Removes the image files under the novel's images directory that nothing references anymore.
+
+    References are looked up in the persisted files, so pending changes should be flushed first.
+    """
+    references = referenced_images(novel)
+    result = ImageCleanupResult()
+    for path in json_client.image_files(novel):
+        if path.name in references:
+            continue
+        result.removed.append(path.name)
+        result.reclaimed += path.stat().st_size
+        if not dry_run:
+            json_client.remove_image_file(path)
+    return result
+
+
+def _collect_image_refs(data, references: Set[str]):
+    if isinstance(data, dict):
+        if data.keys() == {'extension', 'id'}:
+            references.add(f"{data['id']}.{data['extension']}")
+        else:
+            for value in data.values():
+                _collect_image_refs(value, references)
+    elif isinstance(data, list):
+        for value in data:
+            _collect_image_refs(value, references)
@@ -17,21 +17,24 @@ GNU General Public License for more details.
 You should have received a copy of the GNU General Public License
 along with this program.  If not, see <https://www.gnu.org/licenses/>.
 """
+import logging
 from abc import abstractmethod
+from collections import OrderedDict
 from pathlib import Path
-from typing import Dict, List
+from typing import Dict, List, Optional, Set, Tuple
 from uuid import UUID
 
-from PyQt6.QtCore import QObject, QRunnable, pyqtSignal
+from PyQt6.QtCore import QObject, QRunnable, pyqtSignal, QThreadPool
 from PyQt6.QtGui import QIcon
 from overrides import overrides
 from qthandy import busy
 
 from plotlyst.core.client import json_client
-from plotlyst.core.domain import Novel, Character, Chapter, Scene
+from plotlyst.core.domain import Novel, Character, Chapter, Scene, NovelDescriptor, StoryType
 from plotlyst.core.scrivener import ScrivenerParser
 from plotlyst.event.core import emit_event
-from plotlyst.events import NovelSyncEvent, NovelAboutToSyncEvent, CharacterDeletedEvent, \
+from plotlyst.event.handler import event_dispatchers
+from plotlyst.events import NovelSyncEvent, NovelAboutToSyncEvent, CharacterDeletedEvent, CharacterChangedEvent, \
     SceneDeletedEvent
 from plotlyst.resources import ResourceType
 from plotlyst.service.persistence import RepositoryPersistenceManager, flush_or_fail, delete_character, \
@@ -117,14 +120,15 @@ class ScrivenerSyncImporter(SyncImporter):
         new_novel = self._parser.parse_project(novel.import_origin.source)
         flush_or_fail()
 
-        self._sync_characters(novel, new_novel)
-        for scene in novel.scenes:
-            scene.chapter = None
-        self._sync_chapters(novel, new_novel)
-        new_scenes, removed_scenes = self._sync_scenes(novel, new_novel)
+        with event_dispatchers.instance(novel).batch():
+            self._sync_characters(novel, new_novel)
+            for scene in novel.scenes:
+                scene.chapter = None
+            self._sync_chapters(novel, new_novel)
+            new_scenes, removed_scenes = self._sync_scenes(novel, new_novel)
 
-        self.repo.update_project_novel(novel)
-        emit_event(novel, NovelSyncEvent(self, novel, new_scenes, removed_scenes))
+            self.repo.update_project_novel(novel)
+            emit_event(novel, NovelSyncEvent(self, novel, new_scenes, removed_scenes))
 
     def _mod_time(self, novel: Novel) -> int:
         scriv_file = self._parser.find_scrivener_file(novel.import_origin.source)
@@ -145,6 +149,7 @@ class ScrivenerSyncImporter(SyncImporter):
             else:
                 novel.characters.append(new_character)
                 self.repo.insert_character(novel, new_character)
+                emit_event(novel, CharacterChangedEvent(self, new_character))
 
         for character, update in updates.items():
             if update:
@@ -232,15 +237,89 @@ class NovelLoadingResult(QObject):
         self.finished.emit(novel)
 
 
-class NovelLoaderWorker(QRunnable):
+class SeriesNovelCache(QObject):
+    """Read-only cache of the other novels of a series.
+
+    Novels are fetched in the background and kept, up to the capacity, until any of their files changes on disk.
+    The cached novels are shared, so callers must copy whatever they import from them.
+    """
+    _loaded = pyqtSignal(object, object, object)
+
+    def __init__(self, capacity: int = 3):
+        super().__init__()
+        self._capacity = capacity
+        self._novels: OrderedDict[UUID, Tuple[Novel, Tuple[int, ...]]] = OrderedDict()
+        self._loading: Set[UUID] = set()
+        self._waiting: Dict[UUID, List[NovelLoadingResult]] = {}
+        self._loaded.connect(self._loadingFinished)
+
+    def novel(self, id: UUID) -> Optional[Novel]:
+        cached = self._novels.get(id)
+        if cached is None:
+            return None
+        novel, stamp = cached
+        if stamp != json_client.novel_stamp(id):
+            del self._novels[id]
+            return None
+        self._novels.move_to_end(id)
+        return novel
+
+    def fetch(self, id: UUID, result: NovelLoadingResult):
+        novel = self.novel(id)
+        if novel is not None:
+            result.emit_success(novel)
+            return
+        self._waiting.setdefault(id, []).append(result)
+        self._load(id)
+
+    def preload(self, novels: List[NovelDescriptor]):
+        for descriptor in novels[:self._capacity]:
+            if descriptor.story_type == StoryType.Novel and self.novel(descriptor.id) is None:
+                self._load(descriptor.id)
+
+    def invalidate(self, id: Optional[UUID] = None):
+        if id is None:
+            self._novels.clear()
+        else:
+            self._novels.pop(id, None)
+
+    def _load(self, id: UUID):
+        if id in self._loading:
+            return
+        self._loading.add(id)
+        QThreadPool.globalInstance().start(_SeriesNovelLoaderWorker(id, self._loaded))
+
+    def _loadingFinished(self, id: UUID, novel: Optional[Novel], stamp: Tuple[int, ...]):
+        self._loading.discard(id)
+        if novel is not None:
+            self._novels[id] = (novel, stamp)
+            self._novels.move_to_end(id)
+            while len(self._novels) > self._capacity:
+                self._novels.popitem(last=False)
+
+        for result in self._waiting.pop(id, []):
+            if novel is not None:
+                result.emit_success(novel)
+
 
-    def __init__(self, id: UUID, result: NovelLoadingResult):
+class _SeriesNovelLoaderWorker(QRunnable):
+    def __init__(self, id: UUID, signal):
         super().__init__()
         self._id = id
-        self._result = result
+        self._signal = signal
 
     @overrides
     def run(self) -> None:
-        novel = json_client.fetch_novel(self._id)
-        if novel:
-            self._result.emit_success(novel)
+        try:
+            stamp = json_client.novel_stamp(self._id)
+            # discard whatever the fetch would write back so that the stamp still matches the files that were read
+            with json_client.capture():
+                novel = json_client.fetch_novel(self._id)
+        except Exception as ex:
+            logging.warning(f'Could not load novel {self._id}: {ex}')
+            novel = None
+            stamp = ()
+        self._signal.emit(self._id, novel, stamp)
+
+
+series_cache = SeriesNovelCache()
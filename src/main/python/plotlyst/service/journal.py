@@ -0,0 +1,190 @@
+"""
+Plotlyst
+Copyright (C) 2021-2024  Zsolt Kovari
+
+This file is part of Plotlyst.
+
+Plotlyst is free software: you can redistribute it and/or modify
+it under the terms of the GNU General Public License as published by
+the Free Software Foundation, either version 3 of the License, or
+(at your option) any later version.
+
+Plotlyst is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+GNU General Public License for more details.
+
+You should have received a copy of the GNU General Public License
+along with this program.  If not, see <https://www.gnu.org/licenses/>.
+"""
+import base64
+import json
+import logging
+import os
+import threading
+from dataclasses import dataclass, field
+from typing import List, Optional, Dict, Any, TextIO
+
+from plotlyst.core.client import FileChange
+
+JOURNAL_FILE_NAME = 'recovery.journal'
+
+
+@dataclass
+class JournalEntry:
+    seq: int
+    changes: List[FileChange] = field(default_factory=list)
+
+
+def _encode_change(change: FileChange) -> Dict[str, Any]:
+    data: Dict[str, Any] = {'path': change.path}
+    if change.removed:
+        data['removed'] = True
+    elif change.data is not None:
+        data['data'] = base64.b64encode(change.data).decode('ascii')
+    else:
+        data['content'] = change.content
+        if change.encoding != 'utf-8':
+            data['encoding'] = change.encoding
+    return data
+
+
+def _decode_change(data: Dict[str, Any]) -> FileChange:
+    if data.get('removed'):
+        return FileChange(data['path'], removed=True)
+    if 'data' in data:
+        return FileChange(data['path'], data=base64.b64decode(data['data']))
+    return FileChange(data['path'], content=data['content'], encoding=data.get('encoding', 'utf-8'))
+
+
+class PersistenceJournal:
+    """Append-only log of the file changes queued for persistence.
+
+    Every line is either an entry with the changes of one operation or a checkpoint that marks the entries up to
+    a sequence number as written to the workspace. A torn last line, e.g. after a crash in the middle of a write,
+    is ignored.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._path: Optional[str] = None
+        self._file: Optional[TextIO] = None
+        self._seq: int = 0
+        self._checkpoint: int = 0
+
+    def path(self) -> Optional[str]:
+        return self._path
+
+    def open(self, workspace: str):
+        path = os.path.join(str(workspace), JOURNAL_FILE_NAME)
+        if path == self._path:
+            return
+        self.close()
+        with self._lock:
+            self._path = path
+            self._seq, self._checkpoint = self._read_positions()
+            torn = self._torn()
+            self._file = open(path, 'a', encoding='utf-8')
+            if torn:
+                self._file.write('\n')
+                self._file.flush()
+
+    def close(self):
+        with self._lock:
+            if self._file is not None:
+                self._file.close()
+            self._file = None
+            self._path = None
+            self._seq = 0
+            self._checkpoint = 0
+
+    def seq(self) -> int:
+        return self._seq
+
+    def size(self) -> int:
+        if self._file is None:
+            return 0
+        return self._file.tell()
+
+    def record(self, changes: List[FileChange]) -> int:
+        with self._lock:
+            if self._file is None:
+                return self._seq
+            self._seq += 1
+            line = json.dumps({'seq': self._seq, 'changes': [_encode_change(x) for x in changes]})
+            self._file.write(line + '\n')
+            self._file.flush()
+            return self._seq
+
+    def checkpoint(self, seq: Optional[int] = None):
+        with self._lock:
+            if self._file is None:
+                return
+            if seq is None:
+                seq = self._seq
+            if seq <= self._checkpoint:
+                return
+            self._checkpoint = seq
+            if seq >= self._seq:
+                self._truncate()
+            else:
+                self._file.write(json.dumps({'checkpoint': seq}) + '\n')
+                self._file.flush()
+
+    def pending(self) -> List[JournalEntry]:
+        with self._lock:
+            if self._path is None:
+                return []
+            entries: List[JournalEntry] = []
+            checkpoint = 0
+            for data in self._read_lines():
+                if 'checkpoint' in data:
+                    checkpoint = max(checkpoint, data['checkpoint'])
+                else:
+                    entries.append(JournalEntry(data['seq'], [_decode_change(x) for x in data['changes']]))
+            return [x for x in entries if x.seq > checkpoint]
+
+    def clear(self):
+        with self._lock:
+            if self._file is None:
+                return
+            self._checkpoint = self._seq
+            self._truncate()
+
+    def _truncate(self):
+        self._file.seek(0)
+        self._file.truncate()
+        self._file.flush()
+
+    def _torn(self) -> bool:
+        if not os.path.exists(self._path) or os.path.getsize(self._path) == 0:
+            return False
+        with open(self._path, 'rb') as journal_file:
+            journal_file.seek(-1, os.SEEK_END)
+            return journal_file.read(1) != b'\n'
+
+    def _read_positions(self):
+        seq = 0
+        checkpoint = 0
+        for data in self._read_lines():
+            if 'checkpoint' in data:
+                checkpoint = max(checkpoint, data['checkpoint'])
+            else:
+                seq = max(seq, data['seq'])
+        return seq, checkpoint
+
+    def _read_lines(self) -> List[Dict[str, Any]]:
+        if self._file is not None:
+            self._file.flush()
+        if not os.path.exists(self._path):
+            return []
+        lines = []
+        with open(self._path, encoding='utf-8') as journal_file:
+            for line in journal_file:
+                if not line.strip():
+                    continue
+                try:
+                    lines.append(json.loads(line))
+                except ValueError:
+                    logging.warning('Skipping incomplete recovery journal entry')
+        return lines
@@ -17,45 +17,39 @@ GNU General Public License for more details.
 You should have received a copy of the GNU General Public License
 along with this program.  If not, see <https://www.gnu.org/licenses/>.
 """
+import datetime
+import logging
+import subprocess
+import tempfile
+import threading
+import zipfile
+from collections import OrderedDict
 from pathlib import Path
-from typing import Optional, List
+from typing import Optional, List, Iterator, Tuple
+from uuid import UUID
 
 import pypandoc
-from PyQt6.QtCore import Qt
-from PyQt6.QtGui import QTextDocument, QTextCursor, QTextCharFormat, QFont, QTextBlockFormat, QTextFormat, QTextBlock
+from PyQt6.QtCore import Qt, QObject, pyqtSignal, QRunnable, QThreadPool
+from PyQt6.QtGui import QTextDocument, QTextCursor, QTextCharFormat, QFont, QTextBlockFormat, QTextFormat
 from PyQt6.QtWidgets import QFileDialog
-from qthandy import busy
+from overrides import overrides
 from slugify import slugify
 
 from plotlyst.common import DEFAULT_MANUSCRIPT_INDENT, DEFAULT_MANUSCRIPT_LINE_SPACE
 from plotlyst.core.client import json_client
-from plotlyst.core.domain import Novel, Document, DocumentProgress, Scene, DocumentStatistics, Chapter
+from plotlyst.core.domain import Novel, Document, DocumentProgress, Scene, DocumentStatistics, Chapter, \
+    DocumentType
 from plotlyst.core.text import wc
 from plotlyst.env import open_location, app_env
 from plotlyst.resources import resource_registry, ResourceType
+from plotlyst.service.cache import progress_registry
 from plotlyst.service.common import today_str
+from plotlyst.service.manuscript_text import prepare_content_for_convert
 from plotlyst.service.persistence import RepositoryPersistenceManager
 from plotlyst.service.resource import ask_for_resource
 from plotlyst.view.widget.confirm import asked
 
 
-def prepare_content_for_convert(html: str) -> str:
-    text_doc = QTextDocument()
-    text_doc.setHtml(html)
-
-    block: QTextBlock = text_doc.begin()
-    md_content: str = ''
-    while block.isValid():
-        cursor = QTextCursor(block)
-        cursor.movePosition(QTextCursor.MoveOperation.EndOfBlock, QTextCursor.MoveMode.KeepAnchor)
-        md_content += cursor.selection().toMarkdown()
-
-        block = block.next()
-    content = pypandoc.convert_text(md_content, to='html', format='md')
-
-    return content
-
-
 def export_manuscript_to_docx(novel: Novel):
     if not ask_for_resource(ResourceType.PANDOC):
         return
@@ -192,63 +186,339 @@ def daily_progress(scene: Scene) -> DocumentProgress:
     return progress
 
 
-@busy
-def import_docx(path: str, chapter_heading_level: int = 2, infer_scene_titles: bool = False):
-    title = Path(path).stem
-    novel = Novel.new_novel(title)
-    novel.scenes.clear()
-    novel.chapters.clear()
-
-    md_text = pypandoc.convert_file(path, to='md', format='docx')
-
-    current_chapter = None
-    novel_title_set = False
-
-    chapter_prefix = '#' * chapter_heading_level
-    scene_content = []
-
-    lines = md_text.splitlines()
-    for i, line in enumerate(lines):
-        if chapter_heading_level > 1 and not novel_title_set and line.startswith("# "):
-            novel.title = line[2:].strip()
-            novel_title_set = True
-
-        elif line.startswith(f"{chapter_prefix} "):  # Chapter heading
-            if current_chapter and scene_content:
-                _add_scene_to_novel(novel, current_chapter, scene_content, infer_scene_titles)
-                scene_content = []
-
-            chapter_title = line[len(chapter_prefix):].strip()
-            current_chapter = Chapter(chapter_title)
-            novel.chapters.append(current_chapter)
-
-        else:
-            if current_chapter:
-                scene_content.append(line)
+def record_progress(novel: Novel, scene: Scene, diff: int) -> DocumentProgress:
+    progress_registry.track(novel)
+    progress = daily_progress(scene)
+    overall_progress = daily_overall_progress(novel)
+    added = max(diff, 0)
+    removed = max(-diff, 0)
+    progress.added += added
+    progress.removed += removed
+    overall_progress.added += added
+    overall_progress.removed += removed
+    progress_registry.add_progress(datetime.date.today(), added, removed)
+
+    return overall_progress
+
+
+class DocxImportCancelled(Exception):
+    pass
+
+
+class DocxImportResult(QObject):
+    progressChanged = pyqtSignal(int)
+    finished = pyqtSignal(object)
+    failed = pyqtSignal(str)
+    cancelled = pyqtSignal()
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self._lock = threading.Lock()
+        self._cancelled = False
+        self._process: Optional[subprocess.Popen] = None
+
+    def cancel(self):
+        with self._lock:
+            self._cancelled = True
+            if self._process is not None and self._process.poll() is None:
+                self._process.kill()
+
+    def is_cancelled(self) -> bool:
+        return self._cancelled
+
+    def attach(self, process: Optional[subprocess.Popen]):
+        with self._lock:
+            self._process = process
+            if process is not None and self._cancelled:
+                process.kill()
+
+
+class DocxManuscriptParser:
+    """Builds the chapters and scenes of a novel from the Markdown lines of a converted docx.
+
+    Only the lines of the current scene are kept in memory. A scene is converted to its final formatted HTML as soon
+    as the next chapter heading or the end of the manuscript is reached.
+    """
+
+    def __init__(self, novel: Novel, chapter_heading_level: int = 2, infer_scene_titles: bool = False):
+        self.novel = novel
+        self.words: int = 0
+        self._chapter_heading_level = chapter_heading_level
+        self._chapter_prefix = '#' * chapter_heading_level + ' '
+        self._infer_scene_titles = infer_scene_titles
+        self._novel_title_set = False
+        self._chapter: Optional[Chapter] = None
+        self._scene_content: List[str] = []
+        self._block_format = _manuscript_block_format()
+
+    def feed(self, line: str):
+        if self._chapter_heading_level > 1 and not self._novel_title_set and line.startswith('# '):
+            self.novel.title = line[2:].strip()
+            self._novel_title_set = True
+        elif line.startswith(self._chapter_prefix):
+            self._add_scene()
+            self._chapter = Chapter(line[len(self._chapter_prefix):].strip())
+            self.novel.chapters.append(self._chapter)
+        elif self._chapter:
+            self._scene_content.append(line)
+
+    def finish(self) -> Novel:
+        self._add_scene()
+        self.novel.update_chapter_titles()
+        return self.novel
+
+    def _add_scene(self):
+        if not self._chapter or not self._scene_content:
+            return
 
-    if current_chapter and scene_content:
-        _add_scene_to_novel(novel, current_chapter, scene_content, infer_scene_titles)
+        qt_doc = QTextDocument()
+        qt_doc.setMarkdown('\n'.join(self._scene_content))
+        self._scene_content = []
+        cursor = QTextCursor(qt_doc)
+        cursor.select(QTextCursor.SelectionType.Document)
+        cursor.setBlockFormat(self._block_format)
 
-    novel.update_chapter_titles()
-    _apply_manuscript_format(novel)
+        document = Document('')
+        document.content = qt_doc.toHtml()
+        words = wc(qt_doc.toPlainText())
+        document.statistics = DocumentStatistics(words)
+        self.words += words
 
-    return novel
+        scene = Scene(title=self._chapter.title if self._infer_scene_titles else '', chapter=self._chapter,
+                      manuscript=document)
+        self.novel.scenes.append(scene)
 
 
-def _add_scene_to_novel(novel: Novel, chapter: Chapter, scene_content: List[str], infer_scene_titles: bool):
-    markdown_text = "\n".join(scene_content)
-    qt_doc = QTextDocument()
-    qt_doc.setMarkdown(markdown_text)
-    html_content = qt_doc.toHtml()
+def import_docx(path: str, chapter_heading_level: int = 2, infer_scene_titles: bool = False,
+                result: Optional[DocxImportResult] = None) -> Novel:
+    novel = Novel.new_novel(Path(path).stem)
+    novel.scenes.clear()
+    novel.chapters.clear()
 
-    document = Document('')
-    document.content = html_content
-    scene = Scene(title=chapter.title if infer_scene_titles else '', chapter=chapter, manuscript=document)
+    parser = DocxManuscriptParser(novel, chapter_heading_level, infer_scene_titles)
+    paragraphs = _count_docx_paragraphs(path) if result else 0
+    processed = 0
+    reported = 0
+    for line in _docx_to_markdown_lines(path, result):
+        if result:
+            if result.is_cancelled():
+                raise DocxImportCancelled()
+            if line.strip():
+                processed += 1
+                progress = min(99, processed * 100 // paragraphs)
+                if progress > reported:
+                    reported = progress
+                    result.progressChanged.emit(progress)
+        parser.feed(line)
+
+    return parser.finish()
+
+
+def import_docx_async(path: str, chapter_heading_level: int = 2, infer_scene_titles: bool = False) -> DocxImportResult:
+    result = DocxImportResult()
+    QThreadPool.globalInstance().start(DocxImportWorker(path, chapter_heading_level, infer_scene_titles, result))
+    return result
+
+
+class DocxImportWorker(QRunnable):
+    def __init__(self, path: str, chapter_heading_level: int, infer_scene_titles: bool, result: DocxImportResult):
+        super().__init__()
+        self._path = path
+        self._chapter_heading_level = chapter_heading_level
+        self._infer_scene_titles = infer_scene_titles
+        self._result = result
+
+    @overrides
+    def run(self) -> None:
+        try:
+            novel = import_docx(self._path, self._chapter_heading_level, self._infer_scene_titles, self._result)
+        except DocxImportCancelled:
+            self._result.cancelled.emit()
+            return
+        except Exception as ex:
+            if self._result.is_cancelled():
+                self._result.cancelled.emit()
+            else:
+                logging.exception(f'Could not import {self._path}')
+                self._result.failed.emit(str(ex))
+            return
+        self._result.progressChanged.emit(100)
+        self._result.finished.emit(novel)
+
+
+class ManuscriptPrefetcher(QObject):
+    """Loads the manuscripts of the neighbouring scenes in the background.
+
+    The scenes around the edited ones are read in reading order, nearest first, so that stepping forward or back
+    finds their manuscript already loaded. Only the documents that were loaded by the prefetcher count against the
+    memory budget and the least relevant of them are unloaded again once it is exceeded. A new prefetch cancels the
+    reads of the previous one that did not happen yet.
+    """
+
+    def __init__(self, novel: Novel, radius: int = 2, budget: int = 4 * 1024 * 1024, parent=None):
+        super().__init__(parent)
+        self._novel = novel
+        self._radius = radius
+        self._budget = budget
+        self._prefetched: OrderedDict[UUID, Tuple[Document, str]] = OrderedDict()
+        self._size: int = 0
+        self._neighbours: List[Document] = []
+        self._request: Optional[ManuscriptPrefetchRequest] = None
+
+    def prefetch(self, scenes: List[Scene]):
+        self.cancel()
+        for scene in scenes:
+            if scene.manuscript:
+                self.release(scene.manuscript)
+
+        self._neighbours = [x.manuscript for x in self.neighbours(scenes) if x.manuscript]
+        documents = [x for x in self._neighbours if not x.loaded and x.type == DocumentType.DOCUMENT]
+        if documents:
+            self._request = ManuscriptPrefetchRequest()
+            self._request.documentRead.connect(self._read)
+            QThreadPool.globalInstance().start(ManuscriptPrefetchWorker(self._novel, documents, self._request))
+
+    def neighbours(self, scenes: List[Scene]) -> List[Scene]:
+        selected = set(scenes)
+        indexes = [i for i, scene in enumerate(self._novel.scenes) if scene in selected]
+        if not indexes:
+            return []
+
+        neighbours = []
+        for distance in range(1, self._radius + 1):
+            for i in [indexes[-1] + distance, indexes[0] - distance]:
+                if 0 <= i < len(self._novel.scenes):
+                    neighbours.append(self._novel.scenes[i])
+        return neighbours
+
+    def release(self, document: Document):
+        entry = self._prefetched.pop(document.id, None)
+        if entry is not None:
+            self._size -= len(entry[1])
+
+    def cancel(self):
+        if self._request is not None:
+            self._request.cancel()
+
+    def clear(self):
+        self.cancel()
+        self._prefetched.clear()
+        self._neighbours.clear()
+        self._size = 0
+
+    def size(self) -> int:
+        return self._size
+
+    def isPrefetched(self, document: Document) -> bool:
+        return document.id in self._prefetched
+
+    def _read(self, document: Document, content: str):
+        if self.sender() is not self._request or self._request.is_cancelled():
+            return
+        if document.loaded or len(content) > self._budget:
+            return
 
-    novel.scenes.append(scene)
+        document.content = content
+        document.loaded = True
+        self._prefetched[document.id] = (document, content)
+        self._size += len(content)
+        self._evict()
 
+    def _evict(self):
+        if self._size <= self._budget:
+            return
 
-def _apply_manuscript_format(novel: Novel):
+        # documents outside the current neighbourhood go first, then the farthest neighbours
+        rank = {x.id: i for i, x in enumerate(self._neighbours)}
+        candidates = sorted(self._prefetched.keys(), key=lambda x: rank.get(x, len(rank)), reverse=True)
+        for id_ in candidates:
+            if self._size <= self._budget:
+                break
+            document, content = self._prefetched.pop(id_)
+            self._size -= len(content)
+            # an edited document is in use and stays loaded
+            if document.content is content:
+                document.content = ''
+                document.loaded = False
+
+
+class ManuscriptPrefetchRequest(QObject):
+    documentRead = pyqtSignal(object, str)
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self._cancelled = False
+
+    def cancel(self):
+        self._cancelled = True
+
+    def is_cancelled(self) -> bool:
+        return self._cancelled
+
+
+class ManuscriptPrefetchWorker(QRunnable):
+    def __init__(self, novel: Novel, documents: List[Document], request: ManuscriptPrefetchRequest):
+        super().__init__()
+        self._novel = novel
+        self._documents = documents
+        self._request = request
+
+    @overrides
+    def run(self) -> None:
+        for document in self._documents:
+            if self._request.is_cancelled():
+                return
+            try:
+                content = json_client.read_document(self._novel, document)
+            except Exception as ex:
+                logging.warning(f'Could not prefetch document {document.id}: {ex}')
+                continue
+            self._request.documentRead.emit(document, content)
+
+
+def _docx_to_markdown_lines(path: str, result: Optional[DocxImportResult] = None) -> Iterator[str]:
+    args = [pypandoc.get_pandoc_path(), path, '--from=docx', '--to=markdown', '--wrap=none']
+    with tempfile.TemporaryFile() as stderr:
+        process = subprocess.Popen(args, stdout=subprocess.PIPE, stderr=stderr, encoding='utf-8',
+                                   creationflags=getattr(subprocess, 'CREATE_NO_WINDOW', 0))
+        if result:
+            result.attach(process)
+        try:
+            for line in process.stdout:
+                yield line.rstrip('\n')
+        finally:
+            if process.poll() is None:
+                process.kill()
+            process.stdout.close()
+            code = process.wait()
+            if result:
+                result.attach(None)
+
+        if result and result.is_cancelled():
+            raise DocxImportCancelled()
+        if code != 0:
+            stderr.seek(0)
+            raise RuntimeError(f'Pandoc could not convert the file: {stderr.read().decode("utf-8", "replace").strip()}')
+
+
+def _count_docx_paragraphs(path: str) -> int:
+    paragraphs = 0
+    tail = b''
+    try:
+        with zipfile.ZipFile(path) as docx, docx.open('word/document.xml') as xml:
+            while True:
+                chunk = xml.read(1024 * 1024)
+                if not chunk:
+                    break
+                data = tail + chunk
+                paragraphs += data.count(b'<w:p>') + data.count(b'<w:p ')
+                tail = data[-4:]
+    except (zipfile.BadZipFile, KeyError):
+        pass
+    return max(paragraphs, 1)
+
+
+def _manuscript_block_format() -> QTextBlockFormat:
     blockFmt = QTextBlockFormat()
     blockFmt.setTextIndent(DEFAULT_MANUSCRIPT_INDENT)
     blockFmt.setLineHeight(DEFAULT_MANUSCRIPT_LINE_SPACE, 1)
@@ -256,15 +526,4 @@ def _apply_manuscript_format(novel: Novel):
     blockFmt.setTopMargin(0)
     blockFmt.setRightMargin(0)
     blockFmt.setBottomMargin(0)
-
-    for scene in novel.scenes:
-        if scene.manuscript:
-            document = QTextDocument()
-            document.setHtml(scene.manuscript.content)
-            cursor = QTextCursor(document)
-            cursor.clearSelection()
-            cursor.select(QTextCursor.SelectionType.Document)
-            cursor.setBlockFormat(blockFmt)
-
-            scene.manuscript.content = document.toHtml()
-            scene.manuscript.statistics = DocumentStatistics(wc(document.toPlainText()))
+    return blockFmt
@@ -0,0 +1,38 @@
+"""
+Plotlyst
+Copyright (C) 2021-2024  Zsolt Kovari
+
+This file is part of Plotlyst.
+
+Plotlyst is free software: you can redistribute it and/or modify
+it under the terms of the GNU General Public License as published by
+the Free Software Foundation, either version 3 of the License, or
+(at your option) any later version.
+
+Plotlyst is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+GNU General Public License for more details.
+
+You should have received a copy of the GNU General Public License
+along with this program.  If not, see <https://www.gnu.org/licenses/>.
+"""
+import pypandoc
+from PyQt6.QtGui import QTextDocument, QTextCursor, QTextBlock
+
+
+def prepare_content_for_convert(html: str) -> str:
+    text_doc = QTextDocument()
+    text_doc.setHtml(html)
+
+    block: QTextBlock = text_doc.begin()
+    md_content: str = ''
+    while block.isValid():
+        cursor = QTextCursor(block)
+        cursor.movePosition(QTextCursor.MoveOperation.EndOfBlock, QTextCursor.MoveMode.KeepAnchor)
+        md_content += cursor.selection().toMarkdown()
+
+        block = block.next()
+    content = pypandoc.convert_text(md_content, to='html', format='md')
+
+    return content
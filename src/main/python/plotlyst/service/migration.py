@@ -18,12 +18,14 @@ You should have received a copy of the GNU General Public License
 along with this program.  If not, see <https://www.gnu.org/licenses/>.
 """
 from plotlyst.core.domain import Novel, Document, DocumentType
-from plotlyst.service.persistence import RepositoryPersistenceManager
 
 
-def migrate_novel(novel: Novel):
+def migrate_novel(novel: Novel) -> bool:
+    migrated = False
     if novel.events_map is not None:
         doc = Document('Mindmap', type=DocumentType.MIND_MAP, icon='ri.mind-map', diagram=novel.events_map)
         novel.documents.append(doc)
         novel.events_map = None
-        RepositoryPersistenceManager.instance().update_novel(novel)
+        migrated = True
+
+    return migrated
@@ -33,7 +33,10 @@ from plotlyst.core.domain import Novel, Character, Scene, NovelDescriptor, Docum
 from plotlyst.env import app_env
 from plotlyst.event.core import emit_event
 from plotlyst.events import StorylineCharacterAssociationChanged
-from plotlyst.view.widget.confirm import confirmed
+from plotlyst.service.journal import PersistenceJournal
+from plotlyst.view.widget.confirm import confirmed, asked
+
+JOURNAL_FLUSH_SIZE = 8 * 1024 * 1024
 
 
 class OperationType(Enum):
@@ -61,9 +64,18 @@ class RepositoryPersistenceManager(QObject):
     def __init__(self):
         super(RepositoryPersistenceManager, self).__init__()
         self._operations: List[Operation] = []
-        self._pool = QThreadPool.globalInstance()
+        # journal records and flushes run in order on a single worker so that a checkpoint covers every entry
+        # recorded before it
+        self._worker = QThreadPool(self)
+        self._worker.setMaxThreadCount(1)
         self._finished_event = asyncio.Event()
         self._persistence_enabled = True
+        self._journal = PersistenceJournal()
+        self._unjournaled: List[Operation] = []
+        self._journal_timer = QTimer()
+        self._journal_timer.setSingleShot(True)
+        self._journal_timer.setInterval(1000)
+        self._journal_timer.timeout.connect(self._journal_timeout)
 
         self._timer = QTimer()
         self._timer.setInterval(60 * 1000)  # 1 min
@@ -80,113 +92,182 @@ class RepositoryPersistenceManager(QObject):
     def set_persistence_enabled(self, enabled: bool):
         self._persistence_enabled = enabled
 
+    def journal(self) -> PersistenceJournal:
+        return self._journal
+
     def flush(self, sync: bool = False) -> bool:
+        if sync:
+            self._worker.waitForDone()
         if self._finished_event.is_set():
             return False
 
+        self._journal_operations(sync)
         if self._operations:
             operations_to_persist = []
             operations_to_persist.extend(self._operations)
             if sync:
+                seq = self._journal.seq()
                 _persist_operations(operations_to_persist)
+                self._journal.checkpoint(seq)
             else:
                 self._finished_event.set()
-                _runnable = _PersistenceRunnable(operations_to_persist, self._finished_event)
-                self._pool.start(_runnable)
+                _runnable = _PersistenceRunnable(operations_to_persist, self._finished_event, self._journal)
+                self._worker.start(_runnable)
             self._operations.clear()
 
         return True
 
     def insert_novel(self, novel: Novel):
         if self._persistence_enabled:
-            self._operations.append(Operation(OperationType.INSERT, novel=novel))
+            self._queue(Operation(OperationType.INSERT, novel=novel))
             self._persist_if_test_env()
 
     def delete_novel(self, novel: Novel):
         if self._persistence_enabled:
-            self._operations.append(Operation(OperationType.DELETE, novel=novel))
+            self._queue(Operation(OperationType.DELETE, novel=novel))
             self._persist_if_test_env()
 
     def update_project_novel(self, novel: NovelDescriptor):
         if self._persistence_enabled:
-            self._operations.append(Operation(OperationType.UPDATE, novel_descriptor=novel))
+            self._queue(Operation(OperationType.UPDATE, novel_descriptor=novel))
             self._persist_if_test_env()
 
     def update_novel(self, novel: Novel):
         if self._persistence_enabled:
-            self._operations.append(Operation(OperationType.UPDATE, novel=novel))
+            self._queue(Operation(OperationType.UPDATE, novel=novel))
             self._persist_if_test_env()
 
     def insert_character(self, novel: Novel, character: Character):
         if self._persistence_enabled:
-            self._operations.append(Operation(OperationType.INSERT, novel=novel, character=character))
+            self._queue(Operation(OperationType.INSERT, novel=novel, character=character))
             self._persist_if_test_env()
 
     def update_character(self, character: Character, update_avatar: bool = False):
         if self._persistence_enabled:
-            self._operations.append(Operation(OperationType.UPDATE, character=character, update_image=update_avatar))
+            self._queue(Operation(OperationType.UPDATE, character=character, update_image=update_avatar))
         self._persist_if_test_env()
 
     def delete_character(self, novel: Novel, character: Character):
         if self._persistence_enabled:
-            self._operations.append(Operation(OperationType.DELETE, novel=novel, character=character))
+            self._queue(Operation(OperationType.DELETE, novel=novel, character=character))
             self._persist_if_test_env()
 
     def update_scene(self, scene: Scene):
         if self._persistence_enabled:
-            self._operations.append(Operation(OperationType.UPDATE, scene=scene))
+            self._queue(Operation(OperationType.UPDATE, scene=scene))
             self._persist_if_test_env()
 
     def insert_scene(self, novel: Novel, scene: Scene):
         if self._persistence_enabled:
-            self._operations.append(Operation(OperationType.INSERT, novel=novel, scene=scene))
+            self._queue(Operation(OperationType.INSERT, novel=novel, scene=scene))
             self._persist_if_test_env()
 
     def delete_scene(self, novel: Novel, scene: Scene):
         if self._persistence_enabled:
-            self._operations.append(Operation(OperationType.DELETE, novel=novel, scene=scene))
+            self._queue(Operation(OperationType.DELETE, novel=novel, scene=scene))
             self._persist_if_test_env()
 
     def update_doc(self, novel: Novel, document: Document):
         if self._persistence_enabled:
-            self._operations.append(Operation(OperationType.UPDATE, novel=novel, doc=document))
+            self._queue(Operation(OperationType.UPDATE, novel=novel, doc=document))
             self._persist_if_test_env()
 
     def update_diagram(self, novel: Novel, diagram: Diagram):
         if self._persistence_enabled:
-            self._operations.append(Operation(OperationType.UPDATE, novel=novel, diagram=diagram))
+            self._queue(Operation(OperationType.UPDATE, novel=novel, diagram=diagram))
             self._persist_if_test_env()
 
     def update_world(self, novel: Novel):
         if self._persistence_enabled:
-            self._operations.append(Operation(OperationType.UPDATE, novel=novel, world=novel.world))
+            self._queue(Operation(OperationType.UPDATE, novel=novel, world=novel.world))
             self._persist_if_test_env()
 
     def delete_doc(self, novel: Novel, document: Document):
         if self._persistence_enabled:
-            self._operations.append(Operation(OperationType.DELETE, novel=novel, doc=document))
+            self._queue(Operation(OperationType.DELETE, novel=novel, doc=document))
             self._persist_if_test_env()
 
+    def pending_recovery(self) -> int:
+        self._open_journal()
+        return sum(len(x.changes) for x in self._journal.pending())
+
+    def recover(self):
+        self._open_journal()
+        for entry in self._journal.pending():
+            json_client.apply_changes(entry.changes)
+        self._journal.clear()
+
+    def discard_recovery(self):
+        self._open_journal()
+        self._journal.clear()
+
+    def _queue(self, operation: Operation):
+        self._operations.append(operation)
+        self._unjournaled.append(operation)
+        if app_env.test_env():
+            self._journal_operations(sync=True)
+        elif not self._journal_timer.isActive():
+            self._journal_timer.start()
+
+    def _journal_operations(self, sync: bool = False):
+        self._journal_timer.stop()
+        if not self._unjournaled:
+            return
+        operations = []
+        operations.extend(self._unjournaled)
+        self._unjournaled.clear()
+
+        self._open_journal()
+        if sync:
+            _record_operations(self._journal, operations)
+        else:
+            self._worker.start(_JournalRunnable(operations, self._journal))
+
+    def _journal_timeout(self):
+        self._journal_operations()
+        if self._journal.size() > JOURNAL_FLUSH_SIZE:
+            self.flush()
+
+    def _open_journal(self):
+        if json_client.root_path is not None:
+            self._journal.open(json_client.root_path)
+
     def _persist_if_test_env(self):
         if app_env.test_env():
+            seq = self._journal.seq()
             _persist_operations(self._operations)
             self._operations.clear()
+            self._journal.checkpoint(seq)
 
 
 class _PersistenceRunnable(QRunnable):
-    def __init__(self, operations: List[Operation], finished: asyncio.Event):
+    def __init__(self, operations: List[Operation], finished: asyncio.Event, journal: PersistenceJournal):
         super(_PersistenceRunnable, self).__init__()
         self.operations = operations
         self.finished = finished
+        self.journal = journal
 
     @overrides
     def run(self) -> None:
         try:
+            seq = self.journal.seq()
             _persist_operations(self.operations)
+            self.journal.checkpoint(seq)
         finally:
             self.finished.clear()
 
 
+class _JournalRunnable(QRunnable):
+    def __init__(self, operations: List[Operation], journal: PersistenceJournal):
+        super(_JournalRunnable, self).__init__()
+        self.operations = operations
+        self.journal = journal
+
+    @overrides
+    def run(self) -> None:
+        _record_operations(self.journal, self.operations)
+
+
 def flush_or_fail():
     attempts = 0
     repo = RepositoryPersistenceManager.instance()
@@ -197,6 +278,31 @@ def flush_or_fail():
         raise IOError('Could not save Plotlyst workspace')
 
 
+def recover_unsaved_changes():
+    repo = RepositoryPersistenceManager.instance()
+    changes = repo.pending_recovery()
+    if not changes:
+        return
+
+    title = 'Recover unsaved changes?'
+    msg = f'<html>Plotlyst was not closed properly last time. <b>{changes}</b> unsaved changes were found.' \
+          '<br>Would you like to recover them?'
+    if asked(msg, title, btnConfirmText='Recover', btnCancelText='Discard'):
+        repo.recover()
+    else:
+        repo.discard_recovery()
+
+
+def _record_operations(journal: PersistenceJournal, operations: List[Operation]):
+    try:
+        with json_client.capture() as changes:
+            _persist_operations(operations)
+    except Exception as ex:
+        logging.error('Could not record the operations in the recovery journal: %s', ex)
+        return
+    journal.record(changes)
+
+
 def _persist_operations(operations: List[Operation]):
     updated_doc_cache: Set[Document] = set()
     updated_novel_cache: Set[Novel] = set()
@@ -17,9 +17,11 @@ GNU General Public License for more details.
 You should have received a copy of the GNU General Public License
 along with this program.  If not, see <https://www.gnu.org/licenses/>.
 """
+import datetime
 from typing import Optional
 
 from plotlyst.core.domain import ProductivityType, DailyProductivity, Novel
+from plotlyst.service.cache import progress_registry
 from plotlyst.service.common import today_str
 from plotlyst.service.persistence import RepositoryPersistenceManager
 
@@ -39,5 +41,7 @@ def set_daily_productivity(novel: Novel, category: ProductivityType,
     if date is None:
         date = today_str()
 
+    progress_registry.track(novel)
     novel.productivity.progress[date] = str(category.id)
+    progress_registry.set_productivity(datetime.date.fromisoformat(date), category)
     RepositoryPersistenceManager.instance().update_novel(novel)
@@ -48,7 +48,7 @@ class ProductivitySnapshotEditor(SnapshotCanvasEditor):
         vbox(self.canvas)
         transparent(self.canvas)
 
-        calendar = ProductivityCalendar(self.novel.productivity)
+        calendar = ProductivityCalendar(self.novel)
         self.canvas.layout().addWidget(calendar)
 
 
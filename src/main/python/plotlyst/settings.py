@@ -28,6 +28,8 @@ class AppSettings:
     LAST_NOVEL_ID = 'lastNovelId'
     TOOLBAR_QUICK_SETTINGS = 'toolbarQuickSettings'
     WORLDBUILDING_EDITOR_MAX_WIDTH = 'worldbuildingEditorMaxWidth'
+    DIAGNOSTICS = 'diagnostics'
+    AVATAR_CACHE_LIMIT = 'avatarCacheLimit'
 
     def __init__(self):
         self._settings: QSettings = QSettings()
@@ -80,6 +82,18 @@ class AppSettings:
     def set_worldbuilding_editor_max_width(self, value: int):
         self._settings.setValue(self.WORLDBUILDING_EDITOR_MAX_WIDTH, value)
 
+    def diagnostics_enabled(self) -> bool:
+        return self._settings.value(self.DIAGNOSTICS, False, type=bool)
+
+    def set_diagnostics_enabled(self, enabled: bool):
+        self._settings.setValue(self.DIAGNOSTICS, enabled)
+
+    def avatar_cache_limit(self) -> int:
+        return self._settings.value(self.AVATAR_CACHE_LIMIT, 32, type=int)
+
+    def set_avatar_cache_limit(self, megabytes: int):
+        self._settings.setValue(self.AVATAR_CACHE_LIMIT, megabytes)
+
 
 settings = AppSettings()
 
@@ -1,6 +1,6 @@
 from plotlyst.core.client import client, json_client
 from plotlyst.core.domain import Novel, Scene, default_story_structures, three_act_structure, \
-    SceneStoryBeat, ScenePurposeType
+    SceneStoryBeat, ScenePurposeType, Character, Document, Comment
 from plotlyst.env import app_env
 from plotlyst.test.conftest import init_project
 
@@ -43,16 +43,37 @@ def test_insert_scene(test_client):
 
     scene = Scene(title='Scene 1', synopsis='Test synopsis', purpose=ScenePurposeType.Story,
                   stage=novel.stages[1],
-                  beats=[SceneStoryBeat.of(novel.active_story_structure, novel.active_story_structure.beats[0])])
+                  beats=[SceneStoryBeat.of(novel.active_story_structure, novel.active_story_structure.beats[0])],
+                  comments=[Comment('Fix the pacing')])
     novel.scenes.append(scene)
     client.insert_scene(novel, scene)
 
     saved_novel = client.fetch_novel(novel.id)
     assert novel == saved_novel
     assert scene == novel.scenes[0]
+    assert saved_novel.scenes[0].comments[0].id == scene.comments[0].id
 
 
 def test_init_client(test_client):
     init_project()
 
     json_client.init(str(json_client.root_path))
+
+
+def test_update_character_with_cached_document_character(test_client):
+    novel = Novel(title='test1')
+    app_env.novel = novel
+    client.insert_novel(novel)
+    character = Character('Alfred')
+    novel.characters.append(character)
+    client.insert_character(novel, character)
+
+    character.document = Document('', character_id=character.id)
+    character.document.content = 'Backstory'
+    assert character.document.character(novel) is character
+
+    client.update_character(character)
+    client.update_novel(novel)
+
+    saved_novel = client.fetch_novel(novel.id)
+    assert saved_novel.characters[0].document.id == character.document.id
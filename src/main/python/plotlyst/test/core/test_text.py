@@ -1,8 +1,6 @@
-import nltk
+from textstat import textstat
 
-from plotlyst.core.text import wc, sentence_count
-
-nltk.download('punkt')
+from plotlyst.core.text import wc, sentence_count, clean_text, text_statistics, TextStatistics
 
 
 def test_wc():
@@ -35,3 +33,39 @@ def test_sentence_count():
     assert sentence_count('Mr. Anderson. Hello.') == 2
     assert sentence_count('Dr. Anderson. Hello.') == 2
     assert sentence_count('Hello John F. Kennedy. This is my second sentence.') == 2
+
+
+# the sentence counts of the former nltk punkt based splitter
+corpus = [
+    ('Simple sentence with five words.', 1),
+    ("Four words's 1 sentence.", 1),
+    ('I-I don’t know. What about French ?', 2),
+    ('"Hello," said John. Then he grabbed the torch.', 2),
+    ('At 8 a.m., then we shall meet. Mr. Anderson was late—again.', 2),
+    ('She ran; he walked (slowly) - and the rain kept falling... Nobody cared!', 2),
+    ('“No, too many quotation marks I’m afraid.” Was it?', 2),
+    ('The extraordinary circumstances necessitated an unprecedented investigation into municipal irregularities.', 1),
+    ('', 0),
+]
+
+
+def test_text_statistics_regression(monkeypatch):
+    for text, sentences in corpus:
+        monkeypatch.setattr(textstat, 'sentence_count', lambda _: sentences)
+        statistics = text_statistics(text)
+        cleaned_text = clean_text(text)
+        assert statistics.wc == textstat.lexicon_count(text.replace('—', ' '))
+        assert statistics.wc == wc(text)
+        assert statistics.sentences == sentences
+        assert statistics.lexicon == textstat.lexicon_count(cleaned_text)
+        assert statistics.syllables == textstat.syllable_count(cleaned_text)
+        if statistics.lexicon:
+            assert statistics.flesch_reading_ease() == textstat.flesch_reading_ease(cleaned_text)
+
+
+def test_text_statistics_per_block():
+    blocks = ['One sentence. Two sentence.', 'Another block here.', '']
+    statistics = sum([text_statistics(x) for x in blocks], TextStatistics())
+    assert statistics.wc == 7
+    assert statistics.sentences == 3
+    assert statistics.avg_sentence_length() == 7 / 3
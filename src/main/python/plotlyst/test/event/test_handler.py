@@ -0,0 +1,149 @@
+import gc
+import weakref
+from dataclasses import dataclass
+
+from PyQt6.QtCore import QObject
+
+from plotlyst.core.domain import Scene
+from plotlyst.event.core import Event, EventListener
+from plotlyst.event.handler import EventDispatcher
+
+
+@dataclass
+class SceneEvent(Event):
+    scene: Scene
+
+
+@dataclass
+class SceneSubEvent(SceneEvent):
+    pass
+
+
+class RecordingListener(EventListener):
+    def __init__(self, events=None):
+        self.events = events if events is not None else []
+
+    def event_received(self, event: Event):
+        self.events.append(event)
+
+
+def test_dispatch_exact_type():
+    dispatcher = EventDispatcher()
+    listener = RecordingListener()
+    dispatcher.register(listener, SceneEvent)
+
+    event = SceneEvent(None, Scene('Scene'))
+    dispatcher.dispatch(event)
+    assert listener.events == [event]
+
+
+def test_dispatch_subclass():
+    dispatcher = EventDispatcher()
+    listener = RecordingListener()
+    dispatcher.register(listener, SceneEvent, SceneSubEvent)
+
+    event = SceneSubEvent(None, Scene('Scene'))
+    dispatcher.dispatch(event)
+    assert listener.events == [event]
+
+
+def test_dispatch_subclass_to_base_listener():
+    dispatcher = EventDispatcher()
+    listener = RecordingListener()
+    dispatcher.register(listener, SceneEvent)
+
+    event = SceneSubEvent(None, Scene('Scene'))
+    dispatcher.dispatch(event)
+    dispatcher.dispatch(event)
+    assert listener.events == [event, event]
+
+
+def test_skip_source():
+    dispatcher = EventDispatcher()
+    listener = RecordingListener()
+    dispatcher.register(listener, SceneEvent)
+
+    dispatcher.dispatch(SceneEvent(listener, Scene('Scene')))
+    assert listener.events == []
+
+
+def test_deregister():
+    dispatcher = EventDispatcher()
+    listener = RecordingListener()
+    dispatcher.register(listener, SceneEvent)
+    dispatcher.dispatch(SceneEvent(None, Scene('Scene')))
+    dispatcher.deregister(listener, SceneEvent)
+    dispatcher.dispatch(SceneEvent(None, Scene('Scene')))
+
+    assert len(listener.events) == 1
+
+
+def test_weak_listener():
+    dispatcher = EventDispatcher()
+    events = []
+    listener = RecordingListener(events)
+    dispatcher.register(listener, SceneEvent, weak=True)
+    dispatcher.dispatch(SceneEvent(None, Scene('Scene')))
+    assert len(events) == 1
+
+    del listener
+    gc.collect()
+    dispatcher.dispatch(SceneEvent(None, Scene('Scene')))
+    dispatcher.dispatch(SceneSubEvent(None, Scene('Scene')))
+    assert len(events) == 1
+
+
+class QObjectListener(QObject, EventListener):
+    def __init__(self, events):
+        super().__init__()
+        self.events = events
+
+    def event_received(self, event: Event):
+        self.events.append(event)
+
+
+def test_weak_qobject_listener():
+    dispatcher = EventDispatcher()
+    events = []
+    listener = QObjectListener(events)
+    dispatcher.register(listener, SceneEvent, weak=True)
+    dispatcher.dispatch(SceneEvent(None, Scene('Scene')))
+    assert len(events) == 1
+
+    ref = weakref.ref(listener)
+    del listener
+    assert ref() is None
+    dispatcher.dispatch(SceneEvent(None, Scene('Scene')))
+    assert len(events) == 1
+
+
+def test_batch_coalesces_per_entity():
+    dispatcher = EventDispatcher()
+    listener = RecordingListener()
+    dispatcher.register(listener, SceneEvent)
+    scene_1 = Scene('Scene 1')
+    scene_2 = Scene('Scene 2')
+
+    with dispatcher.batch():
+        dispatcher.dispatch(SceneEvent(None, scene_1))
+        dispatcher.dispatch(SceneEvent(None, scene_2))
+        with dispatcher.batch():
+            dispatcher.dispatch(SceneEvent(None, scene_1))
+        assert listener.events == []
+
+    assert [x.scene for x in listener.events] == [scene_2, scene_1]
+
+
+def test_timings():
+    dispatcher = EventDispatcher()
+    listener = RecordingListener()
+    dispatcher.register(listener, SceneEvent)
+    dispatcher.set_profiling_enabled(True)
+
+    dispatcher.dispatch(SceneEvent(None, Scene('Scene')))
+    dispatcher.dispatch(SceneEvent(None, Scene('Scene')))
+
+    timings = dispatcher.timings()
+    assert len(timings) == 1
+    assert timings[0].listener == 'RecordingListener.SceneEvent'
+    assert timings[0].calls == 2
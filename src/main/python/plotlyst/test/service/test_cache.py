@@ -0,0 +1,201 @@
+from datetime import date
+
+from plotlyst.core.domain import Novel, Scene, StoryBeat, StoryStructure, Character, DocumentProgress, Chapter, \
+    Comment, NovelDescriptor, StoryType
+from plotlyst.events import SceneChangedEvent, SceneOrderChangedEvent, CharacterChangedEvent, \
+    CharacterDeletedEvent, SceneDeletedEvent
+from plotlyst.service.cache import NovelActsRegistry, EntitiesRegistry, NovelProgressRegistry, CommentsRegistry, \
+    LibraryIndex
+
+
+def _novel():
+    end_act_1 = StoryBeat('End of act 1', act=1, ends_act=True)
+    midpoint = StoryBeat('Midpoint', act=2)
+    end_act_2 = StoryBeat('End of act 2', act=2, ends_act=True)
+    structure = StoryStructure('Test structure', active=True, beats=[end_act_1, midpoint, end_act_2])
+    novel = Novel('Test novel', story_structures=[structure])
+    novel.scenes.extend([Scene(f'Scene {i + 1}') for i in range(6)])
+
+    return novel, structure
+
+
+def test_acts():
+    novel, structure = _novel()
+    novel.scenes[1].link_beat(structure, structure.beats[0])
+    novel.scenes[4].link_beat(structure, structure.beats[2])
+
+    registry = NovelActsRegistry()
+    registry.set_novel(novel)
+
+    assert [registry.act(x) for x in novel.scenes] == [1, 1, 2, 2, 2, 3]
+    assert registry.occupied(structure.beats[0])
+    assert not registry.occupied(structure.beats[1])
+    assert registry.scene(structure.beats[2]) is novel.scenes[4]
+
+
+def test_acts_incremental_update():
+    novel, structure = _novel()
+    novel.scenes[1].link_beat(structure, structure.beats[0])
+    registry = NovelActsRegistry()
+    registry.set_novel(novel)
+    version = registry.version()
+
+    novel.scenes[0].synopsis = 'New synopsis'
+    registry.event_received(SceneChangedEvent(None, novel.scenes[0]))
+    assert registry.version() == version
+
+    novel.scenes[3].link_beat(structure, structure.beats[2])
+    registry.event_received(SceneChangedEvent(None, novel.scenes[3]))
+    assert registry.version() > version
+    assert [registry.act(x) for x in novel.scenes] == [1, 1, 2, 2, 3, 3]
+
+    novel.scenes.insert(0, novel.scenes.pop())
+    registry.event_received(SceneOrderChangedEvent(None))
+    assert [registry.act(x) for x in novel.scenes] == [1, 1, 1, 2, 2, 3]
+
+
+def test_entities_incremental_update():
+    novel = Novel('Test novel')
+    character = Character('Alfred')
+    novel.characters.append(character)
+    registry = EntitiesRegistry()
+    registry.set_novel(novel)
+    assert registry.character(str(character.id)) is character
+
+    new_character = Character('Babel')
+    novel.characters.append(new_character)
+    registry.event_received(CharacterChangedEvent(None, new_character))
+    assert registry.character(str(new_character.id)) is new_character
+
+    novel.characters.remove(character)
+    registry.event_received(CharacterDeletedEvent(None, character))
+    assert registry.character(str(character.id)) is None
+
+
+def test_entities_import_several_characters():
+    novel = Novel('Test novel')
+    registry = EntitiesRegistry()
+    registry.set_novel(novel)
+
+    imported = [Character('Alfred'), Character('Babel'), Character('Cecil')]
+    novel.characters.extend(imported)
+    registry.event_received(CharacterChangedEvent(None, imported[0]))
+    assert all(registry.character(str(x.id)) is x for x in imported)
+
+
+def test_progress_by_day():
+    novel = Novel('Test novel')
+    novel.manuscript_progress['2024-01-30'] = DocumentProgress(100, 10)
+    novel.manuscript_progress['2024-01-31'] = DocumentProgress(200)
+    novel.manuscript_progress['invalid'] = DocumentProgress(50, 5)
+
+    registry = NovelProgressRegistry()
+    registry.set_novel(novel)
+
+    assert registry.day_progress(date(2024, 1, 31)) == DocumentProgress(200)
+    assert registry.day_progress(date(2024, 2, 2)) is None
+
+    registry.add_progress(date(2024, 1, 31), 20, 5)
+    assert registry.day_progress(date(2024, 1, 31)) == DocumentProgress(220, 5)
+
+
+def test_productivity_streak():
+    novel = Novel('Test novel')
+    writing, planning = novel.productivity.categories[:2]
+    novel.productivity.progress['2024-03-01'] = str(writing.id)
+    novel.productivity.progress['2024-03-03'] = str(planning.id)
+
+    registry = NovelProgressRegistry()
+    registry.set_novel(novel)
+    assert registry.productivity(date(2024, 3, 1)) is writing
+    assert registry.productivity(date(2024, 3, 2)) is None
+    assert registry.productivity_streak(date(2024, 3, 3)) == 1
+    assert registry.productivity_streak(date(2024, 3, 4)) == 1
+    assert registry.productivity_streak(date(2024, 3, 5)) == 0
+
+    registry.set_productivity(date(2024, 3, 2), writing)
+    assert registry.productivity_streak(date(2024, 3, 3)) == 3
+    registry.set_productivity(date(2024, 3, 3), writing)
+    assert registry.productivity(date(2024, 3, 3)) is writing
+    assert registry.productivity_streak(date(2024, 3, 3)) == 3
+
+
+def test_comments_index():
+    novel, _ = _novel()
+    chapter = Chapter('Chapter 1')
+    novel.chapters.append(chapter)
+    novel.scenes[1].chapter = chapter
+    novel.scenes[1].comments.append(Comment('Fix the pacing'))
+    novel.scenes[4].comments.append(Comment('Typo', resolved=True))
+    novel.scenes[0].comments.append(Comment('Too much exposition'))
+
+    registry = CommentsRegistry()
+    registry.set_novel(novel)
+    assert registry.count() == 3
+    assert [x.text for _, x in registry.comments()] == ['Too much exposition', 'Fix the pacing', 'Typo']
+    assert [x.text for _, x in registry.comments(resolved=False)] == ['Too much exposition', 'Fix the pacing']
+    assert [x.text for _, x in registry.comments(chapter=chapter)] == ['Fix the pacing']
+    assert [x.text for _, x in registry.comments(text='PACING')] == ['Fix the pacing']
+    assert not registry.comments(scene=novel.scenes[2])
+
+    comment = novel.scenes[1].comments[0]
+    comment.text = 'Slow down the ending'
+    registry.comment_changed(comment)
+    assert not registry.comments(text='pacing')
+    assert registry.comments(text='ending') == [(novel.scenes[1], comment)]
+
+    novel.scenes[1].comments.clear()
+    registry.comment_removed(novel.scenes[1], comment)
+    novel.scenes[2].comments.append(Comment('New'))
+    registry.comment_added(novel.scenes[2], novel.scenes[2].comments[0])
+    assert [x.text for _, x in registry.comments()] == ['Too much exposition', 'New', 'Typo']
+
+    novel.scenes.insert(0, novel.scenes.pop(4))
+    registry.event_received(SceneOrderChangedEvent(None))
+    assert [x.text for _, x in registry.comments()] == ['Typo', 'Too much exposition', 'New']
+
+    scene = novel.scenes.pop(1)
+    registry.event_received(SceneDeletedEvent(None, scene))
+    assert [x.text for _, x in registry.comments()] == ['Typo', 'New']
+    assert registry.count() == 2
+
+
+def test_library_index():
+    series = NovelDescriptor('Saga', story_type=StoryType.Series)
+    first = NovelDescriptor('The beginning', parent=series.id, sequence=0)
+    second = NovelDescriptor('The end', subtitle='Dragons return', parent=series.id, sequence=1)
+    standalone = NovelDescriptor('Standalone')
+
+    index = LibraryIndex()
+    index.set_novels([second, standalone, series, first])
+    assert index.top_level() == [standalone, series]
+    assert index.children(series) == [first, second]
+    assert index.series(first) is series
+
+    assert index.filter('') == {x.id for x in [series, first, second, standalone]}
+    assert index.filter('dragons') == {second.id, series.id}
+    assert index.filter('saga END') == {second.id, series.id}
+    assert index.filter('saga') == {series.id, first.id, second.id}
+    assert not index.filter('missing')
+
+    first.sequence = 2
+    assert index.update(first)
+    assert index.children(series) == [second, first]
+    assert not index.update(first)
+
+    series.title = 'Chronicles'
+    index.update(series)
+    assert index.filter('chronicles beginning') == {first.id, series.id}
+
+    second.parent = None
+    assert index.update(second)
+    assert index.children(series) == [first]
+    assert index.top_level() == [second, standalone, series]
+
+    novel = NovelDescriptor('New', parent=series.id, sequence=0)
+    index.add(novel)
+    assert index.children(series) == [novel, first]
+
+    index.remove(series)
+    assert index.series(first) is None
+    assert index.top_level() == [second, standalone, first, novel]
@@ -0,0 +1,93 @@
+import json
+import time
+
+from plotlyst.event.core import Event, EventListener
+from plotlyst.event.handler import EventDispatcher
+from plotlyst.service.diagnostics import LatencyMonitor, latency_monitor, monitored
+
+
+class SlowListener(EventListener):
+    def event_received(self, event: Event):
+        time.sleep(0.03)
+
+
+def test_record_threshold():
+    monitor = LatencyMonitor(threshold=0.05)
+    assert monitor.record('fast', 0.01) is None
+    stall = monitor.record('slow', 0.2)
+    monitor.record('slow', 0.1)
+
+    assert stall.source == 'slow'
+    assert monitor.recent()[0] == stall
+    offender = monitor.offenders()[0]
+    assert offender.source == 'slow'
+    assert offender.count == 2
+    assert offender.max == 0.2
+
+
+def test_innermost_section_is_attributed():
+    monitor = LatencyMonitor(threshold=0.01)
+    monitor.enabled = True
+    with monitor.section('outer'):
+        with monitor.section('inner'):
+            time.sleep(0.02)
+
+    assert [x.source for x in monitor.recent()] == ['inner']
+
+
+def test_disabled_section_is_noop():
+    monitor = LatencyMonitor(threshold=0.0)
+    with monitor.section('disabled'):
+        pass
+    assert not monitor.recent()
+
+    @monitored
+    def slow():
+        time.sleep(0.01)
+        return 1
+
+    latency_monitor.clear()
+    assert slow() == 1
+    assert not latency_monitor.recent()
+
+
+def test_offenders_are_bounded():
+    monitor = LatencyMonitor(threshold=0.0, capacity=5, offenders=3)
+    for i in range(10):
+        monitor.record(f'source {i}', 0.1 + i)
+
+    assert len(monitor.recent()) == 5
+    assert [x.source for x in monitor.offenders()] == ['source 9', 'source 8', 'source 7']
+
+
+def test_export_report(tmp_path):
+    monitor = LatencyMonitor(threshold=0.0)
+    monitor.record('slow', 0.25, ['plotlyst/view/main_window.py:10 in refresh'])
+    monitor.add_report_section('avatars', lambda: {'hits': 3})
+
+    path = tmp_path.joinpath('report.json')
+    monitor.export(str(path))
+    with open(path) as f:
+        report = json.load(f)
+    assert report['offenders'][0]['source'] == 'slow'
+    assert report['offenders'][0]['max_ms'] == 250.0
+    assert report['recent'][0]['stack'] == ['plotlyst/view/main_window.py:10 in refresh']
+    assert report['avatars'] == {'hits': 3}
+
+
+def test_dispatcher_attribution(qtbot):
+    dispatcher = EventDispatcher()
+    dispatcher.register(SlowListener(), Event)
+
+    latency_monitor.clear()
+    threshold = latency_monitor.threshold()
+    latency_monitor.set_threshold(0.02)
+    latency_monitor.set_enabled(True)
+    try:
+        dispatcher.dispatch(Event(None))
+    finally:
+        latency_monitor.set_enabled(False)
+        latency_monitor.set_threshold(threshold)
+
+    assert latency_monitor.offenders()[0].source == 'SlowListener.Event'
+    latency_monitor.clear()
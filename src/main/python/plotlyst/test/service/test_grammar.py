@@ -0,0 +1,124 @@
+from plotlyst.service.grammar import LanguageToolPool, LanguageToolState, language_tool_proxy
+
+
+class FakeLanguageTool:
+    def __init__(self, lang: str):
+        self._language = lang
+        self.closed = False
+
+    @property
+    def language(self) -> str:
+        return self._language
+
+    @language.setter
+    def language(self, lang: str):
+        if lang == 'xx':
+            raise ValueError('Unsupported language')
+        self._language = lang
+
+    def close(self):
+        self.closed = True
+
+
+class FakeFactory:
+    def __init__(self):
+        self.created = []
+
+    def __call__(self, lang: str):
+        if lang == 'xx':
+            raise IOError('Unsupported language')
+        tool = FakeLanguageTool(lang)
+        self.created.append(tool)
+        return tool
+
+
+def _ready(pool: LanguageToolPool, lang: str) -> bool:
+    return pool.status().get(lang) == LanguageToolState.READY
+
+
+def test_activate_switches_running_server(qtbot):
+    factory = FakeFactory()
+    pool = LanguageToolPool(factory)
+    try:
+        pool.activate('en-US')
+        assert pool.status() == {'en-US': LanguageToolState.STARTING}
+        qtbot.waitUntil(lambda: _ready(pool, 'en-US'))
+        assert language_tool_proxy.tool.language == 'en-US'
+
+        pool.activate('de-DE')
+        assert pool.status() == {'de-DE': LanguageToolState.READY}
+        assert language_tool_proxy.tool.language == 'de-DE'
+
+        pool.activate('xx')
+        assert language_tool_proxy.is_failed()
+        assert pool.status() == {'de-DE': LanguageToolState.READY, 'xx': LanguageToolState.FAILED}
+
+        pool.activate('en-US')
+        assert language_tool_proxy.tool.language == 'en-US'
+        assert len(factory.created) == 1
+    finally:
+        pool.close()
+        language_tool_proxy.reset()
+
+    assert all(x.closed for x in factory.created)
+    assert not language_tool_proxy.is_set()
+
+
+def test_activate_reuses_warm_instances(qtbot):
+    factory = FakeFactory()
+    pool = LanguageToolPool(factory, max_instances=2)
+    try:
+        pool.activate('en-US')
+        qtbot.waitUntil(lambda: _ready(pool, 'en-US'))
+
+        pool.activate('de-DE')
+        assert not language_tool_proxy.is_set()
+        qtbot.waitUntil(lambda: _ready(pool, 'de-DE'))
+        assert language_tool_proxy.tool.language == 'de-DE'
+
+        pool.activate('en-US')
+        assert language_tool_proxy.tool.language == 'en-US'
+        assert [x.language for x in factory.created] == ['en-US', 'de-DE']
+    finally:
+        pool.close()
+
+
+def test_least_recently_used_instance_is_switched(qtbot):
+    factory = FakeFactory()
+    pool = LanguageToolPool(factory, max_instances=2)
+    try:
+        for lang in ['en-US', 'de-DE', 'es']:
+            pool.activate(lang)
+            qtbot.waitUntil(lambda: _ready(pool, lang))
+
+        assert set(pool.status().keys()) == {'de-DE', 'es'}
+        assert [x.language for x in factory.created] == ['es', 'de-DE']
+    finally:
+        pool.close()
+
+
+def test_idle_instances_are_shut_down(qtbot):
+    factory = FakeFactory()
+    pool = LanguageToolPool(factory, max_instances=2, idle_timeout=0)
+    try:
+        pool.activate('en-US')
+        qtbot.waitUntil(lambda: _ready(pool, 'en-US'))
+        pool.activate('de-DE')
+        qtbot.waitUntil(lambda: _ready(pool, 'de-DE'))
+
+        pool.maintain()
+        assert pool.status() == {'de-DE': LanguageToolState.READY}
+    finally:
+        pool.close()
+
+
+def test_failed_instance(qtbot):
+    pool = LanguageToolPool(FakeFactory())
+    try:
+        pool.activate('xx')
+        qtbot.waitUntil(lambda: pool.status().get('xx') == LanguageToolState.FAILED)
+        assert pool.instance('xx').error == 'Unsupported language'
+        assert language_tool_proxy.is_failed()
+    finally:
+        pool.close()
+        language_tool_proxy.reset()
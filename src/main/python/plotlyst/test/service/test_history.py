@@ -0,0 +1,110 @@
+from plotlyst.core.client import json_client
+from plotlyst.core.domain import Scene, Document
+from plotlyst.service.history import take_snapshot, list_snapshots, snapshot_diff, restore_scene, \
+    restore_document, history_size, snapshot_store
+from plotlyst.test.conftest import init_project
+
+
+def test_first_snapshot(test_client):
+    novel = init_project()
+
+    snapshot = take_snapshot(novel, 'first')
+    assert list_snapshots(novel) == [snapshot]
+    assert snapshot.label == 'first'
+    assert snapshot.summary.added['scenes'] == len(novel.scenes)
+    assert not snapshot.summary.modified
+
+
+def test_snapshot_summary(test_client):
+    novel = init_project()
+    first = take_snapshot(novel)
+
+    novel.scenes[0].title = 'Changed title'
+    json_client.update_scene(novel.scenes[0])
+    scene = Scene('New scene')
+    novel.scenes.append(scene)
+    json_client.insert_scene(novel, scene)
+    json_client.update_novel(novel)
+
+    second = take_snapshot(novel)
+    assert second.summary.added == {'scenes': 1}
+    assert second.summary.modified == {'scenes': 1, 'novel': 1}
+    assert not second.summary.removed
+    assert str(second.summary) == '1 scenes added, 1 novel changed, 1 scenes changed'
+
+    diff = snapshot_diff(novel, first, second)
+    assert diff.added == [json_client.scene_file(novel, scene).relative_to(json_client.root_path).as_posix()]
+
+    third = take_snapshot(novel)
+    assert third.summary.is_empty()
+    assert third.tree == second.tree
+    assert snapshot_diff(novel, second, third).summary().is_empty()
+
+
+def test_storage_grows_with_changes(test_client):
+    novel = init_project()
+    take_snapshot(novel)
+    novel_size, initial_size = history_size(novel)
+
+    scene = novel.scenes[0]
+    for i in range(20):
+        scene.synopsis = f'Synopsis {i}'
+        json_client.update_scene(scene)
+        take_snapshot(novel)
+
+    _, size = history_size(novel)
+    assert len(list_snapshots(novel)) == 21
+    assert size - initial_size < 20 * novel_size / 2
+
+
+def test_stat_cache_skips_unchanged_files(test_client):
+    novel = init_project()
+    store = snapshot_store(novel)
+    take_snapshot(novel)
+
+    hashed = []
+    write_blob = store.write_blob
+
+    def _write_blob(data: bytes) -> str:
+        hashed.append(data)
+        return write_blob(data)
+
+    store.write_blob = _write_blob
+    store.take(json_client.root_path, json_client.novel_files(novel))
+    assert len(hashed) == 1 + len({x.parent for x in json_client.novel_files(novel)})
+
+
+def test_restore_scene(test_client):
+    novel = init_project()
+    scene = novel.scenes[0]
+    title = scene.title
+    synopsis = scene.synopsis
+    snapshot = take_snapshot(novel)
+
+    scene.title = 'Changed title'
+    scene.synopsis = 'Changed synopsis'
+    json_client.update_scene(scene)
+
+    assert restore_scene(novel, snapshot, scene)
+    assert scene.title == title
+    assert scene.synopsis == synopsis
+
+    persisted = json_client.fetch_novel(novel.id)
+    assert persisted.scenes[0].title == title
+
+
+def test_restore_document(test_client):
+    novel = init_project()
+    doc = Document('Notes')
+    doc.content = 'Original content'
+    doc.loaded = True
+    novel.documents.append(doc)
+    json_client.update_novel(novel)
+    json_client.update_document(novel, doc)
+    snapshot = take_snapshot(novel)
+
+    doc.content = 'Changed content'
+    json_client.update_document(novel, doc)
+
+    assert restore_document(novel, snapshot, doc)
+    assert doc.content == 'Original content'
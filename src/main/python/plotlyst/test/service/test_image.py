@@ -0,0 +1,51 @@
+from PyQt6.QtGui import QImage, QColor
+
+from plotlyst.core.client import json_client
+from plotlyst.core.domain import ImageRef, WorldBuildingMap
+from plotlyst.service.image import save_image
+from plotlyst.service.image_cleanup import remove_orphan_images, referenced_images
+from plotlyst.test.conftest import init_project
+
+
+def _image(color: str) -> QImage:
+    image = QImage(64, 64, QImage.Format.Format_ARGB32)
+    image.fill(QColor(color))
+    return image
+
+
+def test_save_duplicate_images(test_client):
+    novel = init_project()
+
+    refs = [save_image(novel, _image('red'), ImageRef('png')) for _ in range(10)]
+    assert all(x == refs[0] for x in refs)
+    assert len(json_client.image_files(novel)) == 1
+
+    other = save_image(novel, _image('blue'), ImageRef('png'))
+    assert other != refs[0]
+    assert len(json_client.image_files(novel)) == 2
+    assert not json_client.load_image(novel, other).isNull()
+
+
+def test_remove_orphan_images(test_client):
+    novel = init_project()
+    colors = ['red', 'green', 'blue', 'yellow', 'black']
+    refs = [save_image(novel, _image(color), ImageRef('png')) for color in colors for _ in range(5)]
+    assert len(json_client.image_files(novel)) == len(colors)
+
+    used = refs[0]
+    novel.world.maps.append(WorldBuildingMap(ref=used, title='Map'))
+    json_client.update_world(novel)
+    assert referenced_images(novel) == {f'{used.id}.{used.extension}'}
+
+    orphans = [x for x in json_client.image_files(novel) if x.name != f'{used.id}.{used.extension}']
+    size = sum(x.stat().st_size for x in orphans)
+
+    result = remove_orphan_images(novel, dry_run=True)
+    assert sorted(result.removed) == sorted(x.name for x in orphans)
+    assert result.reclaimed == size
+    assert len(json_client.image_files(novel)) == len(colors)
+
+    result = remove_orphan_images(novel)
+    assert result.reclaimed == size
+    assert [x.name for x in json_client.image_files(novel)] == [f'{used.id}.{used.extension}']
+    assert not remove_orphan_images(novel).removed
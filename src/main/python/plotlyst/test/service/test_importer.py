@@ -0,0 +1,40 @@
+from plotlyst.core.client import json_client
+from plotlyst.core.domain import Novel
+from plotlyst.service.importer import SeriesNovelCache, NovelLoadingResult
+from plotlyst.test.conftest import init_project
+
+
+def _fetch(qtbot, cache: SeriesNovelCache, novel):
+    result = NovelLoadingResult()
+    with qtbot.waitSignal(result.finished) as blocker:
+        cache.fetch(novel.id, result)
+    return blocker.args[0]
+
+
+def test_series_cache(qtbot, test_client):
+    novel = init_project()
+    cache = SeriesNovelCache()
+    assert cache.novel(novel.id) is None
+
+    fetched = _fetch(qtbot, cache, novel)
+    assert fetched.id == novel.id
+    assert len(fetched.scenes) == len(novel.scenes)
+    assert cache.novel(novel.id) is fetched
+    assert _fetch(qtbot, cache, novel) is fetched
+
+    json_client.update_scene(novel.scenes[0])
+    assert cache.novel(novel.id) is None
+    assert _fetch(qtbot, cache, novel) is not fetched
+
+
+def test_series_cache_capacity(qtbot, test_client):
+    novel = init_project()
+    cache = SeriesNovelCache(capacity=1)
+    other = Novel('Other novel')
+    json_client.insert_novel(other)
+
+    cache.preload([other])
+    qtbot.waitUntil(lambda: cache.novel(other.id) is not None)
+    _fetch(qtbot, cache, novel)
+    assert cache.novel(novel.id) is not None
+    assert cache.novel(other.id) is None
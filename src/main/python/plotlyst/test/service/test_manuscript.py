@@ -0,0 +1,117 @@
+import zipfile
+
+from plotlyst.core.client import json_client
+from plotlyst.core.domain import Novel, Scene, Document
+from plotlyst.service.manuscript import DocxManuscriptParser, DocxImportResult, _count_docx_paragraphs, \
+    ManuscriptPrefetcher
+from plotlyst.test.conftest import init_project
+
+MANUSCRIPT = ['# My novel', '', '## Chapter one', '', 'First paragraph.', '', 'Second paragraph.', '',
+              '### Not a chapter', '', '## Chapter two', '', 'Third paragraph with more words.']
+
+
+def _parse(lines, chapter_heading_level: int = 2, infer_scene_titles: bool = False) -> Novel:
+    novel = Novel.new_novel('docx')
+    novel.scenes.clear()
+    novel.chapters.clear()
+    parser = DocxManuscriptParser(novel, chapter_heading_level, infer_scene_titles)
+    for line in lines:
+        parser.feed(line)
+    return parser.finish()
+
+
+def test_parse_chapters_and_scenes():
+    novel = _parse(MANUSCRIPT)
+
+    assert novel.title == 'My novel'
+    assert len(novel.chapters) == 2
+    assert len(novel.scenes) == 2
+    assert novel.scenes[0].chapter is novel.chapters[0]
+    assert novel.scenes[0].title == ''
+    assert 'Second paragraph.' in novel.scenes[0].manuscript.content
+    assert novel.scenes[0].manuscript.statistics.wc == 7
+    assert novel.scenes[1].manuscript.statistics.wc == 5
+
+
+def test_parse_inherit_scene_titles():
+    novel = _parse(MANUSCRIPT, infer_scene_titles=True)
+    assert [x.title for x in novel.scenes] == ['Chapter one', 'Chapter two']
+
+
+def test_parse_first_level_chapters():
+    novel = _parse(['# Part one', 'Text', '# Part two', 'More text'], chapter_heading_level=1,
+                   infer_scene_titles=True)
+    assert novel.title == 'docx'
+    assert len(novel.chapters) == 2
+    assert [x.title for x in novel.scenes] == ['Part one', 'Part two']
+
+
+def test_count_docx_paragraphs(tmp_path):
+    path = tmp_path.joinpath('manuscript.docx')
+    with zipfile.ZipFile(path, 'w') as docx:
+        docx.writestr('word/document.xml', '<w:body>' + '<w:p w:rsidR="1"><w:r>text</w:r></w:p>' * 50000 + '<w:p/>'
+                      + '<w:p></w:p></w:body>')
+    assert _count_docx_paragraphs(str(path)) == 50001
+
+
+def test_cancel_import_result(qtbot):
+    result = DocxImportResult()
+    assert not result.is_cancelled()
+    result.cancel()
+    assert result.is_cancelled()
+
+
+def _manuscript_project(scenes: int) -> Novel:
+    novel = init_project()
+    novel.scenes.clear()
+    for i in range(scenes):
+        scene = Scene(f'Scene {i}', manuscript=Document(''))
+        scene.manuscript.content = f'<p>Scene {i} text</p>'
+        novel.scenes.append(scene)
+        json_client.update_document(novel, scene.manuscript)
+        scene.manuscript.content = ''
+        scene.manuscript.loaded = False
+    return novel
+
+
+def test_prefetch_neighbour_scenes(qtbot, test_client):
+    novel = _manuscript_project(6)
+    prefetcher = ManuscriptPrefetcher(novel, radius=1)
+
+    prefetcher.prefetch([novel.scenes[2]])
+    qtbot.waitUntil(lambda: novel.scenes[1].manuscript.loaded and novel.scenes[3].manuscript.loaded)
+    assert novel.scenes[3].manuscript.content == '<p>Scene 3 text</p>'
+    assert not novel.scenes[0].manuscript.loaded
+    assert not novel.scenes[4].manuscript.loaded
+    assert prefetcher.size() == len('<p>Scene 1 text</p>') * 2
+
+    json_client.load_document(novel, novel.scenes[3].manuscript)
+    prefetcher.prefetch([novel.scenes[3]])
+    assert not prefetcher.isPrefetched(novel.scenes[3].manuscript)
+    qtbot.waitUntil(lambda: novel.scenes[4].manuscript.loaded)
+
+
+def test_prefetch_budget(qtbot, test_client):
+    novel = _manuscript_project(6)
+    size = len('<p>Scene 1 text</p>')
+    prefetcher = ManuscriptPrefetcher(novel, radius=2, budget=size * 3)
+
+    prefetcher.prefetch([novel.scenes[0]])
+    qtbot.waitUntil(lambda: novel.scenes[2].manuscript.loaded)
+    prefetcher.prefetch([novel.scenes[5]])
+    qtbot.waitUntil(lambda: novel.scenes[3].manuscript.loaded)
+
+    assert prefetcher.size() <= size * 3
+    assert novel.scenes[4].manuscript.loaded
+    assert not novel.scenes[1].manuscript.loaded
+
+
+def test_cancel_prefetch(qtbot, test_client):
+    novel = _manuscript_project(3)
+    prefetcher = ManuscriptPrefetcher(novel)
+
+    prefetcher.prefetch([novel.scenes[0]])
+    prefetcher.cancel()
+    qtbot.wait(50)
+    assert not any(x.manuscript.loaded for x in novel.scenes)
+    assert prefetcher.size() == 0
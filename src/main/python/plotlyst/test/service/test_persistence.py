@@ -0,0 +1,153 @@
+import os
+
+import pytest
+
+from plotlyst.core.client import json_client
+from plotlyst.core.domain import Character, Scene
+from plotlyst.env import app_env
+from plotlyst.service.journal import JOURNAL_FILE_NAME
+from plotlyst.service.persistence import RepositoryPersistenceManager, _persist_operations
+from plotlyst.test.conftest import init_project
+
+
+class CrashingRepository(RepositoryPersistenceManager):
+
+    def _persist_if_test_env(self):
+        pass
+
+
+def _edit(repo: RepositoryPersistenceManager, novel, i: int):
+    if i % 3 == 0:
+        novel.scenes[0].title = f'Title {i}'
+        repo.update_scene(novel.scenes[0])
+    elif i % 3 == 1:
+        character = Character(f'Character {i}')
+        novel.characters.append(character)
+        repo.insert_character(novel, character)
+    else:
+        scene = Scene(f'Scene {i}')
+        novel.scenes.append(scene)
+        repo.insert_scene(novel, scene)
+
+
+def _crash(repo: RepositoryPersistenceManager):
+    repo.journal().close()
+
+
+def _restart(novel):
+    repo = RepositoryPersistenceManager()
+    json_client.init(json_client.root_path)
+    app_env.novel = novel
+    return repo
+
+
+def _assert_edits(novel, edits: int):
+    persisted = json_client.fetch_novel(novel.id)
+    names = [x.name for x in persisted.characters]
+    titles = [x.title for x in persisted.scenes]
+    for i in range(edits):
+        if i % 3 == 1:
+            assert f'Character {i}' in names
+        elif i % 3 == 2:
+            assert f'Scene {i}' in titles
+    last_title_edit = max([i for i in range(edits) if i % 3 == 0], default=None)
+    if last_title_edit is not None:
+        assert titles[0] == f'Title {last_title_edit}'
+
+
+@pytest.mark.parametrize('crash_at', [1, 4, 9])
+def test_recover_queued_operations(qtbot, test_client, crash_at):
+    novel = init_project()
+    repo = CrashingRepository()
+    for i in range(crash_at):
+        _edit(repo, novel, i)
+    _crash(repo)
+
+    repo = _restart(novel)
+    assert repo.pending_recovery()
+    repo.recover()
+    assert not repo.pending_recovery()
+
+    _assert_edits(novel, crash_at)
+
+
+def test_recover_with_torn_last_entry(qtbot, test_client):
+    novel = init_project()
+    repo = CrashingRepository()
+    for i in range(5):
+        _edit(repo, novel, i)
+    path = repo.journal().path()
+    _crash(repo)
+
+    with open(path, 'rb') as journal_file:
+        data = journal_file.read()
+    last_entry = data.rstrip(b'\n').rfind(b'\n') + 1
+    for cut in [last_entry + 1, (last_entry + len(data)) // 2, len(data) - 2]:
+        with open(path, 'wb') as journal_file:
+            journal_file.write(data[:cut])
+
+        repo = _restart(novel)
+        repo.recover()
+        _crash(repo)
+        _assert_edits(novel, 4)
+
+
+def test_recover_after_interrupted_flush(qtbot, test_client):
+    novel = init_project()
+    repo = CrashingRepository()
+    for i in range(6):
+        _edit(repo, novel, i)
+
+    _persist_operations(repo._operations[:3])
+    _crash(repo)
+
+    repo = _restart(novel)
+    repo.recover()
+    _assert_edits(novel, 6)
+
+
+def test_flush_checkpoints_journal(qtbot, test_client):
+    novel = init_project()
+    repo = CrashingRepository()
+    for i in range(3):
+        _edit(repo, novel, i)
+    repo.flush(sync=True)
+    assert os.path.getsize(os.path.join(json_client.root_path, JOURNAL_FILE_NAME)) == 0
+
+    _edit(repo, novel, 3)
+    _crash(repo)
+    repo = _restart(novel)
+    assert repo.pending_recovery() == 1
+    repo.discard_recovery()
+    assert not repo.pending_recovery()
+
+
+def test_recover_background_journal(qtbot, test_client, monkeypatch):
+    novel = init_project()
+    repo = CrashingRepository()
+    monkeypatch.setattr(app_env, 'test_env', lambda: False)
+    for i in range(4):
+        _edit(repo, novel, i)
+    qtbot.waitUntil(lambda: repo.journal().seq() > 0, timeout=3000)
+    repo._worker.waitForDone()
+    _crash(repo)
+
+    monkeypatch.undo()
+    repo = _restart(novel)
+    assert repo.pending_recovery()
+    repo.recover()
+    _assert_edits(novel, 4)
+
+
+def test_background_flush_checkpoints_journal(qtbot, test_client, monkeypatch):
+    novel = init_project()
+    repo = CrashingRepository()
+    monkeypatch.setattr(app_env, 'test_env', lambda: False)
+    for i in range(3):
+        _edit(repo, novel, i)
+    assert repo.flush()
+    _edit(repo, novel, 3)
+    assert repo.flush(sync=True)
+
+    assert os.path.getsize(os.path.join(json_client.root_path, JOURNAL_FILE_NAME)) == 0
+    _assert_edits(novel, 4)
@@ -0,0 +1,60 @@
+import os
+import subprocess
+import sys
+
+from PyQt6.QtGui import QImage, QColor
+
+from plotlyst.cli import main
+from plotlyst.core.client import json_client
+from plotlyst.core.domain import ImageRef
+from plotlyst.test.conftest import init_project
+
+
+def test_validate(test_client, tmp_path, capsys):
+    novel = init_project()
+    assert main([str(tmp_path), 'validate']) == 0
+
+    os.remove(json_client.scenes_dir(novel).joinpath(f'{novel.scenes[0].id}.json'))
+    assert main([str(tmp_path), 'validate', '--repair']) == 0
+    assert 'Missing scene file' in capsys.readouterr().out
+
+    novel = json_client.fetch_novel(novel.id)
+    assert len(novel.scenes) == 1
+
+
+def test_stats(test_client, tmp_path, capsys):
+    init_project()
+    assert main([str(tmp_path), 'stats']) == 0
+    assert 'Test Novel: 0 words, 2 scenes, 2 chapters, 5 characters' in capsys.readouterr().out
+
+
+def test_invalid_workspace(tmp_path):
+    assert main([str(tmp_path.joinpath('missing')), 'stats']) == 2
+
+
+def test_history(test_client, tmp_path, capsys):
+    init_project()
+    assert main([str(tmp_path), 'snapshot', '--label', 'Draft']) == 0
+    assert main([str(tmp_path), 'history']) == 0
+    out = capsys.readouterr().out
+    assert '"Draft": 5 characters added' in out
+
+
+def test_prune_images(test_client, tmp_path, capsys):
+    novel = init_project()
+    image = QImage(16, 16, QImage.Format.Format_ARGB32)
+    image.fill(QColor('red'))
+    json_client.save_image(novel, ImageRef('png'), image)
+
+    assert main([str(tmp_path), 'prune-images', '--dry-run']) == 0
+    assert 'Test Novel: 1 orphaned images removed' in capsys.readouterr().out
+    assert len(json_client.image_files(novel)) == 1
+
+    assert main([str(tmp_path), 'prune-images']) == 0
+    assert not json_client.image_files(novel)
+
+
+def test_headless_import():
+    code = 'import sys, plotlyst.cli; print(sorted(x for x in sys.modules if x.startswith("plotlyst.view")))'
+    result = subprocess.run([sys.executable, '-c', code], capture_output=True, text=True, check=True)
+    assert result.stdout.strip() == "['plotlyst.view', 'plotlyst.view.style', 'plotlyst.view.style.theme']"
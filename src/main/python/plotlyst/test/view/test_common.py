@@ -0,0 +1,32 @@
+from PyQt6.QtWidgets import QWidget, QVBoxLayout, QScrollArea, QLabel
+
+from plotlyst.view.common import LazyPopulator
+
+
+def test_lazy_populator(qtbot):
+    scroll = QScrollArea()
+    scroll.setWidgetResizable(True)
+    scroll.resize(200, 300)
+    container = QWidget()
+    QVBoxLayout(container)
+    placeholders = []
+    for i in range(50):
+        placeholder = QLabel(f'Placeholder {i}')
+        placeholder.setFixedHeight(100)
+        container.layout().addWidget(placeholder)
+        placeholders.append(placeholder)
+    scroll.setWidget(container)
+    qtbot.addWidget(scroll)
+
+    populated = []
+    populator = LazyPopulator(container, lambda: [x for x in placeholders if x not in populated], populated.append,
+                              margin=100)
+    scroll.show()
+    populator.schedule()
+    qtbot.waitUntil(lambda: len(populated) > 0)
+    assert placeholders[0] in populated
+    assert len(populated) < 10
+
+    scroll.verticalScrollBar().setValue(scroll.verticalScrollBar().maximum())
+    qtbot.waitUntil(lambda: placeholders[-1] in populated)
+    assert len(populated) < 20
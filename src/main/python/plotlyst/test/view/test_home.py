@@ -1,8 +1,10 @@
 from plotlyst.core.client import client
+from plotlyst.core.domain import NovelDescriptor, StoryType
 from plotlyst.test.common import go_to_home, patch_confirmed, go_to_novel, type_text
 from plotlyst.view.home_view import HomeView
 from plotlyst.view.main_window import MainWindow
 from plotlyst.view.novel_view import NovelView
+from plotlyst.view.widget.library import ShelvesTreeView
 
 
 def test_delete_novel(qtbot, filled_window: MainWindow, monkeypatch):
@@ -37,3 +39,53 @@ def test_edit_novel(qtbot, filled_window: MainWindow):
 
     novel_view: NovelView = go_to_novel(filled_window)
     assert novel_view.ui.lblTitle.text() == new_title
+
+
+def test_filter_novels(qtbot, filled_window: MainWindow):
+    view: HomeView = go_to_home(filled_window)
+
+    shelves = view.shelves()
+    novel = shelves.novels()[0]
+    node = shelves._novels[novel]
+    assert not node.isHidden()
+
+    type_text(qtbot, view._searchField.lineSearch, 'no such novel')
+    assert node.isHidden()
+
+    view._searchField.lineSearch.clear()
+    assert not node.isHidden()
+    type_text(qtbot, view._searchField.lineSearch, novel.title[:3])
+    assert not node.isHidden()
+
+
+def test_update_novels_in_shelves(qtbot):
+    series = NovelDescriptor('Series', story_type=StoryType.Series)
+    first = NovelDescriptor('First', parent=series.id, sequence=0)
+    second = NovelDescriptor('Second', parent=series.id, sequence=1)
+    standalone = NovelDescriptor('Standalone')
+
+    shelves = ShelvesTreeView()
+    qtbot.addWidget(shelves)
+    shelves.setNovels([series, first, second, standalone])
+    nodes = shelves._novels
+    assert nodes[series].indexOf(nodes[first]) == 0
+    assert nodes[series].indexOf(nodes[second]) == 1
+
+    first.sequence = 2
+    shelves.updateNovel(first)
+    assert nodes[series].indexOf(nodes[second]) == 0
+    assert nodes[series].indexOf(nodes[first]) == 1
+
+    second.parent = None
+    second.sequence = 0
+    shelves.updateNovel(second)
+    assert nodes[series].indexOf(nodes[second]) == -1
+    assert shelves._wdgNovels.indexOf(nodes[second]) == 1
+    assert shelves._wdgNovels.indexOf(nodes[standalone]) == 2
+    assert nodes[series].indexOf(nodes[first]) == 0
+
+    shelves.removeNovel(series)
+    assert series not in nodes
+    assert shelves._wdgNovels.indexOf(nodes[first]) == 0
+    assert shelves._wdgNovels.indexOf(nodes[second]) == 1
+    assert shelves._wdgNovels.indexOf(nodes[standalone]) == 2
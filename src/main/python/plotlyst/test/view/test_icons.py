@@ -0,0 +1,76 @@
+from PyQt6.QtCore import QBuffer, QIODevice
+from PyQt6.QtGui import QImage, QColor
+
+from plotlyst.core.domain import Character
+from plotlyst.view.icons import AvatarsRegistry
+
+
+def _character(name: str, size: int = 64) -> Character:
+    image = QImage(size, size, QImage.Format.Format_ARGB32)
+    image.fill(QColor('red'))
+    buffer = QBuffer()
+    buffer.open(QIODevice.OpenModeFlag.WriteOnly)
+    image.save(buffer, 'PNG')
+    character = Character(name)
+    character.avatar = bytes(buffer.data())
+    return character
+
+
+def test_avatar_cache_eviction(qtbot):
+    characters = [_character(f'Character {i}') for i in range(4)]
+    registry = AvatarsRegistry(budget=3 * 64 * 64 * 4)
+
+    for character in characters[:3]:
+        assert not registry.image(character).isNull()
+    registry.image(characters[0])
+    stats = registry.stats()
+    assert (stats.hits, stats.misses, stats.entries) == (1, 3, 3)
+    assert stats.size == 3 * 64 * 64 * 4
+
+    registry.image(characters[3])
+    stats = registry.stats()
+    assert (stats.evictions, stats.entries) == (1, 3)
+    assert stats.size <= stats.budget
+
+    registry.image(characters[0])
+    assert registry.stats().hits == 2
+    registry.image(characters[1])
+    assert registry.stats().misses == 5
+
+    registry.set_budget(64 * 64 * 4)
+    assert registry.stats().entries == 1
+    registry.clear()
+    assert registry.stats().entries == 0
+    assert registry.stats().size == 0
+
+
+def test_avatar_over_budget(qtbot):
+    registry = AvatarsRegistry(budget=1024)
+    character = _character('Large', 128)
+    assert not registry.image(character).isNull()
+    assert registry.stats().entries == 0
+
+    registry.update_image(character)
+    assert registry.stats().misses == 2
+
+
+def test_avatar_downscaled(qtbot):
+    registry = AvatarsRegistry()
+    character = _character('Large', 1024)
+    assert registry.image(character).width() == AvatarsRegistry.MaxSize
+    assert registry.stats().size == AvatarsRegistry.MaxSize * AvatarsRegistry.MaxSize * 4
+
+
+def test_avatar_cache_hit_rate(qtbot):
+    # each of these would have cost 4 MB in full size, so the old cache could hold only 8 of them
+    characters = [_character(f'Character {i}', 1024) for i in range(40)]
+    registry = AvatarsRegistry(budget=32 * 1024 * 1024)
+
+    for _ in range(5):
+        for character in characters:
+            registry.image(character)
+
+    stats = registry.stats()
+    assert stats.misses == 40
+    assert stats.hits == 160
+    assert stats.evictions == 0
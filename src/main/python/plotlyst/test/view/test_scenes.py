@@ -3,7 +3,8 @@ from PyQt6.QtCore import Qt, QModelIndex
 from PyQt6.QtWidgets import QSpinBox
 
 from plotlyst.core.client import client
-from plotlyst.model.scenes_model import ScenesTableModel, ScenesStageTableModel
+from plotlyst.core.domain import Novel, Chapter, Scene
+from plotlyst.model.scenes_model import ScenesTableModel, ScenesStageTableModel, ScenesTreeModel
 from plotlyst.test.common import create_character, start_new_scene_editor, assert_data, go_to_scenes, \
     click_on_item
 from plotlyst.view.comments_view import CommentWidget
@@ -193,3 +194,54 @@ def test_scene_cards_resize(qtbot, filled_window: MainWindow):
     card = view.ui.cards.cardAt(0)
     assert card.textSynopsis.isVisible()
     assert card.lineAfterTitle.isVisible()
+
+
+def _tree_novel():
+    chapter_1 = Chapter('Chapter 1')
+    chapter_2 = Chapter('Chapter 2')
+    novel = Novel('Tree', chapters=[chapter_1, chapter_2])
+    novel.scenes = [Scene('A', chapter=chapter_1), Scene('B'), Scene('C', chapter=chapter_2),
+                    Scene('', chapter=chapter_1), Scene('E')]
+    return novel
+
+
+def _tree_titles(model: ScenesTreeModel, parent: QModelIndex = QModelIndex()):
+    return [model.index(i, 0, parent).data() for i in range(model.rowCount(parent))]
+
+
+def test_scenes_tree_model():
+    novel = _tree_novel()
+    model = ScenesTreeModel(novel)
+
+    assert _tree_titles(model) == ['Chapter 1', 'Chapter 2', 'B', 'E']
+    assert _tree_titles(model, model.indexOf(novel.chapters[0])) == ['A', 'Scene 4']
+    assert _tree_titles(model, model.indexOf(novel.chapters[1])) == ['C']
+    assert model.parent(model.indexOf(novel.scenes[2])) == model.indexOf(novel.chapters[1])
+    assert not model.parent(model.indexOf(novel.scenes[1])).isValid()
+
+
+def test_scenes_tree_model_drop():
+    novel = _tree_novel()
+    chapter_1, chapter_2 = novel.chapters
+    a, b, c, d, e = novel.scenes
+    model = ScenesTreeModel(novel)
+
+    assert model.dropMimeData(model.mimeData([model.indexOf(b)]), Qt.DropAction.MoveAction, 0, 0,
+                              model.indexOf(chapter_2))
+    assert b.chapter is chapter_2
+    assert novel.scenes == [a, d, b, c, e]
+
+    assert model.dropMimeData(model.mimeData([model.indexOf(chapter_2)]), Qt.DropAction.MoveAction, 0, 0,
+                              QModelIndex())
+    assert novel.chapters == [chapter_2, chapter_1]
+    assert chapter_2.title == 'Chapter 1'
+    assert novel.scenes == [b, c, a, d, e]
+
+    assert model.dropMimeData(model.mimeData([model.indexOf(a)]), Qt.DropAction.MoveAction, -1, 0, QModelIndex())
+    assert a.chapter is None
+    assert novel.scenes == [b, c, d, e, a]
+    assert _tree_titles(model) == ['Chapter 1', 'Chapter 2', 'E', 'A']
+    assert _tree_titles(model, model.indexOf(chapter_1)) == ['Scene 3']
+
+    assert not model.canDropMimeData(model.mimeData([model.indexOf(chapter_1)]), Qt.DropAction.MoveAction, 0, 0,
+                                     model.indexOf(b))
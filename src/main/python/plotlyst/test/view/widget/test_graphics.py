@@ -0,0 +1,103 @@
+import random
+
+from PyQt6.QtCore import QPointF
+from PyQt6.QtGui import QUndoStack
+
+from plotlyst.core.domain import Diagram, DiagramData, Node, Connector, GraphicsItemType
+from plotlyst.view.widget.graphics import NetworkScene, CharacterItem
+from plotlyst.view.widget.graphics.layout import cluster_points, aggregate_edges, ForceLayout
+
+
+class _Scene(NetworkScene):
+    def _load(self):
+        pass
+
+    def _save(self):
+        pass
+
+
+def _network(size: int, edges: int) -> Diagram:
+    rnd = random.Random(1)
+    nodes = [Node(rnd.uniform(0, 4000), rnd.uniform(0, 4000), type=GraphicsItemType.CHARACTER) for _ in range(size)]
+    connectors = []
+    for _ in range(edges):
+        source, target = rnd.sample(nodes, 2)
+        connectors.append(Connector(source.id, target.id, 0, 180))
+    diagram = Diagram()
+    diagram.data = DiagramData(nodes, connectors)
+    diagram.loaded = True
+    return diagram
+
+
+def test_cluster_points():
+    points = {'a': QPointF(5, 5), 'b': QPointF(20, 30), 'c': QPointF(150, 10), 'd': QPointF(-10, 5)}
+    assert cluster_points(points, 100) == [['a', 'b']]
+    assert sorted(map(sorted, cluster_points(points, 100, minSize=1))) == [['a', 'b'], ['c'], ['d']]
+
+    groups = {'a': 0, 'b': 0, 'c': 1}
+    edges = aggregate_edges([('a', 'b'), ('a', 'c'), ('c', 'b'), ('c', 'd')], groups)
+    assert sorted(edges.values()) == [1, 2]
+    assert (0, 1) in edges or (1, 0) in edges
+
+
+def test_force_layout():
+    positions = {i: QPointF(0, 0) for i in range(20)}
+    edges = [(i, i + 1) for i in range(19)]
+    result = ForceLayout(seed=1).layout(positions, edges)
+    assert len(result) == 20
+    points = list(result.values())
+    assert all((p - q).manhattanLength() > 1 for i, p in enumerate(points) for q in points[i + 1:])
+
+    moved = ForceLayout(seed=1).layout(result, edges, movable={0})
+    assert list(moved.keys()) == [0]
+
+
+def test_network_clusters(qtbot):
+    scene = _Scene()
+    scene.setUndoStack(QUndoStack())
+    scene.setDiagram(_network(300, 400))
+
+    scene.setLevelOfDetail(0.2)
+    clusters = scene.clusters()
+    assert clusters
+    assert sum(len(x.members()) for x in clusters) == 300
+    assert not any(x.isVisible() for x in scene.items() if isinstance(x, CharacterItem))
+
+    scene.setLevelOfDetail(1.0)
+    assert not scene.clusters()
+    assert all(x.isVisible() for x in scene.items() if isinstance(x, CharacterItem))
+
+
+def test_network_arrange(qtbot):
+    scene = _Scene()
+    scene.setUndoStack(QUndoStack())
+    diagram = _network(60, 80)
+    scene.setDiagram(diagram)
+    before = [(x.x, x.y) for x in diagram.data.nodes]
+
+    scene.arrange()
+    assert scene.undoStack().count() == 1
+    assert [(x.x, x.y) for x in diagram.data.nodes] != before
+
+    scene.undoStack().undo()
+    assert [(x.x, x.y) for x in diagram.data.nodes] == before
+
+
+def test_network_arrange_refreshes_clusters(qtbot):
+    scene = _Scene()
+    scene.setUndoStack(QUndoStack())
+    scene.setDiagram(_network(60, 80))
+    scene.setLevelOfDetail(0.2)
+
+    def centers():
+        return sorted((round(x.center().x()), round(x.center().y())) for x in scene.clusters())
+
+    before = centers()
+    scene.arrange()
+    arranged = centers()
+    assert arranged != before
+
+    scene.undoStack().undo()
+    assert centers() == before
+    scene.undoStack().redo()
+    assert centers() == arranged
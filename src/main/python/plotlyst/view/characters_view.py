@@ -381,8 +381,8 @@ class CharactersView(AbstractNovelView):
                     self.repo.update_doc(self.novel, character.document)
                     card = self.__init_card_widget(character)
                     self.ui.cards.addCard(card)
+                    emit_event(self.novel, CharacterChangedEvent(self, character))
 
-                emit_event(self.novel, CharacterChangedEvent(self, characters[0]))
                 self.refresh()
 
     def _on_new(self):
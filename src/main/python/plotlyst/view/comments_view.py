@@ -17,25 +17,29 @@ GNU General Public License for more details.
 You should have received a copy of the GNU General Public License
 along with this program.  If not, see <https://www.gnu.org/licenses/>.
 """
-from typing import Optional
+from typing import Optional, List, Tuple
 
 from PyQt6.QtCore import QEvent, pyqtSignal, Qt
-from PyQt6.QtWidgets import QFrame
+from PyQt6.QtWidgets import QFrame, QLineEdit, QComboBox, QWidget
 from overrides import overrides
-from qthandy import ask_confirmation, gc
+from qthandy import ask_confirmation, gc, hbox
 
 from plotlyst.core.domain import Novel, Comment, Scene, Event
-from plotlyst.events import SceneSelectedEvent, SceneSelectionClearedEvent
+from plotlyst.events import SceneSelectedEvent, SceneSelectionClearedEvent, SceneDeletedEvent, ChapterChangedEvent
+from plotlyst.service.cache import comments_registry
 from plotlyst.view._view import AbstractNovelView
+from plotlyst.view.common import push_btn
 from plotlyst.view.generated.comment_widget_ui import Ui_CommentWidget
 from plotlyst.view.generated.comments_view_ui import Ui_CommentsView
 from plotlyst.view.icons import IconRegistry
 
 
 class CommentsView(AbstractNovelView):
+    PageSize: int = 50
 
     def __init__(self, novel: Novel):
-        super(CommentsView, self).__init__(novel, [SceneSelectedEvent, SceneSelectionClearedEvent])
+        super(CommentsView, self).__init__(novel, [SceneSelectedEvent, SceneSelectionClearedEvent, SceneDeletedEvent,
+                                                   ChapterChangedEvent])
         self.ui = Ui_CommentsView()
         self.ui.setupUi(self.widget)
         self.ui.btnNewComment.setIcon(IconRegistry.from_name('mdi.comment-plus-outline', color='#2e86ab'))
@@ -44,6 +48,34 @@ class CommentsView(AbstractNovelView):
         self.ui.btnNewComment.setToolTip('Select a scene to add comment')
 
         self._selected_scene: Optional[Scene] = None
+        self._results: List[Tuple[Scene, Comment]] = []
+        self._shown: int = 0
+
+        self.lineSearch = QLineEdit()
+        self.lineSearch.setPlaceholderText('Search comments')
+        self.lineSearch.setClearButtonEnabled(True)
+        self.lineSearch.textChanged.connect(self._update_comments)
+        self.cbStatus = QComboBox()
+        self.cbStatus.addItem('All', None)
+        self.cbStatus.addItem('Open', False)
+        self.cbStatus.addItem('Resolved', True)
+        self.cbStatus.currentIndexChanged.connect(self._update_comments)
+        self.cbChapter = QComboBox()
+        self.cbChapter.currentIndexChanged.connect(self._update_comments)
+        self._refresh_chapters()
+
+        self._wdgFilters = QWidget()
+        hbox(self._wdgFilters, 0)
+        self._wdgFilters.layout().addWidget(self.lineSearch)
+        self._wdgFilters.layout().addWidget(self.cbStatus)
+        self._wdgFilters.layout().addWidget(self.cbChapter)
+        self.widget.layout().insertWidget(1, self._wdgFilters)
+
+        self.btnMore = push_btn(text='Show more', transparent_=True)
+        self.btnMore.clicked.connect(self._show_more)
+        self.btnMore.setHidden(True)
+        self.ui.scrollAreaWidgetContents.layout().addWidget(self.btnMore, alignment=Qt.AlignmentFlag.AlignCenter)
+
         self.ui.cbShowAll.toggled.connect(self._update_comments)
         self.ui.cbShowAll.setChecked(True)
 
@@ -60,6 +92,13 @@ class CommentsView(AbstractNovelView):
             self.ui.btnNewComment.setEnabled(False)
             self.ui.btnNewComment.setToolTip('Select a scene to add comment')
             self._update_comments()
+        elif isinstance(event, SceneDeletedEvent):
+            if self._selected_scene is event.scene:
+                self._selected_scene = None
+                self.ui.btnNewComment.setEnabled(False)
+            self._update_comments()
+        elif isinstance(event, ChapterChangedEvent):
+            self._refresh_chapters()
         else:
             super(CommentsView, self).event_received(event)
 
@@ -67,45 +106,89 @@ class CommentsView(AbstractNovelView):
     def refresh(self):
         pass
 
-    def _update_comments(self, show_all: bool = False):
+    def _refresh_chapters(self):
+        chapter = self.cbChapter.currentData()
+        self.cbChapter.blockSignals(True)
+        self.cbChapter.clear()
+        self.cbChapter.addItem('All chapters', None)
+        for i, chapter_ in enumerate(self.novel.chapters):
+            self.cbChapter.addItem(chapter_.display_name(), chapter_)
+            if chapter_ is chapter:
+                self.cbChapter.setCurrentIndex(i + 1)
+        self.cbChapter.blockSignals(False)
+
+        if chapter is not None and self.cbChapter.currentData() is None:
+            self._update_comments()
+
+    def _update_comments(self):
         while self.ui.wdgComments.layout().count():
             item = self.ui.wdgComments.layout().takeAt(0)
             if item:
                 gc(item.widget())
 
+        show_all = self.ui.cbShowAll.isChecked()
+        self.cbChapter.setEnabled(show_all)
         if show_all:
-            for scene in self.novel.scenes:
-                for comment in scene.comments:
-                    self._addComment(comment, scene)
+            self._results = comments_registry.comments(chapter=self.cbChapter.currentData(),
+                                                       resolved=self.cbStatus.currentData(),
+                                                       text=self.lineSearch.text())
         elif self._selected_scene:
-            for comment in self._selected_scene.comments:
-                self._addComment(comment, self._selected_scene)
+            self._results = comments_registry.comments(scene=self._selected_scene,
+                                                       resolved=self.cbStatus.currentData(),
+                                                       text=self.lineSearch.text())
+        else:
+            self._results = []
+
+        self._shown = 0
+        self._show_more()
+
+    def _show_more(self):
+        for scene, comment in self._results[self._shown:self._shown + self.PageSize]:
+            self._addComment(comment, scene)
+        self._shown = min(self._shown + self.PageSize, len(self._results))
+
+        remaining = len(self._results) - self._shown
+        self.btnMore.setVisible(remaining > 0)
+        self.btnMore.setText(f'Show more ({remaining})')
 
     def _new_comment(self):
         comment = Comment('')
         if self._selected_scene:
             self._selected_scene.comments.append(comment)
-        wdg = self._addComment(comment, self._selected_scene)
+            comments_registry.comment_added(self._selected_scene, comment)
+        wdg = self._addComment(comment, self._selected_scene, 0)
+        self.ui.scrollArea.verticalScrollBar().setValue(0)
         wdg.edit()
 
-    def _addComment(self, comment: Comment, scene: Optional[Scene] = None) -> 'CommentWidget':
+    def _addComment(self, comment: Comment, scene: Optional[Scene] = None, pos: int = -1) -> 'CommentWidget':
         comment_wdg = CommentWidget(self.novel, comment, scene)
-        self.ui.wdgComments.layout().addWidget(comment_wdg, alignment=Qt.AlignmentFlag.AlignCenter)
+        self.ui.wdgComments.layout().insertWidget(pos, comment_wdg, alignment=Qt.AlignmentFlag.AlignCenter)
         comment_wdg.changed.connect(self._comment_changed)
         comment_wdg.removed.connect(self._comment_removed)
 
         return comment_wdg
 
     def _comment_changed(self, comment_wdg: 'CommentWidget'):
+        comments_registry.comment_changed(comment_wdg.comment)
         if comment_wdg.scene:
             self.repo.update_scene(comment_wdg.scene)
 
+        resolved = self.cbStatus.currentData()
+        if resolved is not None and comment_wdg.comment.resolved != resolved:
+            self.ui.wdgComments.layout().removeWidget(comment_wdg)
+            gc(comment_wdg)
+
     def _comment_removed(self, comment_wdg: 'CommentWidget'):
         if not ask_confirmation('Remove comment?'):
             return
         self.ui.wdgComments.layout().removeWidget(comment_wdg)
         if comment_wdg.scene:
-            comment_wdg.scene.comments.remove(comment_wdg.comment)
+            comments = comment_wdg.scene.comments
+            for i, comment in enumerate(comments):
+                if comment is comment_wdg.comment:
+                    comments.pop(i)
+                    break
+            comments_registry.comment_removed(comment_wdg.scene, comment_wdg.comment)
             self.repo.update_scene(comment_wdg.scene)
         gc(comment_wdg)
 
@@ -129,6 +212,8 @@ class CommentWidget(QFrame, Ui_CommentWidget):
         self.setFixedSize(self.width, self.height)
 
         self.btnResolve.setHidden(True)
+        self.btnResolve.clicked.connect(self._resolve)
+        self.btnResolve.setText('Reopen' if self.comment.resolved else 'Resolve')
 
         self.btnEdit.setIcon(IconRegistry.edit_icon())
         self.btnEdit.clicked.connect(self.edit)
@@ -174,6 +259,7 @@ class CommentWidget(QFrame, Ui_CommentWidget):
             return
         self.btnEdit.setVisible(True)
         self.btnDelete.setVisible(True)
+        self.btnResolve.setVisible(True)
 
     @overrides
     def leaveEvent(self, event: QEvent) -> None:
@@ -181,6 +267,7 @@ class CommentWidget(QFrame, Ui_CommentWidget):
             return
         self.btnEdit.setHidden(True)
         self.btnDelete.setHidden(True)
+        self.btnResolve.setHidden(True)
 
     def edit(self):
         self._toggle_editor_mode(True)
@@ -192,6 +279,11 @@ class CommentWidget(QFrame, Ui_CommentWidget):
     def _remove(self):
         self.removed.emit(self)
 
+    def _resolve(self):
+        self.comment.resolved = not self.comment.resolved
+        self.btnResolve.setText('Reopen' if self.comment.resolved else 'Resolve')
+        self.changed.emit(self)
+
     def _major_toggled(self, toggled: bool):
         self.comment.major = toggled
 
@@ -215,6 +307,7 @@ class CommentWidget(QFrame, Ui_CommentWidget):
         self.textComment.setHidden(edit)
         self.btnEdit.setHidden(edit)
         self.btnDelete.setHidden(edit)
+        self.btnResolve.setHidden(edit)
         self._edit_mode = edit
 
         if not edit and not self.textComment.toPlainText():
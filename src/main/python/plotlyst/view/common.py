@@ -21,7 +21,7 @@ import math
 import sys
 from collections import Counter
 from functools import partial
-from typing import Optional, Tuple, List, Union
+from typing import Optional, Tuple, List, Union, Callable, Iterable
 
 import qtanim
 import qtawesome
@@ -579,6 +579,63 @@ class DelayedSignalSlotConnector(QObject):
             self._timer.start(self._delay)
 
 
+class LazyPopulator(QObject):
+    """Builds the placeholder children of a widget once they are scrolled into view of the closest scroll area.
+
+    The candidates callback returns the children that are not built yet, and populate builds one of them. Scheduled
+    passes are merged into one on the next event loop iteration. A pass that built anything schedules another one,
+    because the built children may be shorter than their placeholders and reveal more of them.
+    """
+
+    def __init__(self, widget: QWidget, candidates: Callable[[], Iterable[QWidget]],
+                 populate: Callable[[QWidget], None], margin: int = 200):
+        super().__init__(widget)
+        self._widget = widget
+        self._candidates = candidates
+        self._populate = populate
+        self._margin = margin
+        self._scrollArea: Optional[QScrollArea] = None
+
+        self._timer = QTimer(self)
+        self._timer.setSingleShot(True)
+        self._timer.setInterval(0)
+        self._timer.timeout.connect(self.populateVisible)
+
+    def schedule(self):
+        self._timer.start()
+
+    def populateVisible(self):
+        candidates = list(self._candidates())
+        if not candidates:
+            return
+        self._widget.layout().activate()
+        visibleRect = self.visibleRect()
+        if visibleRect is not None and self._widget.height() < self._widget.layout().minimumSize().height():
+            return  # the scroll area hasn't resized the widget yet; its resizeEvent will schedule again
+
+        populated = False
+        for wdg in candidates:
+            if visibleRect is None or wdg.geometry().intersects(visibleRect):
+                self._populate(wdg)
+                populated = True
+        if populated:
+            self.schedule()
+
+    def visibleRect(self) -> Optional[QRect]:
+        if self._scrollArea is None:
+            parent = self._widget.parentWidget()
+            while parent is not None and not isinstance(parent, QScrollArea):
+                parent = parent.parentWidget()
+            if parent is None:
+                return None
+            self._scrollArea = parent
+            self._scrollArea.verticalScrollBar().valueChanged.connect(self.schedule)
+
+        viewport = self._scrollArea.viewport()
+        rect = QRect(self._widget.mapFrom(viewport, QPoint(0, 0)), viewport.size())
+        return rect.adjusted(0, -self._margin, 0, self._margin)
+
+
 def spawn(cls):
     app = QApplication(sys.argv)
     app.setStyleSheet(APP_STYLESHEET)
@@ -46,6 +46,7 @@ from plotlyst.view.icons import IconRegistry
 from plotlyst.view.roadmap_view import RoadmapView
 from plotlyst.view.style.button import apply_button_palette_color
 from plotlyst.view.widget.confirm import confirmed
+from plotlyst.view.widget.input import SearchField
 from plotlyst.view.widget.kb.browser import KnowledgeBaseWidget
 from plotlyst.view.widget.library import ShelvesTreeView, StoryCreationDialog, NovelDisplayCard, SeriesDisplayCard, \
     NovelSelectorPopup
@@ -169,6 +170,10 @@ class HomeView(AbstractView):
         self.ui.splitterLibrary.setSizes([150, 500])
         self.ui.wdgShelvesParent.layout().addWidget(wrap(self._btnAddNew, margin_left=10, margin_top=10),
                                                     alignment=Qt.AlignmentFlag.AlignLeft)
+        self._searchField = SearchField()
+        self._searchField.lineSearch.setPlaceholderText('Search by title or series')
+        self._searchField.lineSearch.textChanged.connect(self._shelvesTreeView.setFilter)
+        self.ui.wdgShelvesParent.layout().addWidget(wrap(self._searchField, margin_left=5, margin_right=5))
         self.ui.wdgShelvesParent.layout().addWidget(self._shelvesTreeView)
         self._shelvesTreeView.novelSelected.connect(self._novel_selected)
         self._shelvesTreeView.novelChanged.connect(self._novel_changed_in_tree)
@@ -224,12 +229,13 @@ class HomeView(AbstractView):
     @overrides
     def event_received(self, event: Event):
         if isinstance(event, NovelUpdatedEvent):
-            for novel in self._novels:
-                if novel.id == event.novel.id:
-                    novel.title = event.novel.title
+            novel = self._shelvesTreeView.index().novel(event.novel.id)
+            if novel is None:
+                return
+            novel.title = event.novel.title
             if self._selected_novel and self._selected_novel.id == event.novel.id:
                 self.novelDisplayCard.lineNovelTitle.setText(self._selected_novel.title)
-            self.refresh()
+            self._shelvesTreeView.updateNovel(novel)
         elif isinstance(event, LibraryTourEvent):
             self._tour_service.addWidget(self.ui.btnLibrary, event)
         elif isinstance(event, NewStoryButtonTourEvent):
@@ -255,9 +261,7 @@ class HomeView(AbstractView):
     @overrides
     def refresh(self):
         self._shelvesTreeView.setNovels(self._novels)
-
-        series = [x for x in self._novels if x.story_type == StoryType.Series]
-        entities_registry.set_series(series)
+        self._update_series()
 
     def showKnowledgeBase(self):
         self.ui.btnKnowledgeBase.setChecked(True)
@@ -301,7 +305,8 @@ class HomeView(AbstractView):
 
             flush()
 
-            self.refresh()
+            self._shelvesTreeView.addNovel(novel)
+            self._update_series()
             self._shelvesTreeView.selectNovel(novel)
             if len(self._novels) == 1 and self._novels[0].story_type == StoryType.Novel:
                 self.loadNovel.emit(novel)
@@ -358,6 +363,7 @@ class HomeView(AbstractView):
                     sn.parent = None
                     sn.sequence = 0
                     self.repo.update_project_novel(sn)
+                    self._shelvesTreeView.updateNovel(sn)
                     emit_global_event(NovelUpdatedEvent(self, sn))
 
             self.repo.delete_novel(novel)
@@ -365,7 +371,8 @@ class HomeView(AbstractView):
             emit_global_event(NovelDeletedEvent(self, novel))
             if self._selected_novel and novel.id == self._selected_novel.id:
                 self.reset()
-            self.refresh()
+            self._shelvesTreeView.removeNovel(novel)
+            self._update_series()
 
             if self._selected_novel:
                 self._shelvesTreeView.selectNovel(self._selected_novel)
@@ -377,17 +384,16 @@ class HomeView(AbstractView):
                 novel.parent = self._selected_novel.id
                 novel.sequence = self.seriesDisplayCard.novelCount()
                 self.repo.update_project_novel(novel)
-                self.refresh()
+                self._shelvesTreeView.updateNovel(novel)
                 self._shelvesTreeView.selectNovel(self._selected_novel)
 
                 emit_global_event(NovelUpdatedEvent(self, novel))
 
-    @busy
     def _detach_novel_from_series(self, novel: NovelDescriptor):
         novel.parent = None
         novel.sequence = 0
         self.repo.update_project_novel(novel)
-        self.refresh()
+        self._shelvesTreeView.updateNovel(novel)
         self._shelvesTreeView.selectNovel(self._selected_novel)
 
         emit_global_event(NovelUpdatedEvent(self, novel))
@@ -395,4 +401,8 @@ class HomeView(AbstractView):
     def _series_novels_order_changed(self, novels: List[NovelDescriptor]):
         for novel in novels:
             self.repo.update_project_novel(novel)
-        self.refresh()
+            self._shelvesTreeView.updateNovel(novel)
+
+    def _update_series(self):
+        series = [x for x in self._novels if x.story_type == StoryType.Series]
+        entities_registry.set_series(series)
@@ -17,10 +17,13 @@ GNU General Public License for more details.
 You should have received a copy of the GNU General Public License
 along with this program.  If not, see <https://www.gnu.org/licenses/>.
 """
-from typing import Dict, Optional
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Dict, Optional, Any
+from uuid import UUID
 
 import qtawesome
-from PyQt6.QtCore import QSize
+from PyQt6.QtCore import QSize, Qt
 from PyQt6.QtGui import QIcon, QPixmap
 from PyQt6.QtWidgets import QLabel
 
@@ -761,9 +764,37 @@ class IconRegistry:
         return QIcon(qtawesome.icon(name, **icon_args))
 
 
+@dataclass
+class AvatarCacheStats:
+    hits: int
+    misses: int
+    evictions: int
+    entries: int
+    size: int
+    budget: int
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {'hits': self.hits, 'misses': self.misses, 'evictions': self.evictions, 'entries': self.entries,
+                'size_kb': self.size // 1024, 'budget_kb': self.budget // 1024}
+
+
 class AvatarsRegistry:
-    def __init__(self):
-        self._images: Dict[Character, QPixmap] = {}
+    """Decodes character avatars and keeps the rounded pixmaps in a least-recently-used cache.
+
+    Avatars are stored as they were cropped, so they are downscaled to MaxSize before caching; that covers the largest
+    avatar on a high-DPI screen and keeps the cost of an entry to 256 KB at most. The cache is bounded by the
+    uncompressed size of the pixmaps. It is keyed by character id so that it does not keep the characters of a closed
+    novel alive, and it is cleared whenever another novel is opened.
+    """
+    MaxSize: int = 256
+
+    def __init__(self, budget: int = 32 * 1024 * 1024):
+        self._budget = budget
+        self._images: OrderedDict[UUID, QPixmap] = OrderedDict()
+        self._size: int = 0
+        self._hits: int = 0
+        self._misses: int = 0
+        self._evictions: int = 0
 
     def avatar(self, character: Character, fallback: bool = True) -> QIcon:
         if character.prefs.avatar.use_image and character.avatar:
@@ -781,16 +812,27 @@ class AvatarsRegistry:
             return None
 
     def image(self, character: Character) -> QPixmap:
-        if character in self._images.keys():
-            return self._images[character]
+        pixmap = self._images.get(character.id)
+        if pixmap is not None:
+            self._images.move_to_end(character.id)
+            self._hits += 1
+            return pixmap
 
         pixmap = QPixmap()
         if not character.avatar:
             return pixmap
 
+        self._misses += 1
         pixmap.loadFromData(character.avatar)
+        if min(pixmap.width(), pixmap.height()) > self.MaxSize:
+            pixmap = pixmap.scaled(self.MaxSize, self.MaxSize, Qt.AspectRatioMode.KeepAspectRatioByExpanding,
+                                   Qt.TransformationMode.SmoothTransformation)
         rounded = rounded_pixmap(pixmap)
-        self._images[character] = rounded
+        cost = self._cost(rounded)
+        if cost <= self._budget:
+            self._images[character.id] = rounded
+            self._size += cost
+            self._evict()
 
         return rounded
 
@@ -819,10 +861,39 @@ class AvatarsRegistry:
         return IconRegistry.from_name(icon, color)
 
     def update_image(self, character: Character):
-        if character in self._images.keys():
-            self._images.pop(character)
+        self._discard(character.id)
         self.image(character)
 
+    def budget(self) -> int:
+        return self._budget
+
+    def set_budget(self, budget: int):
+        self._budget = budget
+        self._evict()
+
+    def clear(self):
+        self._images.clear()
+        self._size = 0
+
+    def stats(self) -> AvatarCacheStats:
+        return AvatarCacheStats(self._hits, self._misses, self._evictions, len(self._images), self._size,
+                                self._budget)
+
+    def _discard(self, id_: UUID):
+        pixmap = self._images.pop(id_, None)
+        if pixmap is not None:
+            self._size -= self._cost(pixmap)
+
+    def _evict(self):
+        while self._size > self._budget and self._images:
+            _, pixmap = self._images.popitem(last=False)
+            self._size -= self._cost(pixmap)
+            self._evictions += 1
+
+    @staticmethod
+    def _cost(pixmap: QPixmap) -> int:
+        return pixmap.width() * pixmap.height() * max(pixmap.depth(), 8) // 8
+
     def _dummy_avatar(self) -> QIcon:
         return IconRegistry.character_icon(color_on='black')
 
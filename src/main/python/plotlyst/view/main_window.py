@@ -31,13 +31,11 @@ from qthandy import spacer, busy, gc, pointy, decr_icon, translucent
 from qthandy.filter import InstantTooltipEventFilter, OpacityEventFilter
 from qtmenu import MenuWidget
 from qttextedit.ops import DEFAULT_FONT_FAMILIES
-from textstat import textstat
 
 from plotlyst.common import NAV_BAR_BUTTON_DEFAULT_COLOR, \
     NAV_BAR_BUTTON_CHECKED_COLOR, PLOTLYST_MAIN_COLOR, PLACEHOLDER_TEXT_COLOR, PLOTLYST_TERTIARY_COLOR, BLACK_COLOR
 from plotlyst.core.client import client
 from plotlyst.core.domain import Novel, NovelPanel, ScenesView, NovelSetting, NovelDescriptor
-from plotlyst.core.text import sentence_count
 from plotlyst.env import app_env, open_location
 from plotlyst.event.core import event_log_reporter, EventListener, Event, global_event_sender, \
     emit_info, event_senders, EventSender
@@ -48,11 +46,11 @@ from plotlyst.events import NovelDeletedEvent, \
     NovelWorldBuildingToggleEvent, NovelCharactersToggleEvent, NovelScenesToggleEvent, NovelDocumentsToggleEvent, \
     NovelManagementToggleEvent, NovelManuscriptToggleEvent, SocialSnapshotRequested
 from plotlyst.resources import resource_manager, ResourceType, ResourceDownloadedEvent
-from plotlyst.service.cache import acts_registry, entities_registry
+from plotlyst.service.cache import acts_registry, entities_registry, progress_registry, comments_registry
 from plotlyst.service.common import try_shutdown_to_apply_change
 from plotlyst.service.dir import select_new_project_directory
-from plotlyst.service.grammar import LanguageToolServerSetupWorker, dictionary, language_tool_proxy
-from plotlyst.service.importer import ScrivenerSyncImporter
+from plotlyst.service.grammar import dictionary, language_tool_pool
+from plotlyst.service.importer import ScrivenerSyncImporter, series_cache
 from plotlyst.service.migration import migrate_novel
 from plotlyst.service.persistence import RepositoryPersistenceManager, flush_or_fail
 from plotlyst.service.resource import download_resource, download_nltk_resources, ResourceManagerDialog
@@ -69,7 +67,7 @@ from plotlyst.view.dialog.novel import DetachedWindow
 from plotlyst.view.docs_view import DocumentsView
 from plotlyst.view.generated.main_window_ui import Ui_MainWindow
 from plotlyst.view.home_view import HomeView
-from plotlyst.view.icons import IconRegistry
+from plotlyst.view.icons import IconRegistry, avatars
 from plotlyst.view.manuscript_view import ManuscriptView
 from plotlyst.view.novel_view import NovelView
 from plotlyst.view.reports_view import ReportsView
@@ -89,8 +87,6 @@ from plotlyst.view.widget.tour.core import TutorialNovelOpenTourEvent, tutorial_
     DocumentsViewTourEvent, ManuscriptViewTourEvent, AnalysisViewTourEvent, BoardViewTourEvent, BaseNovelViewTourEvent
 from plotlyst.view.world_building_view import WorldBuildingView
 
-textstat.sentence_count = sentence_count
-
 
 class MainWindow(QMainWindow, Ui_MainWindow, EventListener):
     def __init__(self, *args, **kwargs):
@@ -135,10 +131,13 @@ class MainWindow(QMainWindow, Ui_MainWindow, EventListener):
                 self.novel = client.fetch_novel(last_novel_id)
 
         if self.novel:
-            migrate_novel(self.novel)
+            if migrate_novel(self.novel):
+                RepositoryPersistenceManager.instance().update_novel(self.novel)
 
             acts_registry.set_novel(self.novel)
             entities_registry.set_novel(self.novel)
+            progress_registry.set_novel(self.novel)
+            comments_registry.set_novel(self.novel)
             dictionary.set_novel(self.novel)
             app_env.novel = self.novel
 
@@ -199,25 +198,20 @@ class MainWindow(QMainWindow, Ui_MainWindow, EventListener):
         self.repo = RepositoryPersistenceManager.instance()
 
         self._threadpool = QThreadPool()
-        self._language_tool_setup_worker = LanguageToolServerSetupWorker()
         if not app_env.test_env():
             download_nltk_resources()
             download_resource(ResourceType.JRE_8)
             download_resource(ResourceType.PANDOC)
 
-        if self.novel:
-            self._language_tool_setup_worker.lang = self.novel.lang_settings.lang
         if not app_env.test_env():
             if resource_manager.has_resource(ResourceType.JRE_8):
-                emit_info('Start initializing grammar checker...')
-                self._threadpool.start(self._language_tool_setup_worker)
+                language_tool_pool.activate(self.novel.lang_settings.lang if self.novel else 'en-US')
 
             QApplication.instance().installEventFilter(CapitalizationEventFilter(self))
 
     @overrides
     def closeEvent(self, event: QCloseEvent) -> None:
-        if language_tool_proxy.is_set():
-            language_tool_proxy.tool.close()
+        language_tool_pool.close()
 
         self._restore_all_windows()
 
@@ -243,9 +237,6 @@ class MainWindow(QMainWindow, Ui_MainWindow, EventListener):
                 if progress.wasCanceled():
                     break
 
-            if language_tool_proxy.is_set():
-                language_tool_proxy.tool.close()
-
         flush_or_fail()
 
     @overrides
@@ -328,8 +319,7 @@ class MainWindow(QMainWindow, Ui_MainWindow, EventListener):
             self._toggle_fullscreen(on=False)
         elif isinstance(event, ResourceDownloadedEvent):
             if event.type == ResourceType.JRE_8:
-                emit_info('Start initializing grammar checker...')
-                self._threadpool.start(self._language_tool_setup_worker)
+                language_tool_pool.activate(self.novel.lang_settings.lang if self.novel else 'en-US')
         elif isinstance(event, TutorialNovelOpenTourEvent):
             self._load_new_novel(tutorial_novel)
             self._tour_service.next()
@@ -427,6 +417,8 @@ class MainWindow(QMainWindow, Ui_MainWindow, EventListener):
         if series:
             self.seriesLabel.setSeries(series)
             self._actionSeries.setVisible(True)
+            series_cache.invalidate(self.novel.id)
+            series_cache.preload([x for x in self.seriesNovels(series) if x.id != self.novel.id])
         else:
             self._actionSeries.setVisible(False)
 
@@ -710,15 +702,18 @@ class MainWindow(QMainWindow, Ui_MainWindow, EventListener):
             self.novel = client.fetch_novel(novel.id)
         self.repo.set_persistence_enabled(not novel.tutorial)
 
-        migrate_novel(self.novel)
+        if migrate_novel(self.novel):
+            self.repo.update_novel(self.novel)
 
         acts_registry.set_novel(self.novel)
         entities_registry.set_novel(self.novel)
+        progress_registry.set_novel(self.novel)
+        comments_registry.set_novel(self.novel)
         dictionary.set_novel(self.novel)
         app_env.novel = self.novel
 
-        if language_tool_proxy.is_set():
-            language_tool_proxy.tool.language = self.novel.lang_settings.lang
+        if language_tool_pool.is_started():
+            language_tool_pool.activate(self.novel.lang_settings.lang)
 
         self._init_views()
         if not novel.tutorial:
@@ -737,6 +732,7 @@ class MainWindow(QMainWindow, Ui_MainWindow, EventListener):
 
     def _clear_novel(self):
         self._restore_all_windows()
+        avatars.clear()
 
         event_senders.pop(self.novel)
         event_dispatchers.pop(self.novel)
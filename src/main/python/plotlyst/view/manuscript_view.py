@@ -17,9 +17,11 @@ GNU General Public License for more details.
 You should have received a copy of the GNU General Public License
 along with this program.  If not, see <https://www.gnu.org/licenses/>.
 """
+from typing import List
+
 import qtanim
 from PyQt6.QtCore import QTimer, Qt, QObject, QEvent
-from PyQt6.QtGui import QScreen
+from PyQt6.QtGui import QScreen, QKeySequence
 from PyQt6.QtWidgets import QInputDialog, QApplication
 from overrides import overrides
 from qthandy import translucent, bold, margins, spacer, transparent, vspacer, decr_icon, vline, incr_icon, busy
@@ -34,6 +36,7 @@ from plotlyst.events import SceneChangedEvent, OpenDistractionFreeMode, \
     ExitDistractionFreeMode, NovelSyncEvent, CloseNovelEvent
 from plotlyst.resources import ResourceType
 from plotlyst.service.grammar import language_tool_proxy
+from plotlyst.service.manuscript import ManuscriptPrefetcher
 from plotlyst.service.persistence import flush_or_fail
 from plotlyst.service.resource import ask_for_resource
 from plotlyst.view._view import AbstractNovelView
@@ -122,6 +125,16 @@ class ManuscriptView(AbstractNovelView):
         self.ui.wdgEditor.layout().addWidget(self.textEditor)
         self.textEditor.sceneSeparatorClicked.connect(self._scene_separator_clicked)
 
+        self._scenes: List[Scene] = []
+        self._prefetcher = ManuscriptPrefetcher(self.novel, parent=self.widget)
+        self._actionPreviousScene = action('Previous scene', slot=lambda: self._step_scene(-1), parent=self.widget)
+        self._actionPreviousScene.setShortcut(QKeySequence('Ctrl+PgUp'))
+        self._actionNextScene = action('Next scene', slot=lambda: self._step_scene(1), parent=self.widget)
+        self._actionNextScene.setShortcut(QKeySequence('Ctrl+PgDown'))
+        for action_ in [self._actionPreviousScene, self._actionNextScene]:
+            action_.setShortcutContext(Qt.ShortcutContext.WidgetWithChildrenShortcut)
+            self.widget.addAction(action_)
+
         self._manuscriptDailyProgressDisplay = ManuscriptDailyProgress(self.novel)
         self._manuscriptDailyProgressDisplay.refresh()
 
@@ -303,6 +316,8 @@ class ManuscriptView(AbstractNovelView):
         self.ui.btnStage.setScene(scene, self.novel)
 
         self._recheckDocument()
+        self._scenes = [scene]
+        self._prefetcher.prefetch(self._scenes)
 
     def _editChapter(self, chapter: Chapter):
         self.ui.stackedWidget.setCurrentWidget(self.ui.pageText)
@@ -322,6 +337,18 @@ class ManuscriptView(AbstractNovelView):
         self.ui.btnStage.setDisabled(True)
 
         self._recheckDocument()
+        self._scenes = scenes
+        self._prefetcher.prefetch(self._scenes)
+
+    def _step_scene(self, step: int):
+        if not self._scenes or self._is_empty_page():
+            return
+        scene = self._scenes[-1] if step > 0 else self._scenes[0]
+        if scene not in self.novel.scenes:
+            return
+        i = self.novel.scenes.index(scene) + step
+        if 0 <= i < len(self.novel.scenes):
+            self.ui.treeChapters.selectScene(self.novel.scenes[i])
 
     def _scene_added(self, scene: Scene):
         if self._is_empty_page():
@@ -412,6 +439,7 @@ class ManuscriptView(AbstractNovelView):
     @busy
     def _language_changed(self, lang: str):
         emit_info('Novel is getting closed. Persist workspace...')
+        self._prefetcher.clear()
         self.novel.lang_settings.lang = lang
         self.repo.update_project_novel(self.novel)
         flush_or_fail()
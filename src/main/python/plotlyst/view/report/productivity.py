@@ -27,10 +27,10 @@ from qthandy import flow, bold, underline, vbox, margins, hbox, spacer, incr_ico
 from qthandy.filter import OpacityEventFilter
 
 from plotlyst.common import RELAXED_WHITE_COLOR
-from plotlyst.core.domain import Novel, DailyProductivity, SnapshotType
+from plotlyst.core.domain import Novel, SnapshotType
 from plotlyst.event.core import emit_event
 from plotlyst.events import SocialSnapshotRequested
-from plotlyst.service.productivity import find_daily_productivity
+from plotlyst.service.cache import progress_registry
 from plotlyst.view.common import label, scroll_area, tool_btn
 from plotlyst.view.icons import IconRegistry
 from plotlyst.view.report import AbstractReport
@@ -88,7 +88,7 @@ class ProductivityReport(AbstractReport, QWidget):
         for i in range(12):
             wdg = QWidget()
             vbox(wdg)
-            calendar = ProductivityCalendar(novel.productivity)
+            calendar = ProductivityCalendar(novel)
             calendar.setCurrentPage(current_year, i + 1)
             wdg.layout().addWidget(label(months[i + 1], h5=True), alignment=Qt.AlignmentFlag.AlignCenter)
             wdg.layout().addWidget(calendar)
@@ -101,14 +101,11 @@ class ProductivityReport(AbstractReport, QWidget):
 
 
 
-def date_to_str(date: QDate) -> str:
-    return date.toString(Qt.DateFormat.ISODate)
-
-
 class ProductivityCalendar(QCalendarWidget):
-    def __init__(self, productivity: DailyProductivity, parent=None):
+    def __init__(self, novel: Novel, parent=None):
         super().__init__(parent)
-        self.productivity = productivity
+        self.novel = novel
+        progress_registry.track(self.novel)
 
         self.setVerticalHeaderFormat(QCalendarWidget.VerticalHeaderFormat.NoVerticalHeader)
         self.setHorizontalHeaderFormat(QCalendarWidget.HorizontalHeaderFormat.NoHorizontalHeader)
@@ -120,11 +117,6 @@ class ProductivityCalendar(QCalendarWidget):
 
         widget = self.layout().itemAt(1).widget()
         if isinstance(widget, QTableView):
-            widget.setStyleSheet(f'''
-                    QTableView {{
-                        selection-background-color: {RELAXED_WHITE_COLOR};
-                    }}
-                    ''')
             widget.horizontalHeader().setMinimumSectionSize(30)
             widget.verticalHeader().setMinimumSectionSize(30)
 
@@ -143,7 +135,7 @@ class ProductivityCalendar(QCalendarWidget):
             bold(painter, date == self.selectedDate())
             underline(painter, date == self.selectedDate())
 
-            category = find_daily_productivity(self.productivity, date_to_str(date))
+            category = progress_registry.productivity(date.toPyDate())
             if category:
                 painter.setPen(QColor(RELAXED_WHITE_COLOR))
                 color = QColor(category.icon_color)
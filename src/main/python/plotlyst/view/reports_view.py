@@ -33,6 +33,7 @@ from plotlyst.event.core import EventListener, Event
 from plotlyst.event.handler import event_dispatchers
 from plotlyst.events import CharacterChangedEvent, SceneChangedEvent, SceneDeletedEvent, \
     CharacterDeletedEvent, NovelSyncEvent, StorylineCreatedEvent, StorylineRemovedEvent, NovelStoryStructureUpdated
+from plotlyst.service.diagnostics import monitored
 from plotlyst.view._view import AbstractNovelView
 from plotlyst.view.common import link_buttons_to_pages, scrolled
 from plotlyst.view.generated.reports_view_ui import Ui_ReportsView
@@ -99,6 +100,7 @@ class ReportPage(QWidget, EventListener):
         else:
             self._refreshNext = True
 
+    @monitored
     def refresh(self):
         if self._report:
             self._report.refresh()
@@ -155,11 +155,14 @@ class SceneEditor(QObject, EventListener):
         self.ui.treeScenes.setNovel(self.novel, readOnly=True)
         self.ui.treeScenes.sceneSelected.connect(self._scene_selected)
 
-        self._purposeSelector = ScenePurposeSelectorWidget()
-        margins(self._purposeSelector, top=25)
-        self.ui.pagePurpose.layout().addWidget(self._purposeSelector)
-        self._purposeSelector.skipped.connect(self._purpose_skipped)
-        self._purposeSelector.selected.connect(self._purpose_changed)
+        # the purpose selector and the tab panels are built the first time they are shown
+        # and then kept for the following scenes
+        self._purposeSelector: Optional[ScenePurposeSelectorWidget] = None
+        self._functionsEditor: Optional[SceneFunctionsWidget] = None
+        self._functionsScene: Optional[Scene] = None
+        self._agencyEditor: Optional[SceneAgencyEditor] = None
+        self._curiosityEditor: Optional[ReaderCuriosityEditor] = None
+        self._informationEditor: Optional[ReaderInformationEditor] = None
 
         self._btnPurposeType = ScenePurposeTypeButton()
         self._btnPurposeType.reset.connect(self._reset_purpose_editor)
@@ -173,24 +176,6 @@ class SceneEditor(QObject, EventListener):
         hbox(self.ui.wdgStorylines)
         self.ui.wdgMidbar.layout().insertWidget(1, self._btnPlotSelector)
 
-        self._functionsEditor = SceneFunctionsWidget(self.novel)
-        self._functionsEditor.storylineLinked.connect(self._storyline_linked_from_function)
-        self._functionsEditor.storylineRemoved.connect(self._storyline_removed_from_function)
-        self._functionsEditor.storylineCharged.connect(self._update_progress)
-
-        self.ui.scrollAreaFunctions.layout().addWidget(self._functionsEditor)
-
-        self._agencyEditor = SceneAgencyEditor(self.novel)
-        self._agencyEditor.setUnsetCharacterSlot(self._character_not_selected_notification)
-        self._agencyEditor.agencyAdded.connect(lambda: scroll_to_bottom(self.ui.scrollArea_2))
-        self.ui.scrollAgency.layout().addWidget(self._agencyEditor)
-
-        self._curiosityEditor = ReaderCuriosityEditor(self.novel)
-        self.ui.tabCuriosity.layout().addWidget(self._curiosityEditor)
-
-        self._informationEditor = ReaderInformationEditor(self.novel)
-        self.ui.tabInformation.layout().addWidget(self._informationEditor)
-
         self.ui.btnClose.clicked.connect(self._on_close)
 
         # self.ui.wdgSceneStructure.timeline.outcomeChanged.connect(self._btnPurposeType.refresh)
@@ -198,6 +183,7 @@ class SceneEditor(QObject, EventListener):
         self.ui.tabWidget.setCurrentWidget(self.ui.tabFunctions)
         self.ui.tabWidgetDrive.setCurrentWidget(self.ui.tabAgency)
         self.ui.tabWidget.currentChanged.connect(self._page_toggled)
+        self.ui.tabWidgetDrive.currentChanged.connect(self._page_toggled)
 
         self.repo = RepositoryPersistenceManager.instance()
 
@@ -241,7 +227,6 @@ class SceneEditor(QObject, EventListener):
 
         # self.ui.wdgSceneStructure.setScene(self.novel, self.scene)
         # self.tag_selector.setScene(self.scene)
-        self._functionsEditor.setScene(self.scene)
         # self._agencyEditor.setScene(self.scene)
         # self._curiosityEditor.setScene(self.scene)
         # self._informationEditor.setScene(self.scene)
@@ -252,8 +237,7 @@ class SceneEditor(QObject, EventListener):
         self.ui.textSynopsis.setText(self.scene.synopsis)
 
         self.notes_updated = False
-        if self.ui.tabWidget.currentWidget() is self.ui.tabNotes or (
-                self.scene.document and self.scene.document.loaded):
+        if self.scene.document and self.scene.document.loaded:
             self._update_notes()
         else:
             self.ui.textNotes.clear()
@@ -271,10 +255,58 @@ class SceneEditor(QObject, EventListener):
 
         self._characters_model.setScene(self.scene)
         self._character_changed()
+        self._page_toggled()
 
     def _page_toggled(self):
-        if self.ui.tabWidget.currentWidget() is self.ui.tabNotes:
+        if self.scene is None or self.ui.stackedWidget.currentWidget() is not self.ui.pageEditor:
+            return
+
+        tab = self.ui.tabWidget.currentWidget()
+        if tab is self.ui.tabFunctions:
+            self._functions_editor()
+        elif tab is self.ui.tabNotes:
             self._update_notes()
+        elif tab is self.ui.tabDrive:
+            drive_tab = self.ui.tabWidgetDrive.currentWidget()
+            if drive_tab is self.ui.tabAgency:
+                self._agency_editor()
+            elif drive_tab is self.ui.tabCuriosity and self._curiosityEditor is None:
+                self._curiosityEditor = ReaderCuriosityEditor(self.novel)
+                self.ui.tabCuriosity.layout().addWidget(self._curiosityEditor)
+            elif drive_tab is self.ui.tabInformation and self._informationEditor is None:
+                self._informationEditor = ReaderInformationEditor(self.novel)
+                self.ui.tabInformation.layout().addWidget(self._informationEditor)
+
+    def _purpose_selector(self) -> ScenePurposeSelectorWidget:
+        if self._purposeSelector is None:
+            self._purposeSelector = ScenePurposeSelectorWidget()
+            margins(self._purposeSelector, top=25)
+            self.ui.pagePurpose.layout().addWidget(self._purposeSelector)
+            self._purposeSelector.skipped.connect(self._purpose_skipped)
+            self._purposeSelector.selected.connect(self._purpose_changed)
+        return self._purposeSelector
+
+    def _functions_editor(self) -> SceneFunctionsWidget:
+        if self._functionsEditor is None:
+            self._functionsEditor = SceneFunctionsWidget(self.novel)
+            self._functionsEditor.storylineLinked.connect(self._storyline_linked_from_function)
+            self._functionsEditor.storylineRemoved.connect(self._storyline_removed_from_function)
+            self._functionsEditor.storylineCharged.connect(self._update_progress)
+            self.ui.scrollAreaFunctions.layout().addWidget(self._functionsEditor)
+
+        if self._functionsScene is not self.scene:
+            self._functionsScene = self.scene
+            self._functionsEditor.setScene(self.scene)
+        return self._functionsEditor
+
+    def _agency_editor(self) -> SceneAgencyEditor:
+        if self._agencyEditor is None:
+            self._agencyEditor = SceneAgencyEditor(self.novel)
+            self._agencyEditor.setUnsetCharacterSlot(self._character_not_selected_notification)
+            self._agencyEditor.agencyAdded.connect(lambda: scroll_to_bottom(self.ui.scrollArea_2))
+            self.ui.scrollAgency.layout().addWidget(self._agencyEditor)
+            self._agencyEditor.updateAvailableCharacters()
+        return self._agencyEditor
 
     def _beat_selected(self, beat: StoryBeat):
         if self.scene.beat(self.novel) and self.scene.beat(self.novel) != beat:
@@ -309,7 +341,8 @@ class SceneEditor(QObject, EventListener):
     def _pov_changed(self, pov: Character):
         self.scene.pov = pov
 
-        self._agencyEditor.povChangedEvent(pov)
+        if self._agencyEditor is not None:
+            self._agencyEditor.povChangedEvent(pov)
 
         self._update_pov_avatar()
         self._characters_model.update()
@@ -325,10 +358,11 @@ class SceneEditor(QObject, EventListener):
             self.ui.wdgPov.btnAvatar.setToolTip('Select point of view character')
 
     def _storyline_selected_from_toolbar(self, storyline: Plot):
-        self._functionsEditor.addPrimaryType(StoryElementType.Plot, storyline)
+        self._functions_editor().addPrimaryType(StoryElementType.Plot, storyline)
 
     def _storyline_removed_from_toolbar(self, labels: ScenePlotLabels, plotRef: ScenePlotReference):
-        self._functionsEditor.storylineRemovedEvent(plotRef.plot)
+        if self._functionsEditor is not None and self._functionsScene is self.scene:
+            self._functionsEditor.storylineRemovedEvent(plotRef.plot)
         self._storyline_removed(labels)
 
     def _storyline_removed(self, labels: ScenePlotLabels):
@@ -382,7 +416,8 @@ class SceneEditor(QObject, EventListener):
         for character in self.scene.characters:
             self.ui.wdgCharacters.addLabel(CharacterLabel(character))
 
-        self._agencyEditor.updateAvailableCharacters()
+        if self._agencyEditor is not None:
+            self._agencyEditor.updateAvailableCharacters()
 
     def _purpose_skipped(self):
         self.scene.purpose = ScenePurposeType.Other
@@ -399,16 +434,18 @@ class SceneEditor(QObject, EventListener):
         self.ui.wdgStorylines.setVisible(self.novel.prefs.toggled(NovelSetting.Storylines))
         self._btnPlotSelector.setVisible(self.novel.prefs.toggled(NovelSetting.Storylines))
         # to avoid segfault for some reason, we disable it first before changing the stack widget
-        self._purposeSelector.setDisabled(True)
+        if self._purposeSelector is not None:
+            self._purposeSelector.setDisabled(True)
         self.ui.stackedWidget.setCurrentWidget(self.ui.pageEditor)
+        self._page_toggled()
 
     def _reset_purpose_editor(self):
         self.scene.purpose = None
         self._btnPurposeType.setHidden(True)
         self.ui.wdgStorylines.setHidden(True)
         self._btnPlotSelector.setHidden(True)
+        self._purpose_selector().setEnabled(True)
         self.ui.stackedWidget.setCurrentWidget(self.ui.pagePurpose)
-        self._purposeSelector.setEnabled(True)
 
     def _save_scene(self):
         self.scene.title = self.ui.lineTitle.text()
@@ -436,6 +473,8 @@ class SceneEditor(QObject, EventListener):
     def _on_close(self):
         self._save_scene()
         self.scene = None
+        # the scene might be edited elsewhere until it is opened again
+        self._functionsScene = None
         self.close.emit()
 
     @busy
@@ -752,8 +752,12 @@ class ScenesOutlineView(AbstractNovelView):
         if card:
             card.refresh()
 
+        self._proxy.refreshActsFilter()
+        if self.stagesModel:
+            self._stages_proxy.refreshActsFilter()
         if self.characters_distribution:
             self.characters_distribution.refreshAverage()
+            self.characters_distribution.refreshActsFilter()
 
     def _handle_scene_order_changed(self):
         self.repo.update_novel(self.novel)
@@ -1,6 +0,0 @@
-from .base import style as base_style
-from .button import style as button_style
-from .item_view import style as item_view_style
-from .slider import style as slider_style
-from .tab import style as tab_style
-from .text import style as text_style
@@ -17,7 +17,7 @@ GNU General Public License for more details.
 You should have received a copy of the GNU General Public License
 along with this program.  If not, see <https://www.gnu.org/licenses/>.
 """
-from typing import Union
+from typing import Union, Any
 
 from PyQt6.QtCore import Qt
 from PyQt6.QtGui import QColor
@@ -204,6 +204,15 @@ QSplitter::handle:horizontal:pressed {{
 '''
 
 
+def apply_property(wdg: QWidget, name: str, value: Any):
+    if wdg.property(name) == value:
+        return
+    wdg.setProperty(name, value)
+    if wdg.testAttribute(Qt.WidgetAttribute.WA_WState_Polished):
+        wdg.style().unpolish(wdg)
+        wdg.style().polish(wdg)
+
+
 def apply_color(wdg: QWidget, color: Union[str, QColor, Qt.GlobalColor]):
     if isinstance(color, QColor):
         color = color.name()
@@ -0,0 +1,93 @@
+"""
+Plotlyst
+Copyright (C) 2021-2024  Zsolt Kovari
+
+This file is part of Plotlyst.
+
+Plotlyst is free software: you can redistribute it and/or modify
+it under the terms of the GNU General Public License as published by
+the Free Software Foundation, either version 3 of the License, or
+(at your option) any later version.
+
+Plotlyst is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+GNU General Public License for more details.
+
+You should have received a copy of the GNU General Public License
+along with this program.  If not, see <https://www.gnu.org/licenses/>.
+"""
+from plotlyst.common import PLOTLYST_SECONDARY_COLOR, RELAXED_WHITE_COLOR, NEUTRAL_EMOTION_COLOR, EMOTION_COLORS
+
+# Looks of the widgets that are created in large numbers, e.g., cards and timeline events.
+# They are selected by class name and dynamic properties, so that creating or restyling such a widget
+# only polishes it against the already parsed application stylesheet.
+
+BACKSTORY_CARD_BG_COLOR: str = '#ffe8d6'
+
+emotion_style = '\n'.join(f'''
+BackstoryCard #cardFrame[emotion="{emotion}"] {{
+    border-top: 8px solid {color};
+}}
+
+BackstoryCard QToolButton#btnBackstoryType[emotion="{emotion}"] {{
+    border-color: {color};
+}}
+''' for emotion, color in EMOTION_COLORS.items())
+
+style = f'''
+Card[card=true] {{
+    border: 2px solid lightgrey;
+    border-radius: 15px;
+    background-color: #f3e8e8;
+}}
+
+Card[card=true][selected=true] {{
+    border: 4px solid {PLOTLYST_SECONDARY_COLOR};
+    background-color: #dec3c3;
+}}
+
+PlaceholderCard[card=true] {{
+    border: 2px dotted grey;
+    border-radius: 15px;
+    background-color: rgba(0, 0, 0, 0);
+}}
+
+VipPatronCard[card=true] {{
+    background-color: #F7F0F0;
+}}
+
+VipPatronCard[card=true][selected=true] {{
+    background-color: #F7F0F0;
+}}
+
+BackstoryCard #cardFrame {{
+    border-top: 8px solid {NEUTRAL_EMOTION_COLOR};
+    border-bottom-left-radius: 12px;
+    border-bottom-right-radius: 12px;
+    background-color: {BACKSTORY_CARD_BG_COLOR};
+}}
+
+BackstoryCard QToolButton#btnBackstoryType {{
+    background-color: {RELAXED_WHITE_COLOR};
+    border: 3px solid {NEUTRAL_EMOTION_COLOR};
+    border-radius: 18px;
+    padding: 4px;
+}}
+
+BackstoryCard QToolButton#btnBackstoryType:hover {{
+    padding: 2px;
+}}
+
+{emotion_style}
+
+SceneLabel {{
+    border: 1px solid black;
+    border-radius: 8px;
+    padding: 2px;
+}}
+
+ProductivityCalendar QTableView {{
+    selection-background-color: {RELAXED_WHITE_COLOR};
+}}
+'''
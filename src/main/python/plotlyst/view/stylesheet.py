@@ -17,13 +17,20 @@ GNU General Public License for more details.
 You should have received a copy of the GNU General Public License
 along with this program.  If not, see <https://www.gnu.org/licenses/>.
 """
-from plotlyst.view import style
+from plotlyst.view.style.base import style as base_style
+from plotlyst.view.style.button import style as button_style
+from plotlyst.view.style.item_view import style as item_view_style
+from plotlyst.view.style.slider import style as slider_style
+from plotlyst.view.style.tab import style as tab_style
+from plotlyst.view.style.text import style as text_style
+from plotlyst.view.style.widget import style as widget_style
 
 APP_STYLESHEET = f'''
-{style.base_style}
-{style.button_style}
-{style.item_view_style}
-{style.text_style}
-{style.tab_style}
-{style.slider_style}
+{base_style}
+{button_style}
+{item_view_style}
+{text_style}
+{tab_style}
+{slider_style}
+{widget_style}
 '''
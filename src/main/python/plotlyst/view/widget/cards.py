@@ -41,6 +41,7 @@ from plotlyst.view.common import fade, fade_in, fade_out, tool_btn, push_btn, ac
 from plotlyst.view.generated.character_card_ui import Ui_CharacterCard
 from plotlyst.view.generated.scene_card_ui import Ui_SceneCard
 from plotlyst.view.icons import IconRegistry, set_avatar, avatars
+from plotlyst.view.style.base import apply_property
 from plotlyst.view.style.button import apply_button_palette_color
 from plotlyst.view.widget.button import DotsMenuButton
 from plotlyst.view.widget.display import Icon
@@ -98,11 +99,11 @@ class Card(QFrame):
         self.doubleClicked.emit()
 
     def select(self):
-        self._setStyleSheet(selected=True)
+        self._applyStyle(selected=True)
         self.selected.emit()
 
     def clearSelection(self):
-        self._setStyleSheet()
+        self._applyStyle()
 
     def refresh(self):
         self.setGraphicsEffect(None)
@@ -122,25 +123,9 @@ class Card(QFrame):
     def copy(self) -> 'Card':
         pass
 
-    def _setStyleSheet(self, selected: bool = False):
-        border_color = self._borderColor(selected)
-        border_size = self._borderSize(selected)
-        background_color = self._bgColor(selected)
-        self.setStyleSheet(f'''
-           Card {{
-               border: {border_size}px solid {border_color};
-               border-radius: 15px;
-               background-color: {background_color};
-           }}''')
-
-    def _bgColor(self, selected: bool = False) -> str:
-        return '#dec3c3' if selected else '#f3e8e8'
-
-    def _borderSize(self, selected: bool = False) -> int:
-        return 4 if selected else 2
-
-    def _borderColor(self, selected: bool = False) -> str:
-        return PLOTLYST_SECONDARY_COLOR if selected else 'lightgrey'
+    def _applyStyle(self, selected: bool = False):
+        apply_property(self, 'card', True)
+        apply_property(self, 'selected', selected)
 
 
 class CharacterCard(Ui_CharacterCard, Card):
@@ -155,7 +140,7 @@ class CharacterCard(Ui_CharacterCard, Card):
         transparent(self.btnEnneagram)
         retain_when_hidden(self.iconRole)
 
-        self._setStyleSheet()
+        self._applyStyle()
         self.refresh()
 
     @overrides
@@ -215,7 +200,7 @@ class SceneCard(Ui_SceneCard, Card):
         self.btnBeat.setIconSize(QSize(28, 28))
         transparent(self.btnBeat)
 
-        self._setStyleSheet()
+        self._applyStyle()
         self.refresh()
 
         self._stageVisible = self.novel.prefs.toggled(NovelSetting.SCENE_CARD_STAGE)
@@ -387,7 +372,7 @@ class NovelCard(Card):
         self.btnSettings.setHidden(True)
         self.btnOpen.setHidden(True)
 
-        self._setStyleSheet()
+        self._applyStyle()
         self.refresh()
 
     @overrides
@@ -441,7 +426,7 @@ class PlaceholderCard(Card):
         self.layout().addWidget(self.btnPlus, alignment=Qt.AlignmentFlag.AlignCenter)
         self.installEventFilter(OpacityEventFilter(self, leaveOpacity=0.5, enterOpacity=0.6))
 
-        self._setStyleSheet()
+        self._applyStyle()
 
     @overrides
     def enterEvent(self, event: QEvent) -> None:
@@ -464,12 +449,8 @@ class PlaceholderCard(Card):
         pass
 
     @overrides
-    def _setStyleSheet(self, selected: bool = False):
-        self.setStyleSheet('''
-                   Card {
-                       border: 2px dotted grey;
-                       border-radius: 15px;
-                   }''')
+    def _applyStyle(self, selected: bool = False):
+        super()._applyStyle()
 
 
 class CardFilter:
@@ -31,7 +31,7 @@ from plotlyst.core.domain import Diagram, Relation, Node
 from plotlyst.core.domain import Novel, GraphicsItemType
 from plotlyst.service.image import LoadedImage, upload_image, load_image
 from plotlyst.service.persistence import RepositoryPersistenceManager
-from plotlyst.view.common import action
+from plotlyst.view.common import action, tool_btn
 from plotlyst.view.icons import IconRegistry
 from plotlyst.view.widget.characters import CharacterSelectorMenu
 from plotlyst.view.widget.graphics import NetworkGraphicsView, NetworkScene
@@ -82,6 +82,11 @@ class CharacterNetworkView(NetworkGraphicsView):
         self._btnAddImage = self._newControlButton(IconRegistry.image_icon(), 'Add new image',
                                                    GraphicsItemType.IMAGE)
 
+        self._btnArrange = tool_btn(IconRegistry.from_name('mdi.graph-outline', BLACK_COLOR), transparent_=True,
+                                    tooltip='Arrange the network automatically, or only the selected items')
+        self._btnArrange.clicked.connect(self._arrange)
+        self._controlsNavBar.layout().addWidget(self._btnArrange)
+
         self._controlsNavBar.layout().addWidget(line())
         self._controlsNavBar.layout().addWidget(self._btnUndo)
         self._controlsNavBar.layout().addWidget(self._btnRedo)
@@ -24,12 +24,12 @@ from typing import Optional, List, Dict, Any, Tuple
 import emoji
 import qtanim
 from PyQt6.QtCore import pyqtSignal, Qt, QSize, QObject, QEvent, QPoint, QTimer
-from PyQt6.QtGui import QResizeEvent, QWheelEvent, QColor
+from PyQt6.QtGui import QResizeEvent, QWheelEvent, QColor, QShowEvent
 from PyQt6.QtWidgets import QWidget, QLabel, QSizePolicy, QSlider, QToolButton, QVBoxLayout, QGridLayout, QApplication, \
     QFrame, QLineEdit, QDialog, QCompleter
 from overrides import overrides
 from qthandy import vbox, clear_layout, hbox, bold, spacer, vspacer, margins, pointy, retain_when_hidden, \
-    transparent, sp, gc, decr_font, grid, incr_font, line, busy, decr_icon
+    transparent, sp, gc, decr_font, grid, incr_font, line, decr_icon
 from qthandy.filter import OpacityEventFilter, VisibilityToggleEventFilter
 from qtmenu import MenuWidget, ActionTooltipDisplayMode
 
@@ -50,7 +50,7 @@ from plotlyst.core.template import TemplateField, iq_field, eq_field, rationalis
     work_style_choices, void_field, psychological_need_field, interpersonal_need_field
 from plotlyst.env import app_env
 from plotlyst.view.common import tool_btn, wrap, emoji_font, action, insert_before_the_end, push_btn, label, \
-    fade_out_and_gc, shadow, fade_in, frame
+    fade_out_and_gc, shadow, fade_in, frame, LazyPopulator
 from plotlyst.view.icons import IconRegistry, avatars
 from plotlyst.view.layout import group
 from plotlyst.view.style.base import apply_white_menu
@@ -309,6 +309,9 @@ def character_secondary_field(value: str) -> TemplateField:
 class ProfileSectionWidget(ProfileFieldWidget):
     headerEnabledChanged = pyqtSignal(bool)
     fieldAdded = pyqtSignal(CharacterProfileFieldReference)
+    expanded = pyqtSignal()
+
+    FieldPlaceholderHeight: int = 60
 
     def __init__(self, section: CharacterProfileSectionReference, context: SectionContext, character: Character,
                  parent=None):
@@ -379,9 +382,29 @@ class ProfileSectionWidget(ProfileFieldWidget):
 
         self.children: List[ProfileFieldWidget] = []
         # self.progressStatuses: Dict[ProfileFieldWidget, float] = {}
+        self._populated = False
+        self.setPopulated(False)
 
         self.btnHeader.toggled.connect(self._toggleCollapse)
 
+    def setCharacter(self, character: Character, section: CharacterProfileSectionReference):
+        self.character = character
+        self.section = section
+        for wdg in self.children:
+            gc(wdg)
+        self.children.clear()
+        self.setPopulated(False)
+
+    def isPopulated(self) -> bool:
+        return self._populated
+
+    def setPopulated(self, populated: bool):
+        self._populated = populated
+        self.wdgContainer.setMinimumHeight(0 if populated else len(self.section.fields) * self.FieldPlaceholderHeight)
+
+    def isCollapsed(self) -> bool:
+        return self.btnHeader.isChecked()
+
     def attachWidget(self, widget: ProfileFieldWidget):
         self.children.append(widget)
         if self.section.type == CharacterProfileSectionType.Summary:
@@ -414,6 +437,8 @@ class ProfileSectionWidget(ProfileFieldWidget):
     def _toggleCollapse(self, checked: bool):
         self.wdgContainer.setHidden(checked)
         self.wdgBottom.setHidden(checked)
+        if not checked:
+            self.expanded.emit()
 
     # def _valueFilled(self, widget: ProfileFieldWidget, value: float):
     #     if self.progressStatuses[widget] == value:
@@ -442,6 +467,8 @@ class ProfileSectionWidget(ProfileFieldWidget):
         self.context.primaryAttributes(self.character).append(attr)
         field = CharacterProfileFieldReference(self.context.primaryFieldType(), ref=attr.id)
         self.section.fields.append(field)
+        if not self._populated:
+            return
 
         fieldWdg = field_widget(field, self.character)
         self.attachWidget(fieldWdg)
@@ -1816,6 +1843,12 @@ class SectionSettings(QWidget):
 
 
 class CharacterProfileEditor(QWidget):
+    """Displays the profile sections of a character.
+
+    The section widgets are created once per profile template and reused when switching to a character with the same
+    sections. The fields of a section are only created once the section is scrolled into view or expanded.
+    """
+
     def __init__(self, novel: Novel, parent=None):
         super().__init__(parent)
         self._novel = novel
@@ -1830,6 +1863,7 @@ class CharacterProfileEditor(QWidget):
         self._settings.personalityToggled.connect(self._personalityToggled)
 
         self._sections: Dict[CharacterProfileSectionType, ProfileSectionWidget] = {}
+        self._populator = LazyPopulator(self, self._unpopulated, self._populate)
 
         vbox(self)
         margins(self, bottom=75)
@@ -1837,19 +1871,34 @@ class CharacterProfileEditor(QWidget):
     def setCharacter(self, character: Character):
         self._character = character
         self._settings.refresh(character)
-        self.clear()
-        QTimer.singleShot(50, self.refresh)
+        if self._sections and [x.type for x in character.profile] == list(self._sections.keys()):
+            for section in character.profile:
+                wdg = self._sections[section.type]
+                wdg.setCharacter(character, section)
+                wdg.setVisible(section.enabled)
+            self._populator.schedule()
+        else:
+            self.clear()
+            QTimer.singleShot(50, self.refresh)
 
     @overrides
     def resizeEvent(self, event: QResizeEvent) -> None:
         super().resizeEvent(event)
         self._setBtnSettingsGeometry(event.size().width())
+        self._populator.schedule()
+
+    @overrides
+    def showEvent(self, event: QShowEvent) -> None:
+        super().showEvent(event)
+        self._populator.schedule()
 
     def clear(self):
         clear_layout(self)
+        self._sections.clear()
 
-    @busy
     def refresh(self):
+        if self._sections:
+            return
         for section in self._character.profile:
             if section.type == CharacterProfileSectionType.Goals:
                 sc = GmcSectionContext()
@@ -1869,24 +1918,16 @@ class CharacterProfileEditor(QWidget):
                 sc = SectionContext()
 
             wdg = ProfileSectionWidget(section, sc, self._character)
+            wdg.expanded.connect(self._populator.schedule)
             self._sections[section.type] = wdg
 
             self.layout().addWidget(wdg)
             wdg.setVisible(section.enabled)
-            for field in section.fields:
-                fieldWdg = field_widget(field, self._character)
-                wdg.attachWidget(fieldWdg)
-
-                if section.type == CharacterProfileSectionType.Personality and isinstance(fieldWdg,
-                                                                                          PersonalityFieldWidget):
-                    fieldWdg.enneagramChanged.connect(self._enneagramChanged)
-                    fieldWdg.ignored.connect(self._personalityIgnored)
-                elif section.type == CharacterProfileSectionType.Faculties and isinstance(fieldWdg, FacultyField):
-                    fieldWdg.setNovel(self._novel)
 
         self.layout().addWidget(vspacer())
 
         self.btnCustomize.raise_()
+        self._populator.schedule()
 
     def applyMinorRoleSettings(self):
         for personality in [NovelSetting.Character_enneagram, NovelSetting.Character_mbti,
@@ -1906,14 +1947,40 @@ class CharacterProfileEditor(QWidget):
             self._sections[sectionType].setVisible(False)
             self._settings.toggleSection(sectionType, False)
 
+        self._populator.schedule()
         self._highlightSettingsButton(resize=True)
 
+    def _unpopulated(self) -> List[ProfileSectionWidget]:
+        if self._character is None:
+            return []
+        return [x for x in self._sections.values() if not (x.isPopulated() or x.isHidden() or x.isCollapsed())]
+
+    def _populate(self, wdg: ProfileSectionWidget):
+        wdg.setPopulated(True)
+        for field in wdg.section.fields:
+            fieldWdg = field_widget(field, self._character)
+            wdg.attachWidget(fieldWdg)
+
+            if wdg.section.type == CharacterProfileSectionType.Personality and isinstance(fieldWdg,
+                                                                                          PersonalityFieldWidget):
+                fieldWdg.enneagramChanged.connect(self._enneagramChanged)
+                fieldWdg.ignored.connect(self._personalityIgnored)
+            elif wdg.section.type == CharacterProfileSectionType.Faculties and isinstance(fieldWdg, FacultyField):
+                fieldWdg.setNovel(self._novel)
+
+    def _populatedSection(self, sectionType: CharacterProfileSectionType) -> ProfileSectionWidget:
+        wdg = self._sections[sectionType]
+        if not wdg.isPopulated():
+            self._populate(wdg)
+        return wdg
+
     def _sectionToggled(self, section: CharacterProfileSectionReference):
         self._sections[section.type].setVisible(section.enabled)
+        self._populator.schedule()
 
     def _personalityToggled(self, personality: NovelSetting, toggled: bool):
-        wdg: Optional[PersonalityFieldWidget] = self._sections[CharacterProfileSectionType.Personality].findWidget(
-            PersonalityFieldWidget)
+        wdg: Optional[PersonalityFieldWidget] = self._populatedSection(
+            CharacterProfileSectionType.Personality).findWidget(PersonalityFieldWidget)
         if wdg:
             wdg.toggle(personality, toggled)
 
@@ -1937,8 +2004,8 @@ class CharacterProfileEditor(QWidget):
                     teardown=finished)
 
     def _enneagramChanged(self, enneagram: str):
-        wdgTraits: Optional[TraitsFieldWidget] = self._sections[CharacterProfileSectionType.Personality].findWidget(
-            TraitsFieldWidget)
+        wdgTraits: Optional[TraitsFieldWidget] = self._populatedSection(
+            CharacterProfileSectionType.Personality).findWidget(TraitsFieldWidget)
         if wdgTraits:
             if self._character.personality.enneagram:
                 previous = enneagram_choices[self._character.personality.enneagram.value]
@@ -189,6 +189,22 @@ class PosChangedCommand(QUndoCommand):
         self.item.setPosCommandEnabled(True)
 
 
+class ArrangeItemsCommand(QUndoCommand):
+    def __init__(self, refresh, parent=None):
+        super().__init__('Arrange items', parent)
+        self.refresh = refresh
+
+    @overrides
+    def redo(self) -> None:
+        super().redo()
+        self.refresh()
+
+    @overrides
+    def undo(self) -> None:
+        super().undo()
+        self.refresh()
+
+
 class ResizeItemCommand(QUndoCommand):
     def __init__(self, item: QGraphicsItem, old: QPointF, new: QPointF, parent=None):
         super().__init__(parent)
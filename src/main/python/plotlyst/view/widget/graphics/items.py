@@ -992,6 +992,8 @@ class CircleShapedNodeItem(NodeItem):
 
 
 class CharacterItem(CircleShapedNodeItem):
+    AvatarDetailThreshold: float = 0.3
+
     def __init__(self, character: Character, node: Node, parent=None):
         super(CharacterItem, self).__init__(node, parent)
         self._character = character
@@ -1036,6 +1038,12 @@ class CharacterItem(CircleShapedNodeItem):
     def paint(self, painter: QPainter, option: 'QStyleOptionGraphicsItem', widget: Optional[QWidget] = ...) -> None:
         super().paint(painter, option, widget)
 
+        if option.levelOfDetailFromTransform(painter.worldTransform()) < self.AvatarDetailThreshold:
+            painter.setPen(Qt.PenStyle.NoPen)
+            painter.setBrush(QColor(PLOTLYST_SECONDARY_COLOR))
+            painter.drawEllipse(self.Margin, self.Margin, self._size, self._size)
+            return
+
         avatar = avatars.avatar(self._character)
         avatar.paint(painter, self.Margin, self.Margin, self._size, self._size)
 
@@ -1742,3 +1750,54 @@ class ImageItem(NodeItem):
     def _setSocketsVisible(self, visible: bool = True):
         for socket in self._sockets:
             socket.setVisible(visible)
+
+
+class ClusterItem(QAbstractGraphicsShapeItem):
+    """Stands for a group of character items that are too close to each other to be told apart at the current zoom."""
+    MinSize: int = 60
+
+    def __init__(self, members: List[NodeItem], parent=None):
+        super().__init__(parent)
+        self._members = members
+        self._size = int(self.MinSize + 12 * math.log2(len(members)))
+        self._font = QFont(app_env.sans_serif_font())
+        self._font.setPointSize(24)
+        self._font.setBold(True)
+
+        center = QPointF(0, 0)
+        for member in members:
+            center += member.sceneBoundingRect().center()
+        center /= len(members)
+        self.setPos(center.x() - self._size / 2, center.y() - self._size / 2)
+        self.setZValue(1)
+        self.setToolTip(', '.join(x.character().name for x in members[:10] if isinstance(x, CharacterItem)))
+        pointy(self)
+
+    def members(self) -> List[NodeItem]:
+        return self._members
+
+    def center(self) -> QPointF:
+        return self.sceneBoundingRect().center()
+
+    def membersRect(self) -> QRectF:
+        rect = QRectF()
+        for member in self._members:
+            rect = rect.united(member.sceneBoundingRect())
+        return rect
+
+    @overrides
+    def boundingRect(self) -> QRectF:
+        return QRectF(0, 0, self._size, self._size)
+
+    @overrides
+    def paint(self, painter: QPainter, option: 'QStyleOptionGraphicsItem', widget: Optional[QWidget] = ...) -> None:
+        painter.setPen(QPen(QColor(PLOTLYST_SECONDARY_COLOR), 3))
+        painter.setBrush(QColor(RELAXED_WHITE_COLOR))
+        painter.drawEllipse(2, 2, self._size - 4, self._size - 4)
+        painter.setFont(self._font)
+        painter.setPen(QColor(PLOTLYST_SECONDARY_COLOR))
+        painter.drawText(self.boundingRect(), Qt.AlignmentFlag.AlignCenter, str(len(self._members)))
+
+    @overrides
+    def mouseDoubleClickEvent(self, event: QGraphicsSceneMouseEvent) -> None:
+        self.scene().clusterActivated.emit(self.membersRect())
@@ -0,0 +1,135 @@
+"""
+Plotlyst
+Copyright (C) 2021-2024  Zsolt Kovari
+
+This file is part of Plotlyst.
+
+Plotlyst is free software: you can redistribute it and/or modify
+it under the terms of the GNU General Public License as published by
+the Free Software Foundation, either version 3 of the License, or
+(at your option) any later version.
+
+Plotlyst is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+GNU General Public License for more details.
+
+You should have received a copy of the GNU General Public License
+along with this program.  If not, see <https://www.gnu.org/licenses/>.
+"""
+import math
+import random
+from typing import Dict, List, Tuple, Optional, Set, Hashable, Iterable
+
+from PyQt6.QtCore import QPointF
+
+Edge = Tuple[Hashable, Hashable]
+
+
+def cluster_points(points: Dict[Hashable, QPointF], cellSize: float, minSize: int = 2) -> List[List[Hashable]]:
+    """Groups the points that fall into the same cell of a uniform grid.
+
+    Cells with fewer than minSize points are left out, so their points stay on their own.
+    """
+    cells: Dict[Tuple[int, int], List[Hashable]] = {}
+    for key, point in points.items():
+        cell = math.floor(point.x() / cellSize), math.floor(point.y() / cellSize)
+        cells.setdefault(cell, []).append(key)
+    return [members for members in cells.values() if len(members) >= minSize]
+
+
+def aggregate_edges(edges: Iterable[Edge], groups: Dict[Hashable, Hashable]) -> Dict[Edge, int]:
+    """Counts the edges between groups. Keys missing from groups are their own group and edges within
+    a group are dropped."""
+    counts: Dict[Edge, int] = {}
+    for source, target in edges:
+        source = groups.get(source, source)
+        target = groups.get(target, target)
+        if source == target:
+            continue
+        key = (source, target) if id(source) <= id(target) else (target, source)
+        counts[key] = counts.get(key, 0) + 1
+    return counts
+
+
+class ForceLayout:
+    """Force-directed layout (Fruchterman-Reingold) with the repulsion limited to a grid neighbourhood.
+
+    The layout starts from the current positions and only displaces the movable nodes, so a change can be laid out
+    incrementally while the rest of the network stays where it is.
+    """
+
+    def __init__(self, distance: float = 180.0, iterations: int = 60, seed: Optional[int] = None):
+        self._distance = distance
+        self._iterations = iterations
+        self._random = random.Random(seed)
+
+    def layout(self, positions: Dict[Hashable, QPointF], edges: List[Edge],
+               movable: Optional[Set[Hashable]] = None) -> Dict[Hashable, QPointF]:
+        pos = {key: [point.x(), point.y()] for key, point in positions.items()}
+        movable = set(pos.keys()) if movable is None else movable & set(pos.keys())
+        if not movable:
+            return {}
+
+        neighbours: Dict[Hashable, List[Hashable]] = {key: [] for key in pos}
+        for source, target in edges:
+            if source in pos and target in pos and source != target:
+                neighbours[source].append(target)
+                neighbours[target].append(source)
+        self._separate(pos, movable)
+
+        k = self._distance
+        cellSize = 2 * k
+        temperature = k
+        cooling = temperature / (self._iterations + 1)
+        for _ in range(self._iterations):
+            grid: Dict[Tuple[int, int], List[Hashable]] = {}
+            for key, (x, y) in pos.items():
+                grid.setdefault((math.floor(x / cellSize), math.floor(y / cellSize)), []).append(key)
+
+            displacements: Dict[Hashable, List[float]] = {}
+            for key in movable:
+                x, y = pos[key]
+                dx = dy = 0.0
+                cx, cy = math.floor(x / cellSize), math.floor(y / cellSize)
+                for i in range(cx - 1, cx + 2):
+                    for j in range(cy - 1, cy + 2):
+                        for other in grid.get((i, j), ()):
+                            if other == key:
+                                continue
+                            ox, oy = x - pos[other][0], y - pos[other][1]
+                            distance = max(math.hypot(ox, oy), 0.01)
+                            force = k * k / distance
+                            dx += ox / distance * force
+                            dy += oy / distance * force
+                for other in neighbours[key]:
+                    ox, oy = x - pos[other][0], y - pos[other][1]
+                    distance = max(math.hypot(ox, oy), 0.01)
+                    force = distance * distance / k
+                    dx -= ox / distance * force
+                    dy -= oy / distance * force
+                displacements[key] = [dx, dy]
+
+            for key, (dx, dy) in displacements.items():
+                length = math.hypot(dx, dy)
+                if length > 0:
+                    step = min(length, temperature)
+                    pos[key][0] += dx / length * step
+                    pos[key][1] += dy / length * step
+            temperature -= cooling
+
+        return {key: QPointF(pos[key][0], pos[key][1]) for key in movable}
+
+    def _separate(self, pos: Dict[Hashable, List[float]], movable: Set[Hashable]):
+        # nodes on top of each other would not push each other apart in a defined direction
+        taken: Set[Tuple[float, float]] = set()
+        for key, point in pos.items():
+            if key not in movable:
+                taken.add((point[0], point[1]))
+        for key in movable:
+            point = pos[key]
+            while (point[0], point[1]) in taken:
+                angle = self._random.uniform(0, 2 * math.pi)
+                point[0] += math.cos(angle) * self._distance / 4
+                point[1] += math.sin(angle) * self._distance / 4
+            taken.add((point[0], point[1]))
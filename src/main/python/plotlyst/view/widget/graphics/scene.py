@@ -17,16 +17,17 @@ GNU General Public License for more details.
 You should have received a copy of the GNU General Public License
 along with this program.  If not, see <https://www.gnu.org/licenses/>.
 """
+import math
 from abc import abstractmethod
 from dataclasses import dataclass
-from typing import Optional, Dict, Set, Union
+from typing import Optional, Dict, Set, Union, List
 
 import qtanim
-from PyQt6.QtCore import Qt, pyqtSignal, QPointF, QPoint, QObject
+from PyQt6.QtCore import Qt, pyqtSignal, QPointF, QPoint, QObject, QRectF, QLineF
 from PyQt6.QtGui import QTransform, \
-    QKeyEvent, QKeySequence, QCursor, QImage, QUndoStack, QColor
+    QKeyEvent, QKeySequence, QCursor, QImage, QUndoStack, QColor, QPen
 from PyQt6.QtWidgets import QGraphicsItem, QGraphicsScene, QGraphicsSceneMouseEvent, QApplication, \
-    QGraphicsSceneDragDropEvent
+    QGraphicsSceneDragDropEvent, QGraphicsLineItem
 from overrides import overrides
 
 from plotlyst.core.domain import Node, Diagram, GraphicsItemType, Connector, PlaceholderCharacter, \
@@ -35,8 +36,11 @@ from plotlyst.service.cache import entities_registry
 from plotlyst.service.image import LoadedImage
 from plotlyst.view.widget.graphics import NodeItem, CharacterItem, PlaceholderSocketItem, ConnectorItem, \
     AbstractSocketItem, EventItem
-from plotlyst.view.widget.graphics.commands import ItemAdditionCommand, ItemRemovalCommand
-from plotlyst.view.widget.graphics.items import NoteItem, ImageItem, IconItem, CircleShapedNodeItem, ResizeIconItem
+from plotlyst.view.widget.graphics.commands import ItemAdditionCommand, ItemRemovalCommand, PosChangedCommand, \
+    ArrangeItemsCommand
+from plotlyst.view.widget.graphics.items import NoteItem, ImageItem, IconItem, CircleShapedNodeItem, ResizeIconItem, \
+    ClusterItem
+from plotlyst.view.widget.graphics.layout import cluster_points, aggregate_edges, ForceLayout
 
 
 @dataclass
@@ -62,6 +66,12 @@ class NetworkScene(QGraphicsScene):
     editItem = pyqtSignal(NodeItem)
     itemMoved = pyqtSignal(NodeItem)
     hideItemEditor = pyqtSignal()
+    clusterActivated = pyqtSignal(QRectF)
+
+    # below this zoom, large casts are drawn as clusters of nearby characters
+    ClusterThreshold: float = 0.5
+    ClusterMinNodes: int = 50
+    ClusterCellPixels: int = 120
 
     def __init__(self, parent=None):
         super().__init__(parent)
@@ -77,6 +87,11 @@ class NetworkScene(QGraphicsScene):
         self._placeholder: Optional[PlaceholderSocketItem] = None
         self._connectorPlaceholder: Optional[ConnectorItem] = None
 
+        self._levelOfDetail: float = 1.0
+        self._clusterCellSize: Optional[float] = None
+        self._clusterItems: List[QGraphicsItem] = []
+        self._clusteredItems: List[QGraphicsItem] = []
+
     def undoStack(self) -> QUndoStack:
         return self._undoStack
 
@@ -99,9 +114,61 @@ class NetworkScene(QGraphicsScene):
             if source and target:
                 self._addConnector(connector, source, target)
 
+        self._clusterCellSize = None
+        self.setLevelOfDetail(self._levelOfDetail)
+
         # trigger scene calculation early so that the view won't jump around for the first click
         self.sceneRect()
 
+    @overrides
+    def clear(self) -> None:
+        self._clusterItems.clear()
+        self._clusteredItems.clear()
+        super().clear()
+
+    def setLevelOfDetail(self, scale: float):
+        self._levelOfDetail = scale
+        characters = self._characterItems()
+        for item in characters:
+            item.setLabelVisible(scale >= self.ClusterThreshold)
+
+        if scale >= self.ClusterThreshold or len(characters) < self.ClusterMinNodes:
+            cellSize = None
+        else:
+            # the cell size only changes at every doubling of the zoom, so that zooming does not recluster each time
+            cellSize = 2 ** math.ceil(math.log2(self.ClusterCellPixels / scale))
+        if cellSize != self._clusterCellSize:
+            self._clusterCellSize = cellSize
+            self._cluster(characters)
+
+    def clusters(self) -> List[ClusterItem]:
+        return [x for x in self._clusterItems if isinstance(x, ClusterItem)]
+
+    def arrange(self, items: Optional[List[NodeItem]] = None):
+        nodes = [x for x in self.items() if isinstance(x, NodeItem) and x.parentItem() is None]
+        if not nodes:
+            return
+        centers = {x: x.sceneBoundingRect().center() for x in nodes}
+        edges = set()
+        for node in nodes:
+            for connector in node.connectors():
+                source = connector.source().parentItem()
+                target = connector.target().parentItem()
+                if source in centers and target in centers:
+                    edges.add((source, target))
+
+        positions = ForceLayout().layout(centers, list(edges), set(items) if items else None)
+        command = ArrangeItemsCommand(self._refreshClusters)
+        for item, center in positions.items():
+            old = item.pos()
+            new = old + center - centers[item]
+            item.setPosCommandEnabled(False)
+            item.setPos(new)
+            item.updatePos()
+            item.setPosCommandEnabled(True)
+            PosChangedCommand(item, old, new, command)
+        self._undoStack.push(command)
+
     def isAdditionMode(self) -> bool:
         return self._additionDescriptor is not None
 
@@ -219,6 +286,7 @@ class NetworkScene(QGraphicsScene):
                 self._undoStack.endMacro()
                 self._macroUndo = False
             self._movedItems.clear()
+            self._refreshClusters()
 
         if self.linkMode():
             if event.button() & Qt.MouseButton.RightButton:
@@ -304,6 +372,7 @@ class NetworkScene(QGraphicsScene):
         elif isinstance(item, ConnectorItem):
             addConnectorItem(item)
         self._save()
+        self._refreshClusters()
 
     def removeNetworkItem(self, item: Union[NodeItem, ConnectorItem]):
         self._removeItem(item)
@@ -379,6 +448,7 @@ class NetworkScene(QGraphicsScene):
             self.removeItem(item)
             item.update()
         self._save()
+        self._refreshClusters()
 
     def _clearUpConnectorItem(self, item: ConnectorItem):
         try:
@@ -523,6 +593,53 @@ class NetworkScene(QGraphicsScene):
         if isinstance(targetNode, CircleShapedNodeItem):
             targetNode.addSocket(targetSocket)
 
+    def _characterItems(self) -> List[CharacterItem]:
+        return [x for x in self.items() if isinstance(x, CharacterItem)]
+
+    def _refreshClusters(self):
+        if self._clusterCellSize is not None:
+            self._cluster(self._characterItems())
+
+    def _cluster(self, characters: List[CharacterItem]):
+        for item in self._clusterItems:
+            self.removeItem(item)
+        self._clusterItems.clear()
+        for item in self._clusteredItems:
+            item.setVisible(True)
+        self._clusteredItems.clear()
+        if self._clusterCellSize is None:
+            return
+
+        groups: Dict[QGraphicsItem, ClusterItem] = {}
+        centers = {x: x.sceneBoundingRect().center() for x in characters}
+        for members in cluster_points(centers, self._clusterCellSize):
+            cluster = ClusterItem(members)
+            self.addItem(cluster)
+            self._clusterItems.append(cluster)
+            for member in members:
+                groups[member] = cluster
+                member.setVisible(False)
+                self._clusteredItems.append(member)
+
+        edges = []
+        connectors = {connector for member in groups for connector in member.connectors()}
+        for connector in connectors:
+            connector.setVisible(False)
+            self._clusteredItems.append(connector)
+            edges.append((connector.source().parentItem(), connector.target().parentItem()))
+
+        for (source, target), count in aggregate_edges(edges, groups).items():
+            line = QGraphicsLineItem(QLineF(self._center(source), self._center(target)))
+            line.setPen(QPen(QColor('#212529'), 1 + math.log2(count)))
+            line.setZValue(-1)
+            self.addItem(line)
+            self._clusterItems.append(line)
+
+    def _center(self, item: QGraphicsItem) -> QPointF:
+        if isinstance(item, ClusterItem):
+            return item.center()
+        return item.sceneBoundingRect().center()
+
     def _updateSelection(self):
         pass
         # self.clearSelection()
@@ -22,13 +22,13 @@ from functools import partial
 from typing import Optional
 
 import qtanim
-from PyQt6.QtCore import Qt, QTimer
+from PyQt6.QtCore import Qt, QTimer, QRectF
 from PyQt6.QtGui import QPainter, QWheelEvent, QMouseEvent, QColor, QIcon, QResizeEvent, QNativeGestureEvent, QFont, \
     QUndoStack, QKeySequence
 from PyQt6.QtWidgets import QGraphicsView, QGraphicsItem, QFrame, \
     QToolButton, QApplication, QWidget
 from overrides import overrides
-from qthandy import sp, incr_icon, vbox
+from qthandy import sp, incr_icon, vbox, busy
 from qthandy.filter import DragEventFilter
 from qtpy import sip
 
@@ -199,10 +199,12 @@ class NetworkGraphicsView(BaseGraphicsView):
         self._scene.editItem.connect(self._editItem)
         self._scene.itemMoved.connect(self._itemMoved)
         self._scene.hideItemEditor.connect(self._hideItemToolbar)
+        self._scene.clusterActivated.connect(self._zoomToCluster)
 
     def setDiagram(self, diagram: Diagram):
         self._diagram = diagram
         self.undoStack.clear()
+        self._scene.setLevelOfDetail(self.transform().m11())
         self._scene.setDiagram(diagram)
         self.centerOn(0, 0)
 
@@ -214,12 +216,30 @@ class NetworkGraphicsView(BaseGraphicsView):
     @overrides
     def resetZoom(self):
         super().resetZoom()
-        self._wdgZoomBar.updateScaledFactor(self.scaledFactor())
+        self._zoomChanged()
 
     @overrides
     def _scale(self, scale: float):
         super()._scale(scale)
+        self._zoomChanged()
+
+    def _zoomToCluster(self, rect: QRectF):
+        self.centerOn(rect.center())
+        factor = max(NetworkScene.ClusterThreshold / self.transform().m11(),
+                     min(self.viewport().width() / max(rect.width(), 1), self.viewport().height() / max(rect.height(), 1)))
+        if self._scalingEnabled:
+            self.scale(factor, factor)
+            self._scaledFactor = self.transform().m11()
+            self._zoomChanged()
+        self.centerOn(rect.center())
+
+    def _zoomChanged(self):
         self._wdgZoomBar.updateScaledFactor(self.scaledFactor())
+        self._scene.setLevelOfDetail(self.transform().m11())
+
+    @busy
+    def _arrange(self):
+        self._scene.arrange([x for x in self._scene.selectedItems() if isinstance(x, NodeItem)])
 
     def _mainControlClicked(self, itemType: GraphicsItemType, checked: bool):
         if checked:
@@ -21,7 +21,7 @@ import uuid
 from copy import deepcopy
 from typing import List, Optional
 
-from PyQt6.QtCore import Qt, QTimer, QSize, QThreadPool
+from PyQt6.QtCore import Qt, QTimer, QSize
 from PyQt6.QtWidgets import QSplitter, QWidget, QDialog
 from overrides import overrides
 from qthandy import sp, vbox, line, hbox, clear_layout, transparent, margins
@@ -29,7 +29,7 @@ from qthandy import sp, vbox, line, hbox, clear_layout, transparent, margins
 from plotlyst.common import RELAXED_WHITE_COLOR, PLOTLYST_SECONDARY_COLOR
 from plotlyst.core.client import json_client
 from plotlyst.core.domain import NovelDescriptor, StoryType, Novel, Location, Character
-from plotlyst.service.importer import NovelLoaderWorker, NovelLoadingResult
+from plotlyst.service.importer import NovelLoadingResult, series_cache
 from plotlyst.view.common import push_btn, label, spin, scroll_area
 from plotlyst.view.icons import IconRegistry, avatars
 from plotlyst.view.layout import group
@@ -94,6 +94,11 @@ class SeriesImportBase(PopupDialog):
         if novel.story_type != StoryType.Novel:
             return
 
+        cached = series_cache.novel(novel.id)
+        if cached is not None:
+            self._novelLoadingFinished(cached)
+            return
+
         self.wdgLoading.setVisible(True)
         btn = push_btn(transparent_=True)
         btn.setIconSize(QSize(128, 128))
@@ -107,8 +112,7 @@ class SeriesImportBase(PopupDialog):
         pass
 
     def _fetchNovel(self, novel: NovelDescriptor):
-        runnable = NovelLoaderWorker(novel.id, self._loadingResult)
-        QThreadPool.globalInstance().start(runnable)
+        series_cache.fetch(novel.id, self._loadingResult)
 
     def _novelLoadingFinished(self, novel: Novel):
         self.wdgLoading.setVisible(False)
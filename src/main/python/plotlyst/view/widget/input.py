@@ -53,6 +53,7 @@ from plotlyst.event.handler import global_event_dispatcher
 from plotlyst.events import LanguageToolSet
 from plotlyst.model.characters_model import CharactersTableModel
 from plotlyst.model.common import proxy
+from plotlyst.service.diagnostics import monitored
 from plotlyst.service.grammar import language_tool_proxy, dictionary
 from plotlyst.service.persistence import RepositoryPersistenceManager
 from plotlyst.view.common import action, label, push_btn, tool_btn, insert_before, fade_out_and_gc, shadow, emoji_font, \
@@ -237,6 +238,7 @@ class GrammarHighlighter(AbstractTextBlockHighlighter, EventListener):
             self._language_tool = language_tool_proxy.tool
             self.asyncRehighlight()
 
+    @monitored
     @overrides
     def highlightBlock(self, text: str) -> None:
         data = self._currentblockData()
@@ -295,8 +295,6 @@ class SceneLabel(Label):
 
         self.setScene(scene)
 
-        self.setStyleSheet('SceneLabel {border: 1px solid black; border-radius: 8px; padding: 2px;}')
-
     def setScene(self, scene: Scene):
         self.btnTypeIcon.setIcon(IconRegistry.scene_type_icon(scene))
         self.lblTitle.setText(scene.title_or_index(app_env.novel))
@@ -22,19 +22,21 @@ from typing import List, Set, Dict, Optional
 
 from PyQt6.QtCore import pyqtSignal, Qt, QSize
 from PyQt6.QtGui import QIcon, QPixmap
-from PyQt6.QtWidgets import QFileDialog, QDialog, QWidget, QStackedWidget, QButtonGroup, QLineEdit, QLabel, QTextEdit
+from PyQt6.QtWidgets import QFileDialog, QDialog, QWidget, QStackedWidget, QButtonGroup, QLineEdit, QLabel, QTextEdit, \
+    QProgressBar
 from overrides import overrides
 from qthandy import vspacer, sp, hbox, vbox, line, incr_font, spacer, margins, incr_icon, transparent, \
-    retain_when_hidden, italic, decr_icon, translucent, pointy
+    retain_when_hidden, italic, decr_icon, translucent, pointy, gc
 from qthandy.filter import OpacityEventFilter, InstantTooltipEventFilter, VisibilityToggleEventFilter
 
 from plotlyst.common import PLOTLYST_MAIN_COLOR, MAXIMUM_SIZE, RELAXED_WHITE_COLOR
 from plotlyst.core.domain import NovelDescriptor, Novel, StoryType
 from plotlyst.core.scrivener import ScrivenerParser
 from plotlyst.env import app_env
+from plotlyst.event.core import emit_critical
 from plotlyst.resources import ResourceType, resource_registry
-from plotlyst.service.cache import entities_registry
-from plotlyst.service.manuscript import import_docx
+from plotlyst.service.cache import entities_registry, LibraryIndex
+from plotlyst.service.manuscript import import_docx_async, DocxImportResult
 from plotlyst.service.resource import ask_for_resource
 from plotlyst.view.common import push_btn, link_buttons_to_pages, tool_btn, label, frame, wrap
 from plotlyst.view.icons import IconRegistry
@@ -105,7 +107,8 @@ class ShelvesTreeView(TreeView):
 
         self._selectedNovels: Set[NovelDescriptor] = set()
         self._novels: Dict[NovelDescriptor, NovelNode] = {}
-        self._series: Dict[str, NovelNode] = {}
+        self._index = LibraryIndex()
+        self._filter: str = ''
 
         self._wdgNovels = ShelveNode('Novels', IconRegistry.from_name('mdi.bookshelf'), settings=self._settings,
                                      readOnly=self._readOnly)
@@ -130,34 +133,57 @@ class ShelvesTreeView(TreeView):
         self._settings = settings
 
     def novels(self) -> List[NovelDescriptor]:
-        return list(self._novels.keys())
+        return self._index.novels()
+
+    def index(self) -> LibraryIndex:
+        return self._index
 
     def setNovels(self, novels: List[NovelDescriptor]):
         self.clearSelection()
         self._novels.clear()
-        self._series.clear()
-
-        novels_under_series: List[NovelDescriptor] = []
-
         self._wdgNovels.clearChildren()
-        for novel in novels:
-            if novel.parent:
-                novels_under_series.append(novel)
-                continue
-            node = self.__initNode(novel)
-            self._wdgNovels.addChild(node)
-
-        novels_under_series.sort(key=lambda x: x.sequence)
-        for novel in novels_under_series:
-            node = self.__initNode(novel)
-            series = self._series.get(str(novel.parent))
-            if series:
-                series.addChild(node)
-            else:
-                self._wdgNovels.addChild(node)
+        self._index.set_novels(novels)
+
+        for novel in self._index.top_level():
+            self._wdgNovels.addChild(self.__initNode(novel))
+        for novel in self._index.novels():
+            if novel.story_type == StoryType.Series:
+                node = self._novels[novel]
+                for child in self._index.children(novel):
+                    node.addChild(self.__initNode(child))
+
+        if self._filter:
+            self._applyFilter()
+
+    def addNovel(self, novel: NovelDescriptor):
+        self._index.add(novel)
+        self.__initNode(novel)
+        self._place(novel)
+        if self._filter:
+            self._applyFilter()
+
+    def removeNovel(self, novel: NovelDescriptor):
+        node = self._novels.pop(novel, None)
+        if node is None:
+            return
+        self._selectedNovels.discard(novel)
+        children = self._index.children(novel)
+        self._index.remove(novel)
+        for child in children:
+            self._place(child)
+        gc(node)
 
     def updateNovel(self, novel: NovelDescriptor):
         self._novels[novel].refresh()
+        if self._index.update(novel):
+            for sibling in self._index.siblings(novel):
+                self._place(sibling)
+        if self._filter:
+            self._applyFilter()
+
+    def setFilter(self, text: str):
+        self._filter = text
+        self._applyFilter()
 
     def selectNovel(self, novel: NovelDescriptor):
         self.clearSelection()
@@ -167,8 +193,7 @@ class ShelvesTreeView(TreeView):
         self.novelSelected.emit(novel)
 
     def childrenNovels(self, novel: NovelDescriptor) -> List[NovelDescriptor]:
-        node = self._novels[novel]
-        return [x.novel() for x in node.childrenWidgets()]
+        return self._index.children(novel)
 
     def clearSelection(self):
         for novel in self._selectedNovels:
@@ -191,6 +216,22 @@ class ShelvesTreeView(TreeView):
         if novel.story_type == StoryType.Novel:
             self.novelOpenRequested.emit(novel)
 
+    def _place(self, novel: NovelDescriptor):
+        node = self._novels[novel]
+        series = self._index.series(novel)
+        container = self._novels[series] if series is not None else self._wdgNovels
+        i = self._index.siblings(novel).index(novel)
+        if container.indexOf(node) == i:
+            return
+        if node.parentWidget() is not None and node.parentWidget() is not container.containerWidget():
+            node.parentWidget().layout().removeWidget(node)
+        container.insertChild(min(i, container.containerWidget().layout().count()), node)
+
+    def _applyFilter(self):
+        visible = self._index.filter(self._filter)
+        for novel, node in self._novels.items():
+            node.setVisible(novel.id in visible)
+
     def __initNode(self, novel: NovelDescriptor) -> NovelNode:
         node = NovelNode(novel, settings=self._settings, readOnly=self._readOnly)
         node.selectionChanged.connect(partial(self._novelSelectionChanged, node))
@@ -198,8 +239,6 @@ class ShelvesTreeView(TreeView):
         node.deleted.connect(partial(self.novelDeletionRequested.emit, novel))
         node.doubleClicked.connect(partial(self._novelDoubleClicked, novel))
         self._novels[novel] = node
-        if novel.story_type == StoryType.Series:
-            self._series[str(novel.id)] = node
         return node
 
 
@@ -459,6 +498,7 @@ class StoryCreationDialog(PopupDialog):
         self._importedNovel: Optional[Novel] = None
         self._wizardNovel: Optional[Novel] = None
         self._wizard: Optional[NovelCustomizationWizard] = None
+        self._docxImport: Optional[DocxImportResult] = None
 
         self.frame.layout().setSpacing(0)
         margins(self.frame, 0, 0, 0)
@@ -620,6 +660,19 @@ class StoryCreationDialog(PopupDialog):
             group(label('Scene titles will inherit chapter titles', description=True), self.btnInheritSceneTitle,
                   spacer(), margin_left=23))
         self.pageDocx.layout().addWidget(self.btnLoadDocx, alignment=Qt.AlignmentFlag.AlignRight)
+
+        self.progressDocx = QProgressBar()
+        self.progressDocx.setTextVisible(False)
+        self.lblDocxProgress = label('Converting manuscript...', description=True)
+        self.btnCancelDocx = push_btn(IconRegistry.close_icon('grey'), 'Cancel import', transparent_=True)
+        self.btnCancelDocx.clicked.connect(self._cancelDocxImport)
+        self.wdgDocxProgress = QWidget()
+        vbox(self.wdgDocxProgress, 0)
+        self.wdgDocxProgress.layout().addWidget(self.lblDocxProgress)
+        self.wdgDocxProgress.layout().addWidget(self.progressDocx)
+        self.wdgDocxProgress.layout().addWidget(self.btnCancelDocx, alignment=Qt.AlignmentFlag.AlignRight)
+        self.wdgDocxProgress.setHidden(True)
+        self.pageDocx.layout().addWidget(self.wdgDocxProgress)
         self.pageDocx.layout().addWidget(vspacer())
 
         self.frame.layout().addWidget(self.wdgBanner)
@@ -629,6 +682,11 @@ class StoryCreationDialog(PopupDialog):
 
         self.resize(700, 550)
 
+    @overrides
+    def reject(self):
+        self._cancelDocxImport()
+        super().reject()
+
     def display(self) -> Optional[Novel]:
         self._importedNovel = None
 
@@ -736,12 +794,49 @@ class StoryCreationDialog(PopupDialog):
             heading = 2
         else:
             heading = 3
-        self._importedNovel = import_docx(docxpath[0], chapter_heading_level=heading,
-                                          infer_scene_titles=self.btnInheritSceneTitle.isChecked())
-
+        self._docxImport = import_docx_async(docxpath[0], chapter_heading_level=heading,
+                                             infer_scene_titles=self.btnInheritSceneTitle.isChecked())
+        self._docxImport.progressChanged.connect(self._docxImportProgressed)
+        self._docxImport.finished.connect(self._docxImported)
+        self._docxImport.failed.connect(self._docxImportFailed)
+        self._docxImport.cancelled.connect(self._docxImportFinished)
+        self.progressDocx.setRange(0, 0)
+        self.lblDocxProgress.setText('Converting manuscript...')
+        self._setDocxImportRunning(True)
+
+    def _docxImportProgressed(self, progress: int):
+        if self.progressDocx.maximum() == 0:
+            self.progressDocx.setRange(0, 100)
+            self.lblDocxProgress.setText('Detecting chapters and scenes...')
+        self.progressDocx.setValue(progress)
+
+    def _docxImported(self, novel: Novel):
+        self._docxImportFinished()
+        self._importedNovel = novel
         self.wdgImportDetails.wdgScrivenerTop.setHidden(True)
         self._showImportedPreview()
 
+    def _docxImportFailed(self, msg: str):
+        self._docxImportFinished()
+        emit_critical('Could not import docx file', msg)
+
+    def _docxImportFinished(self):
+        self._docxImport = None
+        self._setDocxImportRunning(False)
+
+    def _cancelDocxImport(self):
+        if self._docxImport:
+            self._docxImport.cancel()
+
+    def _setDocxImportRunning(self, running: bool):
+        self.wdgDocxProgress.setVisible(running)
+        self.btnLoadDocx.setDisabled(running)
+        for btn in self.buttonGroup.buttons():
+            btn.setDisabled(running)
+        for btn in self.buttonGroupDocxHeadings.buttons():
+            btn.setDisabled(running)
+        self.btnInheritSceneTitle.setDisabled(running)
+
     def _showImportedPreview(self):
         self.stackedWidget.setCurrentWidget(self.pageImportedPreview)
         self.wdgBanner.setHidden(True)
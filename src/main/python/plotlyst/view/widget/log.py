@@ -22,15 +22,18 @@ from logging import LogRecord, WARNING
 
 from PyQt6.QtCore import Qt, QModelIndex, QTimer
 from PyQt6.QtGui import QClipboard
-from PyQt6.QtWidgets import QTableView, QSplitter, QTextBrowser, QWidget, QApplication
+from PyQt6.QtWidgets import QTableView, QSplitter, QTextBrowser, QWidget, QApplication, QFileDialog
 from qthandy import vbox
 
-from plotlyst.model.log import LogTableModel
+from plotlyst.model.log import LogTableModel, StallTableModel
+from plotlyst.service.diagnostics import latency_monitor
 from plotlyst.service.log import LogHandler
+from plotlyst.settings import settings
 from plotlyst.view.common import stretch_col, push_btn, tool_btn, label, fade_in
 from plotlyst.view.icons import IconRegistry
 from plotlyst.view.layout import group
 from plotlyst.view.widget.display import PopupDialog
+from plotlyst.view.widget.input import Toggle
 
 
 class LogsPopup(PopupDialog):
@@ -70,11 +73,29 @@ class LogsPopup(PopupDialog):
         self.splitterDisplay.setMinimumSize(800, 400)
         self.wdgErrorDisplay.setHidden(True)
 
+        self.toggleDiagnostics = Toggle()
+        self.toggleDiagnostics.setToolTip('Measure the slow operations that make the application unresponsive')
+        self.toggleDiagnostics.setChecked(latency_monitor.enabled)
+        self.toggleDiagnostics.toggled.connect(self._diagnosticsToggled)
+        self.btnExport = push_btn(IconRegistry.from_name('mdi.file-export-outline'), 'Export report',
+                                  transparent_=True)
+        self.btnExport.clicked.connect(self._exportReport)
+
+        self.stallModel = StallTableModel(self)
+        self.tblStalls = QTableView()
+        self.tblStalls.setModel(self.stallModel)
+        self.tblStalls.setMinimumHeight(150)
+        stretch_col(self.tblStalls, StallTableModel.ColSource)
+        self._updateDiagnostics()
+
         self.btnClose = push_btn(text='Close', properties=['confirm', 'cancel'])
         self.btnClose.clicked.connect(self.accept)
 
         self.frame.layout().addWidget(self.btnReset, alignment=Qt.AlignmentFlag.AlignRight)
         self.frame.layout().addWidget(self.splitterDisplay)
+        self.frame.layout().addWidget(group(label('Diagnostics'), self.toggleDiagnostics, self.btnExport),
+                                      alignment=Qt.AlignmentFlag.AlignLeft)
+        self.frame.layout().addWidget(self.tblStalls)
         self.frame.layout().addWidget(self.btnClose, alignment=Qt.AlignmentFlag.AlignRight)
 
     def display(self):
@@ -95,3 +116,18 @@ class LogsPopup(PopupDialog):
 
         fade_in(self.lblCopied)
         QTimer.singleShot(450, lambda: self.lblCopied.setHidden(True))
+
+    def _diagnosticsToggled(self, toggled: bool):
+        latency_monitor.set_enabled(toggled)
+        settings.set_diagnostics_enabled(toggled)
+        self._updateDiagnostics()
+
+    def _updateDiagnostics(self):
+        self.tblStalls.setVisible(latency_monitor.enabled)
+        self.btnExport.setVisible(latency_monitor.enabled)
+
+    def _exportReport(self):
+        path, _ = QFileDialog.getSaveFileName(self, 'Export diagnostics report', 'plotlyst-diagnostics.json',
+                                              'JSON files (*.json)')
+        if path:
+            latency_monitor.export(path)
@@ -37,14 +37,14 @@ from qthandy import retain_when_hidden, translucent, margins, vbox, bold, vline,
 from qthandy.filter import OpacityEventFilter
 from qtmenu import MenuWidget, group
 from qttextedit import TextBlockState
-from textstat import textstat
 
 from plotlyst.common import RELAXED_WHITE_COLOR, PLOTLYST_SECONDARY_COLOR, PLOTLYST_MAIN_COLOR
 from plotlyst.core.domain import Novel, DocumentProgress
 from plotlyst.core.sprint import TimerModel
-from plotlyst.core.text import wc, sentence_count, clean_text
+from plotlyst.core.text import TextStatistics, text_statistics
 from plotlyst.env import app_env
 from plotlyst.resources import resource_registry
+from plotlyst.service.cache import progress_registry
 from plotlyst.service.manuscript import find_daily_overall_progress
 from plotlyst.view.common import spin, ButtonPressResizeEventFilter, label, push_btn, \
     tool_btn
@@ -300,9 +300,15 @@ class ReadabilityWidget(QWidget, Ui_ReadabilityWidget):
         self.btnRefresh.clicked.connect(lambda: self.checkTextDocument(self._updatedDoc))
 
     def checkTextDocument(self, doc: QTextDocument):
-        text = doc.toPlainText()
-        cleaned_text = clean_text(text)
-        word_count = wc(text)
+        statistics = TextStatistics()
+        for i in range(doc.blockCount()):
+            block = doc.findBlockByNumber(i)
+            if block.userState() == TextBlockState.UNEDITABLE.value:
+                continue
+            block_text = block.text()
+            if block_text:
+                statistics += text_statistics(block_text)
+        word_count = statistics.wc
         spin(self.btnResult)
         if word_count < 30:
             msg = 'Text is too short for calculating readability score'
@@ -310,7 +316,7 @@ class ReadabilityWidget(QWidget, Ui_ReadabilityWidget):
             self.btnResult.setIcon(IconRegistry.from_name('ei.question'))
             self.lblResult.setText(f'<i style="color:grey">{msg}</i>')
         else:
-            score = textstat.flesch_reading_ease(cleaned_text)
+            score = statistics.flesch_reading_ease()
             self.btnResult.setToolTip(f'Flesch–Kincaid readability score: {score}')
 
             if score >= 80:
@@ -331,19 +337,7 @@ class ReadabilityWidget(QWidget, Ui_ReadabilityWidget):
                 self.btnResult.setIcon(IconRegistry.from_name('mdi.alpha-e-circle-outline', color='#85182a'))
                 self.lblResult.setText('<i style="color:#85182a">Very difficult to read</i>')
 
-        sentences_count = 0
-        for i in range(doc.blockCount()):
-            block = doc.findBlockByNumber(i)
-            if block.userState() == TextBlockState.UNEDITABLE.value:
-                continue
-            block_text = block.text()
-            if block_text:
-                sentences_count += sentence_count(block_text)
-
-        if not sentences_count:
-            sentence_length = 0
-        else:
-            sentence_length = word_count / sentences_count
+        sentence_length = statistics.avg_sentence_length()
         self.lblAvgSentenceLength.setText("%.2f" % round(sentence_length, 1))
 
         self.btnRefresh.setHidden(True)
@@ -531,6 +525,7 @@ class ManuscriptProgressCalendar(QCalendarWidget):
     def __init__(self, novel: Novel, parent=None):
         super().__init__(parent)
         self._novel = novel
+        progress_registry.track(self._novel)
 
         self.setVerticalHeaderFormat(QCalendarWidget.VerticalHeaderFormat.NoVerticalHeader)
         self.setHorizontalHeaderFormat(QCalendarWidget.HorizontalHeaderFormat.NoHorizontalHeader)
@@ -579,7 +574,7 @@ class ManuscriptProgressCalendar(QCalendarWidget):
             bold(painter, date == self.selectedDate())
             underline(painter, date == self.selectedDate())
 
-            progress = find_daily_overall_progress(self._novel, date_to_str(date))
+            progress = progress_registry.day_progress(date.toPyDate())
             if progress:
                 painter.setPen(QColor('#BB90CE'))
                 if progress.added + progress.removed >= 1500:
@@ -44,7 +44,8 @@ from plotlyst.env import app_env
 from plotlyst.event.core import Event, EventListener
 from plotlyst.event.handler import event_dispatchers
 from plotlyst.events import SceneDeletedEvent, SceneChangedEvent
-from plotlyst.service.manuscript import daily_progress, daily_overall_progress
+from plotlyst.service.diagnostics import monitored
+from plotlyst.service.manuscript import record_progress
 from plotlyst.service.persistence import RepositoryPersistenceManager
 from plotlyst.view.common import tool_btn, fade_in, fade
 from plotlyst.view.icons import IconRegistry
@@ -652,6 +653,7 @@ class ManuscriptEditor(QWidget, EventListener):
             if textedit.textCursor().hasSelection():
                 return textedit.textCursor().selection()
 
+    @monitored
     def _textChanged(self, textedit: ManuscriptTextEdit, scene: Scene):
         if scene.manuscript.statistics is None:
             scene.manuscript.statistics = DocumentStatistics()
@@ -671,15 +673,7 @@ class ManuscriptEditor(QWidget, EventListener):
         if scene.manuscript.statistics.wc == wc:
             return False
 
-        diff = wc - scene.manuscript.statistics.wc
-        progress: DocumentProgress = daily_progress(scene)
-        overall_progress = daily_overall_progress(self._novel)
-        if diff > 0:
-            progress.added += diff
-            overall_progress.added += diff
-        else:
-            progress.removed += abs(diff)
-            overall_progress.removed += abs(diff)
+        overall_progress = record_progress(self._novel, scene, wc - scene.manuscript.statistics.wc)
         self.progressChanged.emit(overall_progress)
         scene.manuscript.statistics.wc = wc
 
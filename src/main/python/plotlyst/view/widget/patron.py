@@ -801,7 +801,7 @@ class VipPatronCard(Card):
         if not patron.bio:
             self.bio.setHidden(True)
 
-        self._setStyleSheet()
+        self._applyStyle()
 
     @overrides
     def mouseReleaseEvent(self, event: QMouseEvent) -> None:
@@ -821,10 +821,6 @@ class VipPatronCard(Card):
         else:
             self.bio.setVisible(False)
 
-    @overrides
-    def _bgColor(self, selected: bool = False) -> str:
-        return '#F7F0F0'
-
     def _displayProfile(self):
         menu = MenuWidget()
         menu.setAttribute(Qt.WidgetAttribute.WA_TranslucentBackground)
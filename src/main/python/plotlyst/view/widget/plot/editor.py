@@ -640,7 +640,7 @@ class PlotEditor(QWidget, Ui_PlotEditor):
         self._wdgList.addPlot(plot)
         self.repo.update_novel(self.novel)
         self._wdgList.selectPlot(plot)
-        self._wdgImpactMatrix.refresh()
+        self._wdgImpactMatrix.addStoryline(plot)
 
         emit_event(self.novel, StorylineCreatedEvent(self))
 
@@ -651,7 +651,9 @@ class PlotEditor(QWidget, Ui_PlotEditor):
         widget = PlotWidget(self.novel, plot, self.pageDisplay)
         widget.removalRequested.connect(partial(self._remove, widget))
         widget.titleChanged.connect(partial(self._wdgList.refreshPlot, widget.plot))
+        widget.titleChanged.connect(partial(self._wdgImpactMatrix.refreshStoryline, widget.plot))
         widget.iconChanged.connect(partial(self._wdgList.refreshPlot, widget.plot))
+        widget.iconChanged.connect(partial(self._wdgImpactMatrix.refreshStoryline, widget.plot))
         widget.characterChanged.connect(self._wdgList.refreshCharacters)
 
         clear_layout(self.pageDisplay)
@@ -670,7 +672,7 @@ class PlotEditor(QWidget, Ui_PlotEditor):
                     clear_layout(self.pageDisplay)
         delete_plot(self.novel, plot)
 
-        self._wdgImpactMatrix.refresh()
+        self._wdgImpactMatrix.removeStoryline(plot)
         emit_event(self.novel, StorylineRemovedEvent(self, plot))
 
     def _displayImpactMatrix(self, checked: bool):
@@ -19,14 +19,14 @@ along with this program.  If not, see <https://www.gnu.org/licenses/>.
 """
 
 from functools import partial
-from typing import Dict, Optional
+from typing import Dict, Optional, List, Tuple
 
 import qtanim
 from PyQt6.QtCore import pyqtSignal, Qt, QSize
-from PyQt6.QtGui import QShowEvent
+from PyQt6.QtGui import QShowEvent, QMouseEvent
 from PyQt6.QtWidgets import QWidget, QTextEdit, QGridLayout, QStackedWidget
 from overrides import overrides
-from qthandy import vbox, clear_layout, vspacer, spacer, sp, grid, line, vline
+from qthandy import vbox, vspacer, spacer, sp, grid, line, vline
 from qthandy.filter import VisibilityToggleEventFilter, OpacityEventFilter
 from qtmenu import MenuWidget, ActionTooltipDisplayMode
 
@@ -53,6 +53,9 @@ class StorylineHeaderWidget(QWidget):
 
     @overrides
     def showEvent(self, event: QShowEvent) -> None:
+        self.refresh()
+
+    def refresh(self):
         self._lbl.setText(self._storyline.text)
         self._icon.setIcon(IconRegistry.from_name(self._storyline.icon, self._storyline.icon_color))
 
@@ -134,6 +137,10 @@ class StorylinesConnectionWidget(QWidget):
     def activate(self):
         self._text.setFocus()
 
+    def displayLinkButton(self):
+        if self._link is None:
+            self._btnLink.setVisible(True)
+
     def setLink(self, link: StorylineLink):
         self._link = None
         self._text.setText(link.text)
@@ -177,12 +184,27 @@ class StorylinesConnectionWidget(QWidget):
 
 
 class StorylinesImpactMatrix(QWidget):
+    # only the headers and the linked cells have widgets; an empty cell is materialized when hovered,
+    # so the matrix stays cheap even with many dozens of storylines
+    cellWidth: int = 200
+    cellHeight: int = 160
+
     def __init__(self, novel: Novel, parent=None):
         super().__init__(parent)
         self._novel = novel
         self._refreshOnShown = True
+        self._storylines: List[Plot] = []
+        self._headers: Dict[Plot, Tuple[StorylineHeaderWidget, StorylineHeaderWidget]] = {}
+        self._diagonal: Dict[Plot, QWidget] = {}
+        self._cells: Dict[Tuple[Plot, Plot], StorylinesConnectionWidget] = {}
+        self._line = line()
+        self._vline = vline()
+        self._spacer = spacer()
+        self._vspacer = vspacer()
+        self._size: int = 0
 
         self._grid: QGridLayout = grid(self)
+        self.setMouseTracking(True)
         self.repo = RepositoryPersistenceManager.instance()
 
     @overrides
@@ -191,45 +213,136 @@ class StorylinesImpactMatrix(QWidget):
             self._refreshMatrix()
             self._refreshOnShown = False
 
+    @overrides
+    def mouseMoveEvent(self, event: QMouseEvent) -> None:
+        row = self._section(event.pos().y(), True)
+        col = self._section(event.pos().x(), False)
+        if row is None or col is None or row == col:
+            return
+        key = (self._storylines[row], self._storylines[col])
+        if key not in self._cells:
+            wdg = self._addCell(*key)
+            self._place(wdg, row + 1, col + 1)
+            wdg.displayLinkButton()
+
     def refresh(self):
         if self.isVisible():
             self._refreshMatrix()
         else:
             self._refreshOnShown = True
 
+    def addStoryline(self, storyline: Plot):
+        if self._refreshOnShown:
+            return
+        self._storylines.append(storyline)
+        self._addHeaders(storyline)
+        self._layoutMatrix()
+
+    def removeStoryline(self, storyline: Plot):
+        if self._refreshOnShown or storyline not in self._headers:
+            return
+        self._storylines.remove(storyline)
+        for wdg in self._headers.pop(storyline):
+            self._removeWidget(wdg)
+        self._removeWidget(self._diagonal.pop(storyline))
+        for key in [x for x in self._cells.keys() if storyline in x]:
+            self._removeWidget(self._cells.pop(key))
+        self._layoutMatrix()
+
+    def refreshStoryline(self, storyline: Plot):
+        for header in self._headers.get(storyline, ()):
+            header.refresh()
+
     def _refreshMatrix(self):
-        clear_layout(self)
-
-        for i, storyline in enumerate(self._novel.plots):
-            refs: Dict[str, StorylineLink] = {}
-            for ref in storyline.links:
-                refs[str(ref.target_id)] = ref
-
-            header = StorylineHeaderWidget(storyline)
-            self._grid.addWidget(header, 0, i + 1, alignment=Qt.AlignmentFlag.AlignCenter)
-
-            row = StorylineHeaderWidget(storyline)
-            row.setMinimumHeight(70)
-            self._grid.addWidget(row, i + 1, 0, alignment=Qt.AlignmentFlag.AlignVCenter)
-
-            self._grid.addWidget(self._emptyCellWidget(), i + 1, i + 1)
-
-            for j, ref_storyline in enumerate(self._novel.plots):
-                if storyline is ref_storyline:
-                    continue
-                wdg = StorylinesConnectionWidget(storyline, ref_storyline)
-                wdg.linked.connect(self._save)
-                wdg.linkChanged.connect(self._save)
-                wdg.unlinked.connect(self._save)
-                if str(ref_storyline.id) in refs.keys():
-                    wdg.setLink(refs[str(ref_storyline.id)])
-                self._grid.addWidget(wdg, i + 1, j + 1)
-
-        self._grid.addWidget(line(), 0, 1, 1, len(self._novel.plots), alignment=Qt.AlignmentFlag.AlignBottom)
-        self._grid.addWidget(vline(), 1, 0, len(self._novel.plots), 1, alignment=Qt.AlignmentFlag.AlignRight)
-        self._grid.addWidget(spacer(), 0, len(self._novel.plots) + 1)
-
-        self._grid.addWidget(vspacer(), len(self._novel.plots) + 1, 0)
+        for wdg in self._widgets():
+            self._removeWidget(wdg)
+        self._headers.clear()
+        self._diagonal.clear()
+        self._cells.clear()
+        self._storylines = list(self._novel.plots)
+
+        storylines = {x.id: x for x in self._storylines}
+        for storyline in self._storylines:
+            self._addHeaders(storyline)
+            for link in storyline.links:
+                target = storylines.get(link.target_id)
+                if target is not None and target is not storyline and (storyline, target) not in self._cells:
+                    self._addCell(storyline, target).setLink(link)
+
+        self._layoutMatrix()
+
+    def _addHeaders(self, storyline: Plot):
+        header = StorylineHeaderWidget(storyline)
+        row = StorylineHeaderWidget(storyline)
+        row.setMinimumHeight(70)
+        self._headers[storyline] = (header, row)
+        self._diagonal[storyline] = self._emptyCellWidget()
+
+    def _addCell(self, source: Plot, target: Plot) -> StorylinesConnectionWidget:
+        wdg = StorylinesConnectionWidget(source, target)
+        wdg.linked.connect(self._save)
+        wdg.linkChanged.connect(self._save)
+        wdg.unlinked.connect(self._save)
+        self._cells[(source, target)] = wdg
+        return wdg
+
+    def _layoutMatrix(self):
+        indexes = {x: i for i, x in enumerate(self._storylines)}
+        for storyline, (header, row) in self._headers.items():
+            i = indexes[storyline] + 1
+            self._place(header, 0, i, alignment=Qt.AlignmentFlag.AlignCenter)
+            self._place(row, i, 0, alignment=Qt.AlignmentFlag.AlignVCenter)
+            self._place(self._diagonal[storyline], i, i)
+        for (source, target), wdg in self._cells.items():
+            self._place(wdg, indexes[source] + 1, indexes[target] + 1)
+
+        size = len(self._storylines)
+        for i in range(size + 1, self._size + 2):
+            self._grid.setRowMinimumHeight(i, 0)
+            self._grid.setColumnMinimumWidth(i, 0)
+        for i in range(1, size + 1):
+            self._grid.setRowMinimumHeight(i, self.cellHeight)
+            self._grid.setColumnMinimumWidth(i, self.cellWidth)
+        self._size = size
+
+        self._place(self._line, 0, 1, 1, max(size, 1), alignment=Qt.AlignmentFlag.AlignBottom)
+        self._place(self._vline, 1, 0, max(size, 1), 1, alignment=Qt.AlignmentFlag.AlignRight)
+        self._place(self._spacer, 0, size + 1)
+        self._place(self._vspacer, size + 1, 0)
+
+    def _place(self, wdg: QWidget, row: int, col: int, rowSpan: int = 1, colSpan: int = 1,
+               alignment: Qt.AlignmentFlag = Qt.AlignmentFlag(0)):
+        index = self._grid.indexOf(wdg)
+        if index >= 0:
+            if self._grid.getItemPosition(index) == (row, col, rowSpan, colSpan):
+                return
+            self._grid.removeWidget(wdg)
+        self._grid.addWidget(wdg, row, col, rowSpan, colSpan, alignment)
+
+    def _removeWidget(self, wdg: QWidget):
+        self._grid.removeWidget(wdg)
+        wdg.deleteLater()
+
+    def _widgets(self) -> List[QWidget]:
+        widgets: List[QWidget] = list(self._cells.values())
+        widgets.extend(self._diagonal.values())
+        for header, row in self._headers.values():
+            widgets.extend([header, row])
+        return widgets
+
+    def _section(self, pos: int, vertical: bool) -> Optional[int]:
+        lo, hi = 0, len(self._storylines) - 1
+        while lo <= hi:
+            mid = (lo + hi) // 2
+            rect = self._grid.cellRect(mid + 1, 0) if vertical else self._grid.cellRect(0, mid + 1)
+            start, end = (rect.top(), rect.bottom()) if vertical else (rect.left(), rect.right())
+            if pos < start:
+                hi = mid - 1
+            elif pos > end:
+                lo = mid + 1
+            else:
+                return mid
+        return None
 
     def _emptyCellWidget(self) -> QWidget:
         wdg = IdleWidget()
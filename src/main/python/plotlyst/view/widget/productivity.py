@@ -17,7 +17,7 @@ GNU General Public License for more details.
 You should have received a copy of the GNU General Public License
 along with this program.  If not, see <https://www.gnu.org/licenses/>.
 """
-from datetime import datetime, timedelta
+from datetime import datetime, timedelta, date
 from typing import Optional
 
 import qtanim
@@ -30,10 +30,11 @@ from qthandy.filter import OpacityEventFilter
 from qtmenu import MenuWidget
 
 from plotlyst.common import PLOTLYST_SECONDARY_COLOR, RELAXED_WHITE_COLOR
-from plotlyst.core.domain import Novel, DailyProductivity, ProductivityType
+from plotlyst.core.domain import Novel, ProductivityType
 from plotlyst.env import app_env
 from plotlyst.resources import resource_registry
-from plotlyst.service.productivity import find_daily_productivity, set_daily_productivity
+from plotlyst.service.cache import progress_registry
+from plotlyst.service.productivity import set_daily_productivity
 from plotlyst.view.common import label, frame, ButtonPressResizeEventFilter, to_rgba_str
 from plotlyst.view.icons import IconRegistry
 from plotlyst.view.style.button import apply_button_palette_color
@@ -120,7 +121,7 @@ class DayCircleButton(QToolButton):
 
 
 class DaysDisplayWidget(QWidget):
-    def __init__(self, productivity: DailyProductivity, parent=None):
+    def __init__(self, novel: Novel, parent=None):
         super().__init__(parent)
         vbox(self, 0, 0)
         margins(self, top=40)
@@ -131,6 +132,7 @@ class DaysDisplayWidget(QWidget):
         hbox(self.wdgDays)
         self.wdgDays.layout().addWidget(spacer())
 
+        progress_registry.track(novel)
         weekday_number = datetime.today().weekday()
         for i, day in enumerate(['M', 'T', 'W', 'T', 'F', 'S', 'S']):
             btn = DayCircleButton(day)
@@ -140,9 +142,9 @@ class DaysDisplayWidget(QWidget):
 
             if i <= weekday_number:
                 days_ago = weekday_number - i
-                past_date = (datetime.today() - timedelta(days=days_ago)).strftime('%Y-%m-%d')
+                past_date = (datetime.today() - timedelta(days=days_ago)).date()
 
-                category = find_daily_productivity(productivity, past_date)
+                category = progress_registry.productivity(past_date)
                 if category:
                     btn.setCategory(category)
                 if i < weekday_number:
@@ -176,7 +178,8 @@ class ProductivityTrackingWidget(QFrame):
         self.btnGroup = QButtonGroup()
         self.btnGroup.buttonClicked.connect(self._categorySelected)
 
-        today_category = find_daily_productivity(self.novel.productivity)
+        progress_registry.track(self.novel)
+        today_category = progress_registry.productivity(date.today())
         for category in self.novel.productivity.categories:
             btn = ProductivityTypeButton(category)
             self.btnGroup.addButton(btn)
@@ -187,7 +190,7 @@ class ProductivityTrackingWidget(QFrame):
         self.lblAnimation = QLabel(self)
         self.lblAnimation.setHidden(True)
 
-        self.wdgDays = DaysDisplayWidget(self.novel.productivity)
+        self.wdgDays = DaysDisplayWidget(self.novel)
 
         title = icon_text('mdi6.progress-star-four-points', 'Daily productivity tracker')
         incr_font(title, 3)
@@ -265,7 +268,8 @@ class ProductivityButton(QWidget):
         self._popup()
 
     def _updateStreak(self):
-        self.streak.setText(str(len(self._novel.productivity.progress.keys())))
+        progress_registry.track(self._novel)
+        self.streak.setText(str(progress_registry.productivity_streak()))
 
     def _popup(self):
         self._menu.clear()
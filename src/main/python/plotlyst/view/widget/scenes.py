@@ -672,6 +672,9 @@ class ScenesDistributionWidget(QWidget, Ui_CharactersScenesDistributionWidget, E
     def resetActsFilter(self):
         self._scenes_proxy.resetActsFilter()
 
+    def refreshActsFilter(self):
+        self._scenes_proxy.refreshActsFilter()
+
     def _toggle_characters(self, toggled: bool):
         if toggled:
             self._model = CharactersScenesDistributionTableModel(self.novel)
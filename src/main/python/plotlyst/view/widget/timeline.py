@@ -23,19 +23,21 @@ from functools import partial
 from typing import List, Optional
 
 from PyQt6.QtCore import pyqtSignal, Qt, QSize, QObject, QEvent
-from PyQt6.QtGui import QIcon, QColor, QPainter, QPaintEvent, QBrush, QResizeEvent
+from PyQt6.QtGui import QIcon, QColor, QPainter, QPaintEvent, QBrush, QResizeEvent, QShowEvent
 from PyQt6.QtWidgets import QWidget, QSizePolicy, \
     QLineEdit, QToolButton
 from overrides import overrides
 from qthandy import vbox, hbox, sp, vspacer, clear_layout, spacer, incr_font, bold, \
-    margins
+    margins, gc
 from qthandy.filter import VisibilityToggleEventFilter
 
 from plotlyst.common import RELAXED_WHITE_COLOR, NEUTRAL_EMOTION_COLOR, \
     EMOTION_COLORS, PLOTLYST_SECONDARY_COLOR
 from plotlyst.core.domain import BackstoryEvent
-from plotlyst.view.common import tool_btn, frame
+from plotlyst.view.common import tool_btn, frame, LazyPopulator
 from plotlyst.view.icons import IconRegistry
+from plotlyst.view.style.base import apply_property
+from plotlyst.view.style.widget import BACKSTORY_CARD_BG_COLOR
 from plotlyst.view.widget.confirm import confirmed
 from plotlyst.view.widget.input import RemovalButton, AutoAdjustableTextEdit
 
@@ -43,7 +45,7 @@ from plotlyst.view.widget.input import RemovalButton, AutoAdjustableTextEdit
 @dataclass
 class TimelineTheme:
     timeline_color: str = PLOTLYST_SECONDARY_COLOR
-    card_bg_color: str = '#ffe8d6'
+    card_bg_color: str = BACKSTORY_CARD_BG_COLOR
 
 
 class BackstoryCard(QWidget):
@@ -66,6 +68,7 @@ class BackstoryCard(QWidget):
         margins(self.cardFrame, left=5, bottom=15)
 
         self.btnType = tool_btn(QIcon(), parent=self)
+        self.btnType.setObjectName('btnBackstoryType')
         self.btnType.setIconSize(QSize(24, 24))
 
         self.btnRemove = RemovalButton()
@@ -113,27 +116,9 @@ class BackstoryCard(QWidget):
         self.textSummary.setPlainText(self.backstory.synopsis)
 
     def _refreshStyle(self):
+        apply_property(self.cardFrame, 'emotion', self.backstory.emotion)
+        apply_property(self.btnType, 'emotion', self.backstory.emotion)
         frame_color = EMOTION_COLORS.get(self.backstory.emotion, NEUTRAL_EMOTION_COLOR)
-        self.cardFrame.setStyleSheet(f'''
-                            #cardFrame {{
-                                border-top: 8px solid {frame_color};
-                                border-bottom-left-radius: 12px;
-                                border-bottom-right-radius: 12px;
-                                background-color: {self._theme.card_bg_color};
-                                }}
-                            ''')
-        self.btnType.setStyleSheet(
-            f'''
-                    QToolButton {{
-                            background-color: {RELAXED_WHITE_COLOR}; border: 3px solid {frame_color};
-                            border-radius: 18px;
-                            padding: 4px;
-                        }}
-                    QToolButton:hover {{
-                        padding: 2px;
-                    }}
-                    ''')
-
         self.btnType.setIcon(IconRegistry.from_name(self.backstory.type_icon, frame_color))
 
     def _synopsisChanged(self):
@@ -157,46 +142,67 @@ class BackstoryCard(QWidget):
 
 
 class BackstoryCardPlaceholder(QWidget):
-    def __init__(self, card: BackstoryCard, alignment: int = Qt.AlignmentFlag.AlignRight, parent=None,
+    PlaceholderHeight: int = 120
+
+    def __init__(self, backstory: BackstoryEvent, alignment: int = Qt.AlignmentFlag.AlignRight, parent=None,
                  compact: bool = True):
         super().__init__(parent)
+        self.backstory = backstory
         self.alignment = alignment
-        self.card = card
+        self.card: Optional[BackstoryCard] = None
+        self._compact = compact
 
         self._layout = hbox(self, 0, 3)
         self.spacer = spacer()
         self.spacer.setFixedWidth(self.width() // 2 + 3)
-        if self.alignment == Qt.AlignmentFlag.AlignRight:
-            self.layout().addWidget(self.spacer)
-            if compact:
-                self._layout.addWidget(self.card, alignment=Qt.AlignmentFlag.AlignLeft)
-            else:
-                self._layout.addWidget(self.card)
-        elif self.alignment == Qt.AlignmentFlag.AlignLeft:
-            if compact:
-                self._layout.addWidget(self.card, alignment=Qt.AlignmentFlag.AlignRight)
-            else:
-                self._layout.addWidget(self.card)
-            self.layout().addWidget(self.spacer)
-        else:
-            self.layout().addWidget(self.card)
+        self.setMinimumHeight(self.PlaceholderHeight)
+        self._arrange()
+
+    def isPopulated(self) -> bool:
+        return self.card is not None
+
+    def setCard(self, card: BackstoryCard):
+        self.card = card
+        self.setMinimumHeight(0)
+        self._arrange()
+
+    def setAlignment(self, alignment: int):
+        if alignment == self.alignment:
+            return
+        self.alignment = alignment
+        self._arrange()
 
     def toggleAlignment(self):
         if self.alignment == Qt.AlignmentFlag.AlignLeft:
-            self.alignment = Qt.AlignmentFlag.AlignRight
+            self.setAlignment(Qt.AlignmentFlag.AlignRight)
+        else:
+            self.setAlignment(Qt.AlignmentFlag.AlignLeft)
+
+    def _arrange(self):
+        while self._layout.count():
             self._layout.takeAt(0)
+
+        if self.alignment == Qt.AlignmentFlag.AlignRight:
+            self._layout.addWidget(self.spacer)
+            self._addCard(Qt.AlignmentFlag.AlignLeft)
+        elif self.alignment == Qt.AlignmentFlag.AlignLeft:
+            self._addCard(Qt.AlignmentFlag.AlignRight)
             self._layout.addWidget(self.spacer)
-            self._layout.setAlignment(self.card, Qt.AlignmentFlag.AlignRight)
         else:
-            self.alignment = Qt.AlignmentFlag.AlignLeft
-            self._layout.takeAt(1)
-            self._layout.insertWidget(0, self.spacer)
-            self._layout.setAlignment(self.card, Qt.AlignmentFlag.AlignLeft)
+            self._addCard()
+
+    def _addCard(self, alignment: Optional[int] = None):
+        if self.card is None:
+            return
+        if self._compact and alignment is not None:
+            self._layout.addWidget(self.card, alignment=alignment)
+        else:
+            self._layout.addWidget(self.card)
 
 
 class _ControlButtons(QWidget):
 
-    def __init__(self, theme: TimelineTheme, parent=None):
+    def __init__(self, parent=None):
         super().__init__(parent)
         vbox(self)
 
@@ -209,11 +215,7 @@ class _ControlButtons(QWidget):
         self.btnPlus.setHidden(True)
 
         for btn in [self.btnPlaceholderCircle, self.btnPlus]:
-            btn.setStyleSheet(f'''
-                QToolButton {{ background-color: {theme.timeline_color}; border: 1px;
-                        border-radius: 13px; padding: 2px;}}
-                QToolButton:pressed {{background-color: grey;}}
-            ''')
+            btn.setProperty('timeline-control', True)
 
         self.installEventFilter(self)
 
@@ -230,24 +232,51 @@ class _ControlButtons(QWidget):
 
 
 class TimelineWidget(QWidget):
+    """Displays backstory events as cards alternating around a vertical line.
+
+    Every event gets a lightweight placeholder, and its card is only created once the placeholder is scrolled near the
+    visible area of the enclosing scroll area. Adding, removing or re-linking an event updates only the affected rows
+    and alignments instead of rebuilding the timeline.
+    """
     changed = pyqtSignal()
 
     def __init__(self, theme: Optional[TimelineTheme] = None, parent=None, compact: bool = True):
-        self._spacers: List[QWidget] = []
+        self._placeholders: List[BackstoryCardPlaceholder] = []
+        self._controls: List[_ControlButtons] = []
         super().__init__(parent)
         if theme is None:
             theme = TimelineTheme()
         self._theme = theme
         self._compact = compact
         self._layout = vbox(self, spacing=0)
+        self.setStyleSheet(f'''
+            QToolButton[timeline-control=true] {{
+                background-color: {theme.timeline_color}; border: 1px;
+                border-radius: 13px; padding: 2px;
+            }}
+            QToolButton[timeline-control=true]:pressed {{
+                background-color: grey;
+            }}
+            BackstoryCard #cardFrame {{
+                background-color: {theme.card_bg_color};
+            }}
+        ''')
         self.setSizePolicy(QSizePolicy.Policy.Expanding, QSizePolicy.Policy.Expanding)
         self._lineTopMargin: int = 0
         self._endSpacerMinHeight: int = 45
 
+        self._populator = LazyPopulator(self, self._unpopulated, self._populate, margin=300)
+
     @overrides
     def resizeEvent(self, event: QResizeEvent) -> None:
-        for sp in self._spacers:
-            sp.setFixedWidth(self.width() // 2 + 3)
+        for placeholder in self._placeholders:
+            placeholder.spacer.setFixedWidth(self.width() // 2 + 3)
+        self._populator.schedule()
+
+    @overrides
+    def showEvent(self, event: QShowEvent) -> None:
+        super().showEvent(event)
+        self._populator.schedule()
 
     @abstractmethod
     def events(self) -> List[BackstoryEvent]:
@@ -257,39 +286,30 @@ class TimelineWidget(QWidget):
         return BackstoryCard
 
     def refresh(self):
-        self._spacers.clear()
+        self._placeholders.clear()
+        self._controls.clear()
         clear_layout(self.layout())
 
-        prev_alignment = None
-        for i, backstory in enumerate(self.events()):
-            if prev_alignment is None:
-                alignment = Qt.AlignmentFlag.AlignRight
-            elif backstory.follow_up and prev_alignment:
-                alignment = prev_alignment
-            elif prev_alignment == Qt.AlignmentFlag.AlignLeft:
-                alignment = Qt.AlignmentFlag.AlignRight
-            else:
-                alignment = Qt.AlignmentFlag.AlignLeft
-            prev_alignment = alignment
-            event = BackstoryCardPlaceholder(self.cardClass()(backstory, self._theme), alignment, parent=self,
-                                             compact=self._compact)
-            event.card.deleteRequested.connect(self._remove)
+        events = self.events()
+        for backstory, alignment in zip(events, self._alignments(events)):
+            control = self._newControlButtons()
+            self._controls.append(control)
+            self._layout.addWidget(control, alignment=Qt.AlignmentFlag.AlignHCenter)
 
-            self._spacers.append(event.spacer)
-            event.spacer.setFixedWidth(self.width() // 2 + 3)
+            placeholder = self._newPlaceholder(backstory, alignment)
+            self._placeholders.append(placeholder)
+            self._layout.addWidget(placeholder)
 
-            self._addControlButtons(i)
-            self._layout.addWidget(event)
-
-            event.card.edited.connect(self.changed.emit)
-            event.card.relationChanged.connect(self.changed.emit)
-            event.card.relationChanged.connect(self.refresh)
+        control = self._newControlButtons()
+        self._controls.append(control)
+        self._layout.addWidget(control, alignment=Qt.AlignmentFlag.AlignHCenter)
 
-        self._addControlButtons(-1)
         spacer_ = vspacer()
         spacer_.setMinimumHeight(self._endSpacerMinHeight)
         self.layout().addWidget(spacer_)
 
+        self._populator.schedule()
+
     @overrides
     def paintEvent(self, event: QPaintEvent) -> None:
         painter = QPainter(self)
@@ -301,20 +321,81 @@ class TimelineWidget(QWidget):
 
     def add(self, pos: int = -1):
         backstory = BackstoryEvent('', '', type_color=NEUTRAL_EMOTION_COLOR)
-        if pos >= 0:
-            self.events().insert(pos, backstory)
-        else:
-            self.events().append(backstory)
-        self.refresh()
+        events = self.events()
+        if pos < 0 or pos > len(events):
+            pos = len(events)
+        events.insert(pos, backstory)
+
+        anchor = self._layout.indexOf(self._controls[pos])
+        placeholder = self._newPlaceholder(backstory, Qt.AlignmentFlag.AlignRight)
+        control = self._newControlButtons()
+        self._layout.insertWidget(anchor, placeholder)
+        self._layout.insertWidget(anchor, control, alignment=Qt.AlignmentFlag.AlignHCenter)
+        self._placeholders.insert(pos, placeholder)
+        self._controls.insert(pos, control)
+
+        self._populate(placeholder)
+        self._updateAlignments()
         self.changed.emit()
 
     def _remove(self, card: BackstoryCard):
-        self.events().remove(card.backstory)
+        i = next(i for i, placeholder in enumerate(self._placeholders) if placeholder.card is card)
+        self.events().pop(i)
+
+        for wdg in [self._placeholders.pop(i), self._controls.pop(i)]:
+            self._layout.removeWidget(wdg)
+            gc(wdg)
 
-        self.refresh()
+        self._updateAlignments()
         self.changed.emit()
 
-    def _addControlButtons(self, pos: int):
-        control = _ControlButtons(self._theme, self)
-        control.btnPlus.clicked.connect(partial(self.add, pos))
-        self._layout.addWidget(control, alignment=Qt.AlignmentFlag.AlignHCenter)
+    def _relationChanged(self):
+        self._updateAlignments()
+        self.changed.emit()
+
+    def _updateAlignments(self):
+        for placeholder, alignment in zip(self._placeholders, self._alignments(self.events())):
+            placeholder.setAlignment(alignment)
+
+    @staticmethod
+    def _alignments(events: List[BackstoryEvent]) -> List[int]:
+        alignments = []
+        prev_alignment = None
+        for backstory in events:
+            if prev_alignment is None:
+                alignment = Qt.AlignmentFlag.AlignRight
+            elif backstory.follow_up and prev_alignment:
+                alignment = prev_alignment
+            elif prev_alignment == Qt.AlignmentFlag.AlignLeft:
+                alignment = Qt.AlignmentFlag.AlignRight
+            else:
+                alignment = Qt.AlignmentFlag.AlignLeft
+            prev_alignment = alignment
+            alignments.append(alignment)
+
+        return alignments
+
+    def _newPlaceholder(self, backstory: BackstoryEvent, alignment: int) -> BackstoryCardPlaceholder:
+        placeholder = BackstoryCardPlaceholder(backstory, alignment, parent=self, compact=self._compact)
+        placeholder.spacer.setFixedWidth(self.width() // 2 + 3)
+        return placeholder
+
+    def _newControlButtons(self) -> _ControlButtons:
+        control = _ControlButtons(self)
+        control.btnPlus.clicked.connect(partial(self._addAt, control))
+        return control
+
+    def _addAt(self, control: _ControlButtons):
+        self.add(self._controls.index(control))
+
+    def _unpopulated(self) -> List[BackstoryCardPlaceholder]:
+        if not self.isVisible():
+            return []
+        return [x for x in self._placeholders if not x.isPopulated()]
+
+    def _populate(self, placeholder: BackstoryCardPlaceholder):
+        card = self.cardClass()(placeholder.backstory, self._theme)
+        card.deleteRequested.connect(self._remove)
+        card.edited.connect(self.changed.emit)
+        card.relationChanged.connect(self._relationChanged)
+        placeholder.setCard(card)
@@ -20,11 +20,12 @@ along with this program.  If not, see <https://www.gnu.org/licenses/>.
 from abc import abstractmethod
 from dataclasses import dataclass
 from functools import partial
-from typing import Optional, List, Dict, Any, Set
+from typing import Optional, List, Dict, Any, Set, Tuple
 
-from PyQt6.QtCore import Qt, pyqtSignal, QObject, QEvent, QSize, QPointF, QMimeData
-from PyQt6.QtGui import QIcon, QResizeEvent
-from PyQt6.QtWidgets import QScrollArea, QFrame, QSizePolicy, QToolButton, QDialog
+from PyQt6.QtCore import Qt, pyqtSignal, QObject, QEvent, QSize, QPointF, QMimeData, QModelIndex, QRect, QPoint
+from PyQt6.QtGui import QIcon, QResizeEvent, QPainter, QMouseEvent, QContextMenuEvent
+from PyQt6.QtWidgets import QScrollArea, QFrame, QSizePolicy, QToolButton, QDialog, QTreeView, QStyledItemDelegate, \
+    QStyleOptionViewItem, QStyle, QAbstractItemView
 from PyQt6.QtWidgets import QWidget, QLabel
 from overrides import overrides
 from qthandy import vbox, hbox, bold, margins, clear_layout, transparent, retain_when_hidden, incr_font, pointy, \
@@ -379,6 +380,157 @@ class TreeView(QScrollArea):
         return self._centralWidget
 
 
+class TreeItemDelegate(QStyledItemDelegate):
+    iconSize: int = 20
+    rowHeight: int = 28
+
+    def __init__(self, view: 'ItemModelTreeView'):
+        super().__init__(view)
+        self._view = view
+
+    @overrides
+    def initStyleOption(self, option: QStyleOptionViewItem, index: QModelIndex):
+        super().initStyleOption(option, index)
+        selected = bool(option.state & QStyle.StateFlag.State_Selected)
+        icon = self._view.nodeIcon(index, selected)
+        if icon is not None:
+            option.icon = icon
+            option.features |= QStyleOptionViewItem.ViewItemFeature.HasDecoration
+            option.decorationSize = QSize(self.iconSize, self.iconSize)
+        font = option.font
+        font.setBold(selected)
+        if self._view.settings().font_incr and font.pointSize() > 0:
+            font.setPointSize(font.pointSize() + self._view.settings().font_incr)
+        option.font = font
+
+    @overrides
+    def paint(self, painter: QPainter, option: QStyleOptionViewItem, index: QModelIndex):
+        super().paint(painter, option, index)
+        if option.state & QStyle.StateFlag.State_MouseOver and option.state & QStyle.StateFlag.State_Enabled:
+            for rect, icon in self._view.actionButtons(index, option.rect):
+                icon.paint(painter, rect)
+
+    @overrides
+    def sizeHint(self, option: QStyleOptionViewItem, index: QModelIndex) -> QSize:
+        size = super().sizeHint(option, index)
+        size.setHeight(max(size.height(), self.rowHeight))
+        return size
+
+
+class ItemModelTreeView(QTreeView):
+    """Model-based counterpart of TreeView.
+
+    Nodes are rows of an item model painted by a delegate, so only the visible rows cost anything.
+    Subclasses decide about the icon and the per-node menus; the hover buttons of ContainerNode
+    are painted on the hovered row and request the same menus."""
+    menuRequested = pyqtSignal(QModelIndex, QPoint)
+    plusRequested = pyqtSignal(QModelIndex, QPoint)
+
+    def __init__(self, parent=None, settings: Optional[TreeSettings] = None):
+        super().__init__(parent)
+        self._settings = settings if settings else TreeSettings()
+        self._readOnly: bool = False
+
+        self.setHeaderHidden(True)
+        self.setRootIsDecorated(False)
+        self.setItemsExpandable(False)
+        self.setUniformRowHeights(True)
+        self.setIndentation(20)
+        self.setMouseTracking(True)
+        self.setFrameShape(QFrame.Shape.NoFrame)
+        self.setHorizontalScrollBarPolicy(Qt.ScrollBarPolicy.ScrollBarAlwaysOff)
+        self.setSelectionMode(QAbstractItemView.SelectionMode.SingleSelection)
+        self.setEditTriggers(QAbstractItemView.EditTrigger.NoEditTriggers)
+        self.setItemDelegate(TreeItemDelegate(self))
+        self._applySettings()
+
+    def centralWidget(self) -> QWidget:
+        return self.viewport()
+
+    def settings(self) -> TreeSettings:
+        return self._settings
+
+    def setSettings(self, settings: TreeSettings):
+        self._settings = settings
+        self._applySettings()
+
+    def isReadOnly(self) -> bool:
+        return self._readOnly
+
+    def setReadOnly(self, readOnly: bool):
+        self._readOnly = readOnly
+        if readOnly:
+            self.setDragDropMode(QAbstractItemView.DragDropMode.NoDragDrop)
+        else:
+            self.setDragDropMode(QAbstractItemView.DragDropMode.InternalMove)
+            self.setDefaultDropAction(Qt.DropAction.MoveAction)
+            self.setDropIndicatorShown(True)
+
+    def nodeIcon(self, index: QModelIndex, selected: bool) -> Optional[QIcon]:
+        return None
+
+    def hasMenu(self, index: QModelIndex) -> bool:
+        return False
+
+    def hasPlusMenu(self, index: QModelIndex) -> bool:
+        return False
+
+    def actionButtons(self, index: QModelIndex, rect: QRect) -> List[Tuple[QRect, QIcon]]:
+        if self._readOnly:
+            return []
+        buttons = []
+        right = rect.right() - 20
+        top = rect.top() + (rect.height() - 20) // 2
+        if self.hasPlusMenu(index):
+            buttons.append((QRect(right, top, 20, 20), IconRegistry.plus_icon(self._settings.action_buttons_color)))
+            right -= 20
+        if self.hasMenu(index):
+            buttons.append(
+                (QRect(right, top, 20, 20), IconRegistry.dots_icon(self._settings.action_buttons_color, vertical=True)))
+        return buttons
+
+    @overrides
+    def mousePressEvent(self, event: QMouseEvent) -> None:
+        index = self.indexAt(event.pos())
+        if index.isValid() and event.button() == Qt.MouseButton.LeftButton:
+            buttons = self.actionButtons(index, self.visualRect(index))
+            for i, (rect, _) in enumerate(buttons):
+                if rect.contains(event.pos()):
+                    pos = self.viewport().mapToGlobal(rect.bottomLeft())
+                    if i == 0 and self.hasPlusMenu(index):
+                        self.plusRequested.emit(index, pos)
+                    else:
+                        self.menuRequested.emit(index, pos)
+                    return
+        super().mousePressEvent(event)
+
+    @overrides
+    def contextMenuEvent(self, event: QContextMenuEvent) -> None:
+        index = self.indexAt(event.pos())
+        if index.isValid() and not self._readOnly and self.hasMenu(index):
+            self.menuRequested.emit(index, event.globalPos())
+
+    def _applySettings(self):
+        bg = self._settings.bg_color if self._settings.bg_color else 'rgb(244, 244, 244)'
+        text = self._settings.selection_text_color if self._settings.selection_text_color else 'black'
+        self.setStyleSheet(f'''
+            QTreeView {{
+                background-color: {bg};
+                border: 0px;
+            }}
+            QTreeView::branch {{
+                background-color: {bg};
+            }}
+            QTreeView::item:hover:!selected {{
+                background-color: {self._settings.hover_bg_color};
+            }}
+            QTreeView::item:selected {{
+                background-color: {self._settings.selection_bg_color};
+                color: {text};
+            }}
+        ''')
+
+
 class ItemBasedNode(ContainerNode):
 
     @abstractmethod